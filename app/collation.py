@@ -0,0 +1,75 @@
+"""
+Text functions and collations registered on every database connection.
+
+SQLite's ``LOWER``, ``NOCASE`` and the default ``BINARY`` ordering only
+know ASCII: Cyrillic names sort by code point (``ё`` after ``я``) and
+compare case-sensitively. The connection gets instead:
+
+- ``casefold(text)``: Unicode case folding, for case-insensitive filters
+  through an expression index on ``casefold(name)``
+- ``COLLATE RU``: Russian alphabetical order, case-insensitive, ``ё`` sorted
+  with ``е``
+- ``COLLATE NATSORT``: digit runs compared as numbers, so bort ``2`` comes
+  before ``10``
+
+Indexes use them, so a database file with these indexes can only be
+written by a connection that registered them (not the plain sqlite3 shell).
+"""
+import re
+from collections.abc import Callable
+from functools import lru_cache
+from typing import Any
+
+CASEFOLD = "casefold"
+RUSSIAN = "RU"
+NATURAL = "NATSORT"
+
+# Sort keys remembered per collation
+COLLATION_CACHE_SIZE = 65536
+
+_DIGITS = re.compile(r"(\d+)")
+
+
+def casefold(value: str | None) -> str | None:
+    """Fold case of text for caseless comparison."""
+    return None if value is None else value.casefold()
+
+
+def russian_key(value: str) -> tuple[str, str]:
+    """Sort key in Russian alphabetical order; ties are broken by the exact text."""
+    folded = value.casefold()
+    return folded.replace("ё", "е"), value
+
+
+def natural_key(value: str) -> tuple[tuple[int, int, str], ...]:
+    """Sort key comparing digit runs as numbers and the rest as Russian text."""
+    return tuple(
+        (0, int(part), part) if part.isdigit() else (1, 0, russian_key(part)[0])
+        for part in _DIGITS.split(value)
+        if part
+    ) + ((-1, 0, value),)
+
+
+def _compare(key: Callable[[str], Any]) -> Callable[[str, str], int]:
+    """Make an SQLite collation (returning -1, 0, 1) from a sort key."""
+    # A sort or index build compares every value many times
+    key = lru_cache(maxsize=COLLATION_CACHE_SIZE)(key)
+
+    def collation(left: str, right: str) -> int:
+        left_key, right_key = key(left), key(right)
+        return (left_key > right_key) - (left_key < right_key)
+
+    return collation
+
+
+def prefix_range(prefix: str) -> tuple[str, str]:
+    """Get bounds [low, high) of casefolded text starting with prefix."""
+    low = prefix.casefold()
+    return low, low[:-1] + chr(ord(low[-1]) + 1)
+
+
+def register_text_functions(database: Any) -> None:
+    """Register casefold and the collations; applied to every new connection."""
+    database.register_function(casefold, CASEFOLD, 1, deterministic=True)
+    database.register_collation(_compare(russian_key), RUSSIAN)
+    database.register_collation(_compare(natural_key), NATURAL)
@@ -11,6 +11,29 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 DATABASE_PATH = os.getenv("IAS_DATABASE_PATH", str(BASE_DIR / "data" / "database.db"))
 DATABASE_NAME = DATABASE_PATH
 
+# Database connection profile, applied as PRAGMAs on every new connection.
+# The database is shared by several workstations over a network directory,
+# where WAL (shared-memory index) and mmap are unsupported and risk
+# corruption, so the defaults use the rollback journal without mmap. WAL and
+# mmap are opt-in for a database on a local disk:
+#   IAS_DB_JOURNAL_MODE=wal IAS_DB_SYNCHRONOUS=normal IAS_DB_MMAP_SIZE=268435456
+DATABASE_JOURNAL_MODE = os.getenv("IAS_DB_JOURNAL_MODE", "delete")
+DATABASE_PRAGMAS: dict[str, str | int] = {
+    "foreign_keys": 1,
+    "journal_mode": DATABASE_JOURNAL_MODE,
+    "synchronous": os.getenv("IAS_DB_SYNCHRONOUS", "normal" if DATABASE_JOURNAL_MODE == "wal" else "full"),
+    "cache_size": int(os.getenv("IAS_DB_CACHE_SIZE", "-65536")),  # negative: KiB
+    "mmap_size": int(os.getenv("IAS_DB_MMAP_SIZE", "0")),
+    "temp_store": os.getenv("IAS_DB_TEMP_STORE", "memory"),
+    "busy_timeout": int(os.getenv("IAS_DB_BUSY_TIMEOUT", "1000")),  # ms
+}
+
+# Retries after SQLITE_BUSY outlasting busy_timeout. Each attempt waits up
+# to busy_timeout on the calling (often GUI) thread, so the worst case is
+# about (retries + 1) * busy_timeout.
+DATABASE_BUSY_RETRIES = int(os.getenv("IAS_DB_BUSY_RETRIES", "2"))
+DATABASE_BUSY_BACKOFF = 0.05  # seconds, doubled on each retry
+
 # Application settings
 APP_NAME = "IAS - Inspection/Failures App"
 APP_VERSION = "0.1.0"
@@ -1,28 +1,282 @@
 """
 Database connection and migration utilities.
 """
-from peewee import SqliteDatabase
-from peewee_migrate import Router
+import re
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TypeVar
 
-from app.config import DATABASE_NAME, MIGRATIONS_DIR
+from peewee import OperationalError, SqliteDatabase
 
+from app.collation import register_text_functions
+from app.config import (
+    DATABASE_BUSY_BACKOFF,
+    DATABASE_BUSY_RETRIES,
+    DATABASE_NAME,
+    DATABASE_PRAGMAS,
+    MIGRATIONS_DIR,
+)
 
-def get_database() -> SqliteDatabase:
-    """Get database instance with foreign keys enabled."""
-    return SqliteDatabase(DATABASE_NAME, pragmas={"foreign_keys": 1})
+if TYPE_CHECKING:
+    from peewee_migrate import Router
 
+T = TypeVar("T")
 
-def get_router(database: SqliteDatabase | None = None) -> Router:
+
+def is_busy_error(exc: Exception) -> bool:
+    """Check if exception is SQLITE_BUSY / SQLITE_LOCKED."""
+    message = str(exc).lower()
+    return isinstance(exc, OperationalError) and ("locked" in message or "busy" in message)
+
+
+_LITERAL = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"IN \(\?(?:, \?)*\)")
+
+
+def normalize_sql(sql: str) -> str:
+    """Reduce a statement to its shape: literals become ? and IN lists IN (...)."""
+    sql = _LITERAL.sub("?", sql)
+    sql = _IN_LIST.sub("IN (...)", sql)
+    return " ".join(sql.split())
+
+
+@dataclass
+class QueryGroup:
+    """Statistics of statements with the same normalized SQL."""
+
+    sql: str
+    count: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+    # Most executions of one identical statement (same SQL and params)
+    max_identical: int = 0
+
+
+class QueryRecorder:
+    """Counts and times statements executed on a database while attached.
+
+    Statements are grouped by normalized SQL. A statement executed again
+    with the same params during one recording is the N+1 signature and is
+    reported by ``repeated``. Time covers executing a statement, not
+    fetching the rest of its rows. Statements of worker threads are
+    recorded too.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.clear()
+
+    def clear(self) -> None:
+        """Drop recorded statements."""
+        with self._lock:
+            self.count = 0
+            self.total_time = 0.0
+            self.max_time = 0.0
+            self.groups: dict[str, QueryGroup] = {}
+            self._identical: Counter[tuple[str, str]] = Counter()
+
+    def record(self, sql: str, params: Any, elapsed: float) -> None:
+        """Add an executed statement."""
+        with self._lock:
+            self.count += 1
+            self.total_time += elapsed
+            self.max_time = max(self.max_time, elapsed)
+            shape = normalize_sql(sql)
+            group = self.groups.get(shape)
+            if group is None:
+                group = self.groups[shape] = QueryGroup(shape)
+            group.count += 1
+            group.total_time += elapsed
+            group.max_time = max(group.max_time, elapsed)
+            key = (sql, repr(params))
+            self._identical[key] += 1
+            group.max_identical = max(group.max_identical, self._identical[key])
+
+    def repeated(self) -> list[QueryGroup]:
+        """Get groups with an identical statement executed more than once."""
+        return [group for group in self.groups.values() if group.max_identical > 1]
+
+    def report(self) -> str:
+        """Describe recorded statements, most frequent first."""
+        lines = [f"{self.count} statements, {self.total_time * 1000:.1f} ms total, {self.max_time * 1000:.1f} ms max"]
+        for group in sorted(self.groups.values(), key=lambda group: -group.count):
+            flag = f" [repeated x{group.max_identical}]" if group.max_identical > 1 else ""
+            lines.append(f"{group.count:5d}  {group.total_time * 1000:8.1f} ms  {group.sql}{flag}")
+        return "\n".join(lines)
+
+
+class IASDatabase(SqliteDatabase):
+    """SQLite database retrying statements that fail with SQLITE_BUSY.
+
+    ``busy_timeout`` already makes SQLite wait for locks; the retry covers
+    the cases where SQLite gives up immediately (e.g. a reader upgrading to
+    a writer). Statements inside a transaction are never retried on their
+    own - use ``run_in_transaction`` to retry a whole transaction.
+
+    Every connection gets the Cyrillic-aware ``casefold`` function and the
+    ``RU`` and ``NATSORT`` collations (see ``app.collation``).
+    """
+
+    def __init__(
+        self,
+        database: str,
+        busy_retries: int = DATABASE_BUSY_RETRIES,
+        busy_backoff: float = DATABASE_BUSY_BACKOFF,
+        **kwargs: Any,
+    ) -> None:
+        self.busy_retries = busy_retries
+        self.busy_backoff = busy_backoff
+        self.recorders: list[QueryRecorder] = []
+        super().__init__(database, **kwargs)
+        register_text_functions(self)
+
+    def execute_sql(self, sql: str, params: Any = None, *args: Any, **kwargs: Any) -> Any:
+        """Execute statement, timing it for attached query recorders."""
+        if not self.recorders:
+            return self._execute_retrying(sql, params, *args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return self._execute_retrying(sql, params, *args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            for recorder in tuple(self.recorders):
+                recorder.record(sql, params, elapsed)
+
+    def _execute_retrying(self, sql: str, params: Any = None, *args: Any, **kwargs: Any) -> Any:
+        """Execute statement, retrying with backoff on SQLITE_BUSY in autocommit mode."""
+        attempt = 0
+        while True:
+            try:
+                return super().execute_sql(sql, params, *args, **kwargs)
+            except OperationalError as exc:
+                if self.in_transaction() or attempt >= self.busy_retries or not is_busy_error(exc):
+                    raise
+                time.sleep(self.busy_backoff * 2 ** attempt)
+                attempt += 1
+
+    def run_in_transaction(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run func inside one transaction, retrying the whole transaction on SQLITE_BUSY."""
+        attempt = 0
+        while True:
+            try:
+                with self.atomic():
+                    return func(*args, **kwargs)
+            except OperationalError as exc:
+                if self.in_transaction() or attempt >= self.busy_retries or not is_busy_error(exc):
+                    raise
+                time.sleep(self.busy_backoff * 2 ** attempt)
+                attempt += 1
+
+
+@contextmanager
+def record_queries(database: IASDatabase | None = None) -> Iterator[QueryRecorder]:
+    """Record statements executed on the database inside the block."""
+    database = database or get_database()
+    recorder = QueryRecorder()
+    database.recorders.append(recorder)
+    try:
+        yield recorder
+    finally:
+        database.recorders.remove(recorder)
+
+
+_database: IASDatabase | None = None
+
+
+def get_database() -> IASDatabase:
+    """Get the shared application database instance."""
+    global _database
+    if _database is None:
+        _database = IASDatabase(DATABASE_NAME, pragmas=list(DATABASE_PRAGMAS.items()))
+    return _database
+
+
+_PRAGMA_NAMES = {
+    "synchronous": {0: "off", 1: "normal", 2: "full", 3: "extra"},
+    "temp_store": {0: "default", 1: "file", 2: "memory"},
+}
+
+
+def check_connection(database: SqliteDatabase | None = None) -> dict[str, Any]:
+    """Read effective connection PRAGMAs (startup self-check)."""
+    database = database or get_database()
+    effective = {}
+    for name in DATABASE_PRAGMAS:
+        value = database.execute_sql(f"PRAGMA {name}").fetchone()[0]
+        effective[name] = _PRAGMA_NAMES.get(name, {}).get(value, value)
+    return effective
+
+
+def connection_mismatches(effective: dict[str, Any]) -> dict[str, tuple[Any, Any]]:
+    """Get PRAGMAs whose effective value differs from the profile as name -> (configured, effective)."""
+    return {
+        name: (DATABASE_PRAGMAS[name], value)
+        for name, value in effective.items()
+        if str(value).lower() != str(DATABASE_PRAGMAS[name]).lower()
+    }
+
+
+def explain_query_plan(database: SqliteDatabase, sql: str, params: Any = None) -> list[str]:
+    """Get EXPLAIN QUERY PLAN detail lines for a statement."""
+    cursor = database.execute_sql(f"EXPLAIN QUERY PLAN {sql}", params or ())
+    return [row[-1] for row in cursor.fetchall()]
+
+
+def find_full_scans(plan: list[str]) -> list[str]:
+    """Get plan lines that read a whole table without an index."""
+    return [
+        line for line in plan
+        if line.startswith("SCAN ") and " USING " not in line and line != "SCAN CONSTANT ROW"
+    ]
+
+
+def get_router(database: SqliteDatabase | None = None) -> "Router":
     """Get migration router instance."""
+    # Imported here: peewee-migrate is slow to import and startup skips it when the schema is current
+    from peewee_migrate import Router
+
     if database is None:
         database = get_database()
     return Router(database, migrate_dir=MIGRATIONS_DIR)
 
 
-def run_migrations() -> None:
-    """Run all pending migrations."""
-    router = get_router()
-    router.run()
+def latest_migration(migrate_dir: Path = MIGRATIONS_DIR) -> int:
+    """Get the number of the newest migration file (``NNN_name.py``)."""
+    numbers = [int(path.name.split("_", 1)[0]) for path in Path(migrate_dir).glob("[0-9]*_*.py")]
+    return max(numbers, default=0)
+
+
+def schema_version(database: SqliteDatabase | None = None) -> int:
+    """Get the migration number recorded in the database (``PRAGMA user_version``)."""
+    database = database or get_database()
+    return database.execute_sql("PRAGMA user_version").fetchone()[0]
+
+
+def set_schema_version(version: int, database: SqliteDatabase | None = None) -> None:
+    """Record the migration number the database schema is at."""
+    database = database or get_database()
+    database.execute_sql(f"PRAGMA user_version = {int(version)}")
+
+
+def run_migrations(database: SqliteDatabase | None = None, force: bool = False) -> bool:
+    """Run pending migrations; return False if skipped.
+
+    When the recorded schema version is the newest migration file, nothing
+    can be pending and the router (which imports every migration and reads
+    the history table) is not built at all. ``force`` always runs it.
+    """
+    database = database or get_database()
+    latest = latest_migration()
+    if not force and latest and schema_version(database) == latest:
+        return False
+    get_router(database).run()
+    set_schema_version(latest, database)
+    return True
 
 
 def create_migration(name: str) -> str:
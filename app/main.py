@@ -2,19 +2,79 @@
 IAS Application - Main entry point.
 
 Inspection/Failures App for aircraft maintenance tracking.
+
+Usage:
+    python run.py [--profile-startup]
+
+``--profile-startup`` prints how long imports, database initialization and
+building the main window took until the window was first painted.
 """
+import logging
 import sys
+import time
+from collections.abc import Callable
+from typing import Any
 
-from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QEvent, QObject
 
 from app.config import APP_NAME, FUSION_STYLE
-from app.database import run_migrations
-from app.ui.windows.main_window import MainForm
+
+logger = logging.getLogger(__name__)
+
+PROFILE_STARTUP_FLAG = "--profile-startup"
+
+
+class StartupProfile:
+    """Durations of startup steps, measured between marks."""
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self._last = self.started
+        self.steps: list[tuple[str, float]] = []
+
+    def mark(self, step: str) -> None:
+        """Record the time spent since the previous mark as a step."""
+        now = time.perf_counter()
+        self.steps.append((step, now - self._last))
+        self._last = now
+
+    def report(self) -> str:
+        """Describe steps and the total in milliseconds."""
+        lines = ["Startup profile:"]
+        lines.extend(f"  {step:<28} {elapsed * 1000:8.1f} ms" for step, elapsed in self.steps)
+        lines.append(f"  {'total':<28} {(self._last - self.started) * 1000:8.1f} ms")
+        return "\n".join(lines)
+
+
+class FirstPaintWatcher(QObject):
+    """Calls back once when the watched widget gets its first paint event."""
+
+    def __init__(self, callback: Callable[[], None], parent: Any | None = None) -> None:
+        super().__init__(parent)
+        self.callback = callback
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:  # type: ignore[override]
+        """Report the first paint event and stop watching."""
+        if event.type() == QEvent.Type.Paint:
+            watched.removeEventFilter(self)
+            self.callback()
+        return False
 
 
 def init_database() -> None:
-    """Initialize database by running migrations."""
-    run_migrations()
+    """Initialize database: run pending migrations, check connection settings, snapshot failure history if due."""
+    from app.database import check_connection, connection_mismatches, run_migrations
+    from app.services.failure_history import snapshot_if_due
+
+    if not run_migrations():
+        logger.info("Database schema is current, migrations skipped")
+    effective = check_connection()
+    logger.info("Database connection: %s", effective)
+    for name, (configured, value) in connection_mismatches(effective).items():
+        logger.warning("PRAGMA %s is %s (configured: %s)", name, value, configured)
+    snapshot = snapshot_if_due()
+    if snapshot is not None:
+        logger.info("Failure history snapshot taken up to event %d", snapshot.last_event_id)
 
 
 def main() -> int:
@@ -24,18 +84,42 @@ def main() -> int:
     Returns:
         Exit code from QApplication
     """
+    profile = StartupProfile()
+    # Imported here rather than at module level so the profile can time them
+    from PyQt6.QtWidgets import QApplication
+
+    profile.mark("import Qt widgets")
+    from app.ui.windows.main_window import MainForm
+
+    profile.mark("import main window")
+    from app.services.db_worker import get_executor
+
     app = QApplication(sys.argv)
     app.setApplicationName(APP_NAME)
     app.setStyle(FUSION_STYLE)
+    profile.mark("create application")
 
     # Initialize database
     init_database()
+    profile.mark("initialize database")
 
     # Create and show main window
     main_form = MainForm()
+    profile.mark("build main window")
+
+    if PROFILE_STARTUP_FLAG in sys.argv:
+        def first_paint() -> None:
+            profile.mark("first paint")
+            print(profile.report(), flush=True)
+
+        main_form.installEventFilter(FirstPaintWatcher(first_paint, main_form))
     main_form.show()
 
-    return app.exec()
+    exit_code = app.exec()
+
+    # Let the database worker finish before the connection goes away
+    get_executor().shutdown()
+    return exit_code
 
 
 if __name__ == "__main__":
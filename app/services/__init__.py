@@ -0,0 +1,12 @@
+"""Business logic services package."""
+from app.services.catalog import CatalogTree, get_catalog, invalidate_catalog
+from app.services.fleet_status import FleetStatusService, PlaneStatus, query_plane_statuses
+
+__all__ = [
+    "CatalogTree",
+    "get_catalog",
+    "invalidate_catalog",
+    "FleetStatusService",
+    "PlaneStatus",
+    "query_plane_statuses",
+]
@@ -0,0 +1,141 @@
+"""Catalog cache - type → group → system → agregate tree shared by combo boxes."""
+from typing import Any
+
+from peewee import JOIN, Model
+
+from app.collation import russian_key
+from data.models.aircraft import AgregateBase, GroupBase, SystemBase, TypeBase
+
+# Catalog model -> field linking it to its parent level
+PARENT_FIELDS: dict[type[Model], str | None] = {
+    TypeBase: None,
+    GroupBase: "plane_type",
+    SystemBase: "group",
+    AgregateBase: "system",
+}
+
+_version = 0
+
+
+def invalidate_catalog() -> None:
+    """Mark the cached catalog stale after a catalog write."""
+    global _version
+    _version += 1
+
+
+def catalog_version() -> int:
+    """Get the current catalog version."""
+    return _version
+
+
+def _make(model: type[Model], **data: Any) -> Model:
+    """Build a model instance from fetched values, as if selected from the database."""
+    instance = model(__no_default__=1, **data)
+    instance._dirty.clear()
+    return instance
+
+
+class CatalogTree:
+    """In-memory catalog indexed by parent id, loaded with one joined query.
+
+    Items of every level and under every parent are kept in Russian
+    alphabetical order of their names.
+    """
+
+    def __init__(self) -> None:
+        self.version = -1
+        self._items: dict[type[Model], dict[int, Model]] = {}
+        self._children: dict[tuple[type[Model], int], list[Model]] = {}
+
+    def load(self) -> None:
+        """Load the whole catalog in one query."""
+        query = (
+            TypeBase
+            .select(
+                TypeBase.id,
+                TypeBase.name,
+                GroupBase.id,
+                GroupBase.name,
+                SystemBase.id,
+                SystemBase.name,
+                SystemBase.plane_type,
+                AgregateBase.id,
+                AgregateBase.name,
+                AgregateBase.count_on_plane,
+            )
+            .join(GroupBase, JOIN.LEFT_OUTER, on=(GroupBase.plane_type == TypeBase.id))
+            .join(SystemBase, JOIN.LEFT_OUTER, on=(SystemBase.group == GroupBase.id))
+            .join(AgregateBase, JOIN.LEFT_OUTER, on=(AgregateBase.system == SystemBase.id))
+            .order_by(TypeBase.id, GroupBase.id, SystemBase.id, AgregateBase.id)
+            .tuples()
+        )
+        version = _version
+        self._items = {model: {} for model in PARENT_FIELDS}
+        self._children = {}
+        for type_id, type_name, group_id, group_name, system_id, system_name, system_type_id, \
+                agregate_id, agregate_name, count_on_plane in query:
+            self._add(TypeBase, type_id, None, name=type_name)
+            if group_id is not None:
+                self._add(GroupBase, group_id, type_id, name=group_name, plane_type=type_id)
+            if system_id is not None:
+                self._add(SystemBase, system_id, group_id, name=system_name, group=group_id, plane_type=system_type_id)
+            if agregate_id is not None:
+                self._add(
+                    AgregateBase, agregate_id, system_id,
+                    name=agregate_name, system=system_id, count_on_plane=count_on_plane,
+                )
+        # Sorted here rather than in SQL: one key per item instead of a collation call per comparison
+        for model, items in self._items.items():
+            self._items[model] = dict(sorted(items.items(), key=lambda item: russian_key(item[1].name)))
+        for children in self._children.values():
+            children.sort(key=lambda item: russian_key(item.name))
+        self.version = version
+
+    def _add(self, model: type[Model], item_id: int, parent_id: int | None, **data: Any) -> None:
+        """Register an item under its parent once."""
+        items = self._items[model]
+        if item_id in items:
+            return
+        items[item_id] = _make(model, id=item_id, **data)
+        if parent_id is not None:
+            self._children.setdefault((model, parent_id), []).append(items[item_id])
+
+    def ensure_current(self) -> None:
+        """Reload if the catalog changed since the last load."""
+        if self.version != _version:
+            self.load()
+
+    def items(self, model: type[Model]) -> list[Model]:
+        """Get all items of a catalog level."""
+        return list(self._items[model].values())
+
+    def get(self, model: type[Model], item_id: int) -> Model | None:
+        """Get a catalog item by id."""
+        return self._items[model].get(item_id)
+
+    def children(self, model: type[Model], parent: Any) -> list[Model]:
+        """Get items of a level belonging to parent (instance or id)."""
+        parent_id = parent.id if hasattr(parent, "id") else parent
+        return list(self._children.get((model, parent_id), ()))
+
+    def select(self, model: type[Model] | None, filters: dict[str, Any]) -> list[Model] | None:
+        """Get items matching a combo filter, or None if the cache cannot answer it."""
+        if model not in PARENT_FIELDS:
+            return None
+        if not filters:
+            return self.items(model)
+        if list(filters) == [PARENT_FIELDS[model]]:
+            return self.children(model, filters[PARENT_FIELDS[model]])
+        return None
+
+
+_catalog: CatalogTree | None = None
+
+
+def get_catalog() -> CatalogTree:
+    """Get the shared catalog, reloaded if stale."""
+    global _catalog
+    if _catalog is None:
+        _catalog = CatalogTree()
+    _catalog.ensure_current()
+    return _catalog
@@ -0,0 +1,192 @@
+"""Background database executor - runs queries off the GUI thread."""
+import logging
+import traceback
+from collections.abc import Callable, Hashable
+from typing import Any
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+logger = logging.getLogger(__name__)
+
+
+class DbTaskError(Exception):
+    """Error raised by a background task, rebuilt in the GUI thread.
+
+    Only plain values cross the thread boundary: the original exception
+    and its traceback frames stay in the worker thread.
+    """
+
+    def __init__(self, error_type: str, message: str, details: str) -> None:
+        super().__init__(f"{error_type}: {message}")
+        self.error_type = error_type
+        self.message = message
+        self.details = details
+
+
+class _TaskSignals(QObject):
+    """Signals delivering a task result back to the GUI thread."""
+    finished = pyqtSignal(int, object)
+    failed = pyqtSignal(int, object)
+
+
+class DbTask(QRunnable):
+    """Single database call executed by the worker thread."""
+
+    def __init__(self, task_id: int, func: Callable[..., Any], args: tuple, kwargs: dict[str, Any]) -> None:
+        super().__init__()
+        self.setAutoDelete(False)
+        self.task_id = task_id
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.cancelled = False
+        self.on_result: Callable[[Any], None] | None = None
+        self.on_error: Callable[[DbTaskError], None] | None = None
+        self.signals = _TaskSignals()
+
+    def run(self) -> None:
+        """Call func and emit its result; skipped if cancelled before start."""
+        if self.cancelled:
+            self.signals.finished.emit(self.task_id, None)
+            return
+        try:
+            result = self.func(*self.args, **self.kwargs)
+        except Exception as e:
+            error = (type(e).__name__, str(e), traceback.format_exc())
+            self.signals.failed.emit(self.task_id, error)
+        else:
+            self.signals.finished.emit(self.task_id, result)
+
+
+class DbExecutor(QObject):
+    """Runs database calls on a worker thread and returns results via callbacks.
+
+    One worker thread is used: SQLite serializes writers anyway, and the
+    thread keeps its connection (and page cache) open between tasks. Tasks
+    submitted with the same ``key`` supersede each other: a queued task is
+    dropped, a running one has its result discarded. Callbacks are always
+    called in the GUI thread. With ``synchronous`` set tasks run inline,
+    which is needed for in-memory databases (one per connection).
+
+    Call ``shutdown`` before the executor is destroyed: the pool destructor
+    blocks holding the GIL, while ``shutdown`` waits with the GIL released.
+    """
+
+    busy_changed = pyqtSignal(bool)
+
+    def __init__(self, parent: Any | None = None) -> None:
+        super().__init__(parent)
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+        self.pool.setExpiryTimeout(-1)
+        self.synchronous = False
+        self._tasks: dict[int, DbTask] = {}
+        self._keys: dict[Hashable, int] = {}
+        self._next_id = 0
+
+    def submit(
+        self,
+        func: Callable[..., Any],
+        *args: Any,
+        key: Hashable | None = None,
+        on_result: Callable[[Any], None] | None = None,
+        on_error: Callable[[DbTaskError], None] | None = None,
+        **kwargs: Any,
+    ) -> int:
+        """Queue func(*args, **kwargs); cancel the previous task with the same key."""
+        if key is not None:
+            self.cancel(key)
+
+        self._next_id += 1
+        task = DbTask(self._next_id, func, args, kwargs)
+        task.on_result = on_result
+        task.on_error = on_error
+
+        if self.synchronous:
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                if on_error is None:
+                    raise
+                on_error(DbTaskError(type(e).__name__, str(e), traceback.format_exc()))
+            else:
+                if on_result is not None:
+                    on_result(result)
+            return task.task_id
+
+        was_busy = self.is_busy()
+        task.signals.finished.connect(self._on_finished)
+        task.signals.failed.connect(self._on_failed)
+        self._tasks[task.task_id] = task
+        if key is not None:
+            self._keys[key] = task.task_id
+        self.pool.start(task)
+        if not was_busy:
+            self.busy_changed.emit(True)
+        return task.task_id
+
+    def cancel(self, key: Hashable) -> None:
+        """Cancel the pending task submitted with key."""
+        task_id = self._keys.pop(key, None)
+        task = self._tasks.get(task_id) if task_id is not None else None
+        if task is None:
+            return
+        task.cancelled = True
+        if self.pool.tryTake(task):
+            self._finish(task_id)
+
+    def cancel_all(self) -> None:
+        """Cancel every pending task."""
+        for key in list(self._keys):
+            self.cancel(key)
+        for task in self._tasks.values():
+            task.cancelled = True
+
+    def is_busy(self) -> bool:
+        """Check if any task is queued or running."""
+        return bool(self._tasks)
+
+    def wait(self, msecs: int = -1) -> bool:
+        """Block until the worker is idle."""
+        return self.pool.waitForDone(msecs)
+
+    def shutdown(self) -> None:
+        """Cancel pending tasks and wait for the running one to finish."""
+        self.cancel_all()
+        self.wait()
+
+    def _finish(self, task_id: int) -> DbTask | None:
+        """Forget a task and update busy state."""
+        task = self._tasks.pop(task_id, None)
+        if task is not None:
+            self._keys = {key: value for key, value in self._keys.items() if value != task_id}
+            if not self._tasks:
+                self.busy_changed.emit(False)
+        return task
+
+    def _on_finished(self, task_id: int, result: Any) -> None:
+        """Deliver result of a finished task."""
+        task = self._finish(task_id)
+        if task is not None and not task.cancelled and task.on_result is not None:
+            task.on_result(result)
+
+    def _on_failed(self, task_id: int, error: tuple[str, str, str]) -> None:
+        """Deliver error of a failed task."""
+        task = self._finish(task_id)
+        if task is None or task.cancelled:
+            return
+        if task.on_error is not None:
+            task.on_error(DbTaskError(*error))
+        else:
+            logger.error("Background database task failed:\n%s", error[2])
+
+
+_executor: DbExecutor | None = None
+
+
+def get_executor() -> DbExecutor:
+    """Get the shared database executor."""
+    global _executor
+    if _executor is None:
+        _executor = DbExecutor()
+    return _executor
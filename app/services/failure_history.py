@@ -0,0 +1,132 @@
+"""Failure history service - failures and fleet status as of a moment."""
+import datetime
+from typing import NamedTuple
+
+from peewee import fn
+
+from app.services.fleet_status import PlaneStatus
+from data.models.history import (
+    CLOSED,
+    EVENT_TABLE,
+    NOW_SQL,
+    FailureEvent,
+    FailureSnapshot,
+    FailureSnapshotItem,
+)
+
+# Events logged since the last snapshot that make a new one due
+SNAPSHOT_INTERVAL = 10000
+
+_SNAPSHOT_TABLE = FailureSnapshot._meta.table_name
+_ITEM_TABLE = FailureSnapshotItem._meta.table_name
+_COLUMNS = "otkaz_id, plane_id, agregate_id, number, description, removed"
+
+
+class FailureState(NamedTuple):
+    """A failure as it was at some moment."""
+    otkaz_id: int
+    plane_id: int
+    agregate_id: int
+    number: str
+    description: str
+    removed: bool
+
+
+def _timestamp(moment: datetime.datetime) -> str:
+    """Format a moment comparable with stored created_at (always with a fraction)."""
+    return moment.isoformat(" ", timespec="microseconds")
+
+
+def _state_sql(plane_id: int | None) -> str:
+    """SQL selecting failure states at a moment (param ``:t``), optionally of one aircraft (``:plane``).
+
+    Starts from the latest snapshot taken by then and replays only the
+    events after it: the last event of each failure wins, closed ones drop out.
+    """
+    item_plane = "AND i.plane_id = :plane" if plane_id is not None else ""
+    # The time bound lets the (plane_id, created_at) index stop at the snapshot
+    event_plane = "AND e.plane_id = :plane AND e.created_at >= COALESCE((SELECT created_at FROM snap), '')" \
+        if plane_id is not None else ""
+    return (
+        f"WITH snap AS (SELECT id, last_event_id, created_at FROM {_SNAPSHOT_TABLE} "
+        f"WHERE created_at <= :t ORDER BY created_at DESC LIMIT 1), "
+        "later AS (SELECT e.id, e.kind, e.otkaz_id, e.plane_id, e.agregate_id, e.number, e.description, e.removed "
+        f"FROM {EVENT_TABLE} AS e WHERE e.id > COALESCE((SELECT last_event_id FROM snap), 0) "
+        f"AND e.created_at <= :t {event_plane}), "
+        "latest AS (SELECT MAX(id) AS id, otkaz_id FROM later GROUP BY otkaz_id) "
+        f"SELECT {_COLUMNS} FROM {_ITEM_TABLE} AS i "
+        f"WHERE i.snapshot_id = (SELECT id FROM snap) {item_plane} "
+        "AND i.otkaz_id NOT IN (SELECT otkaz_id FROM latest) "
+        f"UNION ALL SELECT {_COLUMNS} FROM later WHERE id IN (SELECT id FROM latest) AND kind <> '{CLOSED}'"
+    )
+
+
+def failures_as_of(moment: datetime.datetime, plane_id: int | None = None) -> list[FailureState]:
+    """Get failures recorded at a moment, of one aircraft or the whole fleet, ordered by id."""
+    cursor = FailureEvent._meta.database.execute_sql(
+        f"SELECT * FROM ({_state_sql(plane_id)}) ORDER BY otkaz_id",
+        {"t": _timestamp(moment), "plane": plane_id},
+    )
+    return [
+        FailureState(otkaz_id, plane, agregate_id, number, description, bool(removed))
+        for otkaz_id, plane, agregate_id, number, description, removed in cursor.fetchall()
+    ]
+
+
+def plane_statuses_as_of(moment: datetime.datetime) -> dict[int, PlaneStatus]:
+    """Get failure and removed-unit counts per aircraft at a moment, like query_plane_statuses."""
+    cursor = FailureEvent._meta.database.execute_sql(
+        f"SELECT plane_id, COUNT(*), SUM(removed) FROM ({_state_sql(None)}) GROUP BY plane_id",
+        {"t": _timestamp(moment), "plane": None},
+    )
+    return {plane_id: PlaneStatus(failures, removed or 0) for plane_id, failures, removed in cursor.fetchall()}
+
+
+def failure_events(
+    plane_id: int | None = None,
+    agregate_id: int | None = None,
+    start: datetime.datetime | None = None,
+    end: datetime.datetime | None = None,
+) -> list[FailureEvent]:
+    """Get logged events of an aircraft or of an agregate in [start, end], oldest first."""
+    query = FailureEvent.select().order_by(FailureEvent.created_at, FailureEvent.id)
+    if plane_id is not None:
+        query = query.where(FailureEvent.plane_id == plane_id)
+    if agregate_id is not None:
+        query = query.where(FailureEvent.agregate_id == agregate_id)
+    if start is not None:
+        query = query.where(FailureEvent.created_at >= start)
+    if end is not None:
+        query = query.where(FailureEvent.created_at <= end)
+    return list(query)
+
+
+def take_snapshot() -> FailureSnapshot:
+    """Copy the current failures into a new snapshot in one transaction."""
+    database = FailureSnapshot._meta.database
+
+    def copy() -> FailureSnapshot:
+        last_event_id = FailureEvent.select(fn.MAX(FailureEvent.id)).scalar() or 0
+        # Stamped by SQLite, like the events it is compared with
+        cursor = database.execute_sql(
+            f"INSERT INTO {_SNAPSHOT_TABLE} (created_at, last_event_id) VALUES ({NOW_SQL}, ?)",
+            (last_event_id,),
+        )
+        snapshot_id = cursor.lastrowid
+        database.execute_sql(
+            f"INSERT INTO {_ITEM_TABLE} (snapshot_id, {_COLUMNS}) "
+            "SELECT ?, id, plane_id, agregate_id, number, description, removed FROM otkaz_agregate_base",
+            (snapshot_id,),
+        )
+        return FailureSnapshot.get_by_id(snapshot_id)
+
+    return FailureSnapshot.run_in_transaction(copy)
+
+
+def snapshot_if_due(interval: int = SNAPSHOT_INTERVAL) -> FailureSnapshot | None:
+    """Take a snapshot if at least interval events were logged since the last one."""
+    last_event_id = FailureEvent.select(fn.MAX(FailureEvent.id)).scalar() or 0
+    covered = FailureSnapshot.select(fn.MAX(FailureSnapshot.last_event_id)).scalar() or 0
+    if last_event_id - covered < interval:
+        return None
+    return take_snapshot()
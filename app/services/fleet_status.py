@@ -0,0 +1,70 @@
+"""Fleet status service - batched failure counts for all aircraft."""
+from collections.abc import Iterable
+from typing import NamedTuple
+
+from peewee import Case, fn
+
+from app.collation import NATURAL, RUSSIAN
+from data.models.aircraft import PlaneBase, PodrazdBase
+from data.models.failures import OtkazAgregateBase
+
+
+class PlaneStatus(NamedTuple):
+    """Failure summary for one aircraft."""
+    failures: int = 0
+    removed: int = 0
+
+    @property
+    def has_failures(self) -> bool:
+        """Return True if the aircraft has any failure records."""
+        return self.failures > 0
+
+
+def query_plane_statuses(plane_ids: Iterable[int] | None = None) -> dict[int, PlaneStatus]:
+    """Get failure and removed-unit counts per aircraft with one grouped query."""
+    query = (
+        OtkazAgregateBase
+        .select(
+            OtkazAgregateBase.plane,
+            fn.COUNT(OtkazAgregateBase.id),
+            fn.SUM(Case(None, [(OtkazAgregateBase.removed == True, 1)], 0)),  # noqa: E712
+        )
+        .group_by(OtkazAgregateBase.plane)
+    )
+    if plane_ids is not None:
+        query = query.where(OtkazAgregateBase.plane.in_(list(plane_ids)))
+    return {
+        plane_id: PlaneStatus(failures, removed or 0)
+        for plane_id, failures, removed in query.tuples()
+    }
+
+
+class FleetStatusService:
+    """Snapshot of divisions, their aircraft and failure status."""
+
+    def __init__(self) -> None:
+        self.podrazds: list[PodrazdBase] = []
+        self._planes_by_podrazd: dict[int, list[PlaneBase]] = {}
+        self._statuses: dict[int, PlaneStatus] = {}
+
+    def load(self) -> None:
+        """Load the whole fleet: divisions by name, aircraft by bort number, statuses in three queries."""
+        self.podrazds = list(PodrazdBase.select().order_by(PodrazdBase.name.collate(RUSSIAN)))
+        self._planes_by_podrazd = {}
+        for plane in PlaneBase.select().order_by(PlaneBase.podrazd, PlaneBase.bort_number.collate(NATURAL)):
+            self._planes_by_podrazd.setdefault(plane.podrazd_id, []).append(plane)
+        self._statuses = query_plane_statuses()
+
+    def planes_for(self, podrazd_id: int) -> list[PlaneBase]:
+        """Get aircraft of a division."""
+        return self._planes_by_podrazd.get(podrazd_id, [])
+
+    def status(self, plane_id: int) -> PlaneStatus:
+        """Get precomputed status of an aircraft."""
+        return self._statuses.get(plane_id, PlaneStatus())
+
+    def refresh_plane(self, plane_id: int) -> PlaneStatus:
+        """Recompute status of a single aircraft."""
+        status = query_plane_statuses([plane_id]).get(plane_id, PlaneStatus())
+        self._statuses[plane_id] = status
+        return status
@@ -0,0 +1,63 @@
+"""Global search over failures and aircraft through the FTS5 search index."""
+import re
+from typing import NamedTuple
+
+from data.models.aircraft import PlaneBase
+from data.models.search import TABLE_NAME
+
+# bm25 weights by index column: agregate, system, number, bort, description, plane_id
+COLUMN_WEIGHTS = (5.0, 2.0, 10.0, 10.0, 1.0, 0.0)
+
+# Ranking costs about 2 us per matching row: a single letter matches a
+# quarter of 100k failures, two letters already narrow it enough
+MIN_QUERY_LENGTH = 2
+
+_TOKEN = re.compile(r"\w+")
+
+
+class SearchResult(NamedTuple):
+    """One search hit; ``otkaz_id`` is None for an aircraft hit."""
+    plane_id: int
+    otkaz_id: int | None
+    plane: str
+    agregate: str = ""
+    system: str = ""
+    number: str = ""
+    description: str = ""
+
+
+def match_expression(text: str) -> str | None:
+    """Build an FTS5 query matching every word of text as a prefix, None if text is too short."""
+    tokens = _TOKEN.findall(text)
+    if sum(len(token) for token in tokens) < MIN_QUERY_LENGTH:
+        return None
+    return " ".join(f'"{token}"*' for token in tokens)
+
+
+def search(text: str, limit: int = 50) -> list[SearchResult]:
+    """Find failures and aircraft matching text, best matches first.
+
+    Unit and bort numbers weigh most, then agregate and system names, then
+    notes. Hits are ranked inside the index and only the best ``limit``
+    are joined to their aircraft. Runs in the worker thread.
+    """
+    expression = match_expression(text)
+    if expression is None:
+        return []
+    weights = ", ".join(str(weight) for weight in COLUMN_WEIGHTS)
+    cursor = PlaneBase._meta.database.execute_sql(
+        "SELECT s.rowid, p.id, t.name, p.bort_number, s.agregate, s.system, s.number, s.description "
+        f"FROM (SELECT rowid AS id, bm25({TABLE_NAME}, {weights}) AS score FROM {TABLE_NAME} "
+        f"WHERE {TABLE_NAME} MATCH ? ORDER BY score LIMIT ?) AS hit "
+        f"JOIN {TABLE_NAME} AS s ON s.rowid = hit.id "
+        "JOIN plane_base AS p ON p.id = s.plane_id "
+        "JOIN type_base AS t ON t.id = p.plane_type_id "
+        "ORDER BY hit.score",
+        (expression, limit),
+    )
+    return [
+        SearchResult(
+            plane_id, rowid if rowid > 0 else None, f"{type_name} №{bort}", agregate, system, number, description
+        )
+        for rowid, plane_id, type_name, bort, agregate, system, number, description in cursor.fetchall()
+    ]
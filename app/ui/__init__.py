@@ -1,29 +1,53 @@
 """UI components package."""
-from app.ui.widgets.buttons import IASButton, PlaneBtn
-from app.ui.widgets.combo_box import (
-    AgregateComboBox,
-    ComboBoxModel,
-    GroupComboBox,
-    IASComboBox,
-    PlaneTypeComboBox,
-    PodrazdComboBox,
-    SystemComboBox,
-)
-from app.ui.widgets.groups import PodrGroup
-from app.ui.widgets.tables import (
-    AgregateTable,
-    GroupTable,
-    IspravnostTable,
-    OsobTable,
-    PlanesTable,
-    PlaneTypesTable,
-    PodrazdTable,
-    UnTableView,
-)
+from typing import TYPE_CHECKING
+
+from app.ui.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from app.ui.widgets.buttons import IASButton
+    from app.ui.widgets.combo_box import (
+        AgregateComboBox,
+        ComboBoxModel,
+        GroupComboBox,
+        IASComboBox,
+        PlaneTypeComboBox,
+        PodrazdComboBox,
+        SystemComboBox,
+    )
+    from app.ui.widgets.groups import PodrGridGroup
+    from app.ui.widgets.tables import (
+        AgregateTable,
+        GroupTable,
+        IspravnostTable,
+        OsobTable,
+        PlanesTable,
+        PlaneTypesTable,
+        PodrazdTable,
+        UnTableView,
+    )
+
+__getattr__ = lazy_exports(__name__, {
+    "IASButton": ".widgets.buttons",
+    "IASComboBox": ".widgets.combo_box",
+    "ComboBoxModel": ".widgets.combo_box",
+    "PlaneTypeComboBox": ".widgets.combo_box",
+    "PodrazdComboBox": ".widgets.combo_box",
+    "GroupComboBox": ".widgets.combo_box",
+    "SystemComboBox": ".widgets.combo_box",
+    "AgregateComboBox": ".widgets.combo_box",
+    "UnTableView": ".widgets.tables.base_table",
+    "IspravnostTable": ".widgets.tables.ispravnost_table",
+    "PlaneTypesTable": ".widgets.tables.plane_types_table",
+    "PodrazdTable": ".widgets.tables.podrazd_table",
+    "GroupTable": ".widgets.tables.group_table",
+    "AgregateTable": ".widgets.tables.agregate_table",
+    "PlanesTable": ".widgets.tables.planes_table",
+    "OsobTable": ".widgets.tables.osobs_table",
+    "PodrGridGroup": ".widgets.groups",
+})
 
 __all__ = [
     "IASButton",
-    "PlaneBtn",
     "IASComboBox",
     "ComboBoxModel",
     "PlaneTypeComboBox",
@@ -39,5 +63,5 @@ __all__ = [
     "AgregateTable",
     "PlanesTable",
     "OsobTable",
-    "PodrGroup",
+    "PodrGridGroup",
 ]
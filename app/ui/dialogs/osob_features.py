@@ -1,9 +1,8 @@
 """Dialog for editing aircraft features with systems/blocks selection."""
 from typing import Any
 
-from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtWidgets import (
-    QCheckBox,
     QDialog,
     QDialogButtonBox,
     QFormLayout,
@@ -15,14 +14,17 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
+from app.ui.widgets.check_tree import CatalogCheckModel, CatalogCheckTree
 from app.ui.widgets.combo_box import PlaneTypeComboBox
-from data.models.aircraft import AgregateBase, GroupBase, SystemBase
+from data.models.aircraft import AgregateBase, SystemBase
 from data.models.osob import (
     OsobAgregateAddBase,
     OsobAgregateRemoveBase,
     OsobBase,
     OsobSystemAddBase,
     OsobSystemRemoveBase,
+    get_osob_link_ids,
+    save_osob_links,
 )
 
 
@@ -54,47 +56,23 @@ class OsobFeatureDialog(QDialog):
 
         self.main_layout.addWidget(self.basic_group)
 
-        # Tabs for systems and blocks
-        self.tabs = QTabWidget()
-
-        # Systems tab
-        self.systems_widget = QWidget()
-        self.systems_layout = QVBoxLayout()
-        self.systems_widget.setLayout(self.systems_layout)
-
-        self.systems_remove_group = QGroupBox("Удалить системы")
-        self.systems_remove_layout = QVBoxLayout()
-        self.systems_remove_group.setLayout(self.systems_remove_layout)
-
-        self.systems_add_group = QGroupBox("Добавить системы")
-        self.systems_add_layout = QVBoxLayout()
-        self.systems_add_group.setLayout(self.systems_add_layout)
-
-        self.systems_layout.addWidget(self.systems_remove_group)
-        self.systems_layout.addWidget(self.systems_add_group)
-        self.systems_layout.addStretch()
-
-        self.tabs.addTab(self.systems_widget, "Системы")
-
-        # Blocks tab
-        self.blocks_widget = QWidget()
-        self.blocks_layout = QVBoxLayout()
-        self.blocks_widget.setLayout(self.blocks_layout)
-
-        self.blocks_remove_group = QGroupBox("Удалить блоки/агрегаты")
-        self.blocks_remove_layout = QVBoxLayout()
-        self.blocks_remove_group.setLayout(self.blocks_remove_layout)
-
-        self.blocks_add_group = QGroupBox("Добавить блоки/агрегаты")
-        self.blocks_add_layout = QVBoxLayout()
-        self.blocks_add_group.setLayout(self.blocks_add_layout)
-
-        self.blocks_layout.addWidget(self.blocks_remove_group)
-        self.blocks_layout.addWidget(self.blocks_add_group)
-        self.blocks_layout.addStretch()
-
-        self.tabs.addTab(self.blocks_widget, "Блоки/Агрегаты")
+        # Tabs for systems and blocks: catalog trees for remove and add sides
+        self.system_remove_model = CatalogCheckModel(SystemBase, self)
+        self.system_add_model = CatalogCheckModel(SystemBase, self)
+        self.block_remove_model = CatalogCheckModel(AgregateBase, self)
+        self.block_add_model = CatalogCheckModel(AgregateBase, self)
 
+        self.tabs = QTabWidget()
+        self.systems_filter, self.system_remove_tree, self.system_add_tree = self._create_tab(
+            "Системы", "Удалить системы", "Добавить системы", self.system_remove_model, self.system_add_model
+        )
+        self.blocks_filter, self.block_remove_tree, self.block_add_tree = self._create_tab(
+            "Блоки/Агрегаты",
+            "Удалить блоки/агрегаты",
+            "Добавить блоки/агрегаты",
+            self.block_remove_model,
+            self.block_add_model,
+        )
         self.main_layout.addWidget(self.tabs)
 
         # Buttons
@@ -106,12 +84,22 @@ class OsobFeatureDialog(QDialog):
 
         self.main_layout.addWidget(self.button_box)
 
-        # Store checkboxes
-        self.system_remove_checks: dict[int, QCheckBox] = {}
-        self.system_add_checks: dict[int, QCheckBox] = {}
-        self.block_remove_checks: dict[int, QCheckBox] = {}
-        self.block_add_checks: dict[int, QCheckBox] = {}
-        self.system_to_blocks_map: dict[int, list[int]] = {}  # system_id -> [block_ids]
+        # Stored feature links, checked when the trees are built
+        self.stored_ids: dict[type, set[int]] = {}
+        self._cascading = False
+
+        self.system_remove_model.checked_changed.connect(
+            lambda system_ids, checked: self.on_systems_toggled(system_ids, checked, "remove")
+        )
+        self.system_add_model.checked_changed.connect(
+            lambda system_ids, checked: self.on_systems_toggled(system_ids, checked, "add")
+        )
+        self.block_remove_model.checked_changed.connect(
+            lambda block_ids, checked: self.on_blocks_toggled(block_ids, checked, "remove")
+        )
+        self.block_add_model.checked_changed.connect(
+            lambda block_ids, checked: self.on_blocks_toggled(block_ids, checked, "add")
+        )
 
         # Connect type change to update lists
         self.type_combo.changed.connect(self.on_type_changed)
@@ -122,6 +110,38 @@ class OsobFeatureDialog(QDialog):
             # Enable save only when type is selected
             self.save_button.setEnabled(False) # type: ignore
 
+    def _create_tab(
+        self,
+        title: str,
+        remove_title: str,
+        add_title: str,
+        remove_model: CatalogCheckModel,
+        add_model: CatalogCheckModel,
+    ) -> tuple[QLineEdit, CatalogCheckTree, CatalogCheckTree]:
+        """Create a tab with a filter box and remove/add trees."""
+        widget = QWidget()
+        layout = QVBoxLayout()
+        widget.setLayout(layout)
+
+        filter_edit = QLineEdit()
+        filter_edit.setPlaceholderText("Фильтр по названию")
+        filter_edit.setClearButtonEnabled(True)
+        layout.addWidget(filter_edit)
+
+        trees = []
+        for group_title, model in ((remove_title, remove_model), (add_title, add_model)):
+            group = QGroupBox(group_title)
+            group_layout = QVBoxLayout()
+            group.setLayout(group_layout)
+            tree = CatalogCheckTree(model)
+            group_layout.addWidget(tree)
+            filter_edit.textChanged.connect(tree.set_filter_text)
+            layout.addWidget(group)
+            trees.append(tree)
+
+        self.tabs.addTab(widget, title)
+        return filter_edit, trees[0], trees[1]
+
     def on_type_changed(self, plane_type: Any) -> None:
         """Update systems and blocks lists when type changes."""
         if plane_type:
@@ -135,175 +155,70 @@ class OsobFeatureDialog(QDialog):
     def load_data(self) -> None:
         """Load existing feature data."""
         self.name_edit.setText(self.osob.name)  # type: ignore
+        for link_model in (OsobSystemRemoveBase, OsobSystemAddBase, OsobAgregateRemoveBase, OsobAgregateAddBase):
+            self.stored_ids[link_model] = get_osob_link_ids(self.osob, link_model)
         self.type_combo.setCurrentText(self.osob.plane_type.name)  # type: ignore
         self.load_systems()
         self.load_blocks()
 
     def load_systems(self) -> None:
-        """Load systems for selected aircraft type."""
-        # Clear existing checkboxes
-        self._clear_checkboxes(self.system_remove_checks)
-        self._clear_checkboxes(self.system_add_checks)
-
+        """Load systems tree for selected aircraft type."""
         plane_type = self.type_combo.currentData()
         if not plane_type:
             return
-
-        # Get all systems for this type
-        all_systems = list(SystemBase.select().join(GroupBase).where(GroupBase.plane_type == plane_type))
-
-        # Get systems to remove/add for this feature
-        systems_to_remove = set()
-        systems_to_add = set()
-
-        if self.osob:
-            systems_to_remove = {
-                s.system.id for s in OsobSystemRemoveBase.select().where(OsobSystemRemoveBase.osob == self.osob)
-            }
-            systems_to_add = {
-                s.system.id for s in OsobSystemAddBase.select().where(OsobSystemAddBase.osob == self.osob)
-            }
-
-        # Create checkboxes for remove AND add (same systems for both)
-        for system in all_systems:
-            # For remove
-            cb_remove = QCheckBox(f"{system.name} (Группа: {system.group.name})")
-            cb_remove.setChecked(system.id in systems_to_remove)
-            self.systems_remove_layout.addWidget(cb_remove)
-            self.system_remove_checks[system.id] = cb_remove
-            cb_remove.stateChanged.connect(lambda state, sys_id=system.id: self.on_system_toggled(sys_id, "remove"))
-
-            # For add
-            cb_add = QCheckBox(f"{system.name} (Группа: {system.group.name})")
-            cb_add.setChecked(system.id in systems_to_add)
-            self.systems_add_layout.addWidget(cb_add)
-            self.system_add_checks[system.id] = cb_add
-            cb_add.stateChanged.connect(lambda state, sys_id=system.id: self.on_system_toggled(sys_id, "add"))
+        self.system_remove_model.load(plane_type, self.stored_ids.get(OsobSystemRemoveBase, ()))
+        self.system_add_model.load(plane_type, self.stored_ids.get(OsobSystemAddBase, ()))
 
     def load_blocks(self) -> None:
-        """Load blocks for selected aircraft type."""
-        # Clear existing checkboxes
-        self._clear_checkboxes(self.block_remove_checks)
-        self._clear_checkboxes(self.block_add_checks)
-        self.system_to_blocks_map.clear()
-
+        """Load blocks tree for selected aircraft type."""
         plane_type = self.type_combo.currentData()
         if not plane_type:
             return
+        self.block_remove_model.load(plane_type, self.stored_ids.get(OsobAgregateRemoveBase, ()))
+        self.block_add_model.load(plane_type, self.stored_ids.get(OsobAgregateAddBase, ()))
 
-        # Get all blocks for this type
-        all_blocks = list(
-            AgregateBase.select()
-            .join(SystemBase)
-            .join(GroupBase)
-            .where(GroupBase.plane_type == plane_type)
-        )
-
-        # Get blocks to remove/add for this feature
-        blocks_to_remove = set()
-        blocks_to_add = set()
-
-        if self.osob:
-            blocks_to_remove = {
-                b.agregate.id for b in OsobAgregateRemoveBase.select().where(OsobAgregateRemoveBase.osob == self.osob)
-            }
-            blocks_to_add = {
-                b.agregate.id for b in OsobAgregateAddBase.select().where(OsobAgregateAddBase.osob == self.osob)
-            }
-
-        # Create checkboxes for remove AND add (same blocks for both)
-        for block in all_blocks:
-            # For remove
-            cb_remove = QCheckBox(f"{block.name} (Система: {block.system.name})")
-            cb_remove.setChecked(block.id in blocks_to_remove)
-            self.blocks_remove_layout.addWidget(cb_remove)
-            self.block_remove_checks[block.id] = cb_remove
-            cb_remove.stateChanged.connect(lambda state, blk_id=block.id: self.on_block_toggled(blk_id, "remove"))
-            
-            # Add to system->blocks mapping for remove
-            sys_id = block.system.id
-            if sys_id not in self.system_to_blocks_map:
-                self.system_to_blocks_map[sys_id] = []
-            self.system_to_blocks_map[sys_id].append(block.id)
-
-            # For add
-            cb_add = QCheckBox(f"{block.name} (Система: {block.system.name})")
-            cb_add.setChecked(block.id in blocks_to_add)
-            self.blocks_add_layout.addWidget(cb_add)
-            self.block_add_checks[block.id] = cb_add
-            cb_add.stateChanged.connect(lambda state, blk_id=block.id: self.on_block_toggled(blk_id, "add"))
-            
-            # Add to system->blocks mapping for add (same blocks)
-            if sys_id not in self.system_to_blocks_map:
-                self.system_to_blocks_map[sys_id] = []
-            if block.id not in self.system_to_blocks_map[sys_id]:
-                self.system_to_blocks_map[sys_id].append(block.id)
-
-    def _clear_checkboxes(self, checks_dict: dict) -> None:
-        """Clear and delete checkboxes."""
-        for cb in checks_dict.values():
-            cb.deleteLater()
-        checks_dict.clear()
-
-    def on_system_toggled(self, system_id: int, action: str) -> None:
-        """Handle system checkbox toggle - auto-select corresponding blocks."""
+    def _models(self, action: str) -> tuple[CatalogCheckModel, CatalogCheckModel]:
+        """Get system and block models of the remove or add side."""
         if action == "remove":
-            system_cb = self.system_remove_checks.get(system_id)
-            blocks_checks = self.block_remove_checks
-        else:
-            system_cb = self.system_add_checks.get(system_id)
-            blocks_checks = self.block_add_checks
+            return self.system_remove_model, self.block_remove_model
+        return self.system_add_model, self.block_add_model
 
-        if not system_cb:
+    def on_systems_toggled(self, system_ids: list[int], checked: bool, action: str) -> None:
+        """Handle system toggle - select or clear all their blocks in one batch."""
+        if self._cascading:
             return
+        _system_model, block_model = self._models(action)
+        block_ids = [
+            block_id for system_id in system_ids for block_id in block_model.leaf_ids(SystemBase, system_id)
+        ]
+        self._cascading = True
+        try:
+            block_model.set_checked_many(block_ids, checked)
+        finally:
+            self._cascading = False
 
-        is_checked = system_cb.isChecked()
-
-        # Get all blocks for this system from our mapping
-        system_blocks = self.system_to_blocks_map.get(system_id, [])
-
-        # Toggle all blocks for this system that are in our checkboxes
-        for block_id in system_blocks:
-            if block_id in blocks_checks:
-                blocks_checks[block_id].setChecked(is_checked)
-
-    def on_block_toggled(self, block_id: int, action: str) -> None:
-        """Handle block checkbox toggle - auto-select corresponding system if all blocks are selected."""
-        if action == "remove":
-            block_cb = self.block_remove_checks.get(block_id)
-            blocks_checks = self.block_remove_checks
-            system_checks = self.system_remove_checks
-        else:
-            block_cb = self.block_add_checks.get(block_id)
-            blocks_checks = self.block_add_checks
-            system_checks = self.system_add_checks
-
-        if not block_cb:
+    def on_blocks_toggled(self, block_ids: list[int], checked: bool, action: str) -> None:
+        """Handle block toggle - a system is selected when all its blocks are."""
+        if self._cascading:
             return
-
-        # Get block system from DB
-        block = AgregateBase.get_by_id(block_id)
-        system_id = block.system.id
-
-        # Get all blocks for this system from our mapping
-        system_blocks_in_list = self.system_to_blocks_map.get(system_id, [])
-
-        # Check if all visible blocks for this system are selected
-        all_blocks_checked = all(
-            blocks_checks[blk_id].isChecked()
-            for blk_id in system_blocks_in_list
-        )
-
-        # Update system checkbox only if there are blocks in the list
-        if system_id in system_checks and system_blocks_in_list:
-            system_checks[system_id].setChecked(all_blocks_checked)
+        system_model, block_model = self._models(action)
+        system_ids = {block_model.parent_id(AgregateBase, block_id) for block_id in block_ids}
+        system_ids.discard(None)
+        full = {
+            system_id for system_id in system_ids
+            if block_model.check_state(SystemBase, system_id) == Qt.CheckState.Checked
+        }
+        self._cascading = True
+        try:
+            system_model.set_checked_many(full, True)
+            system_model.set_checked_many(system_ids - full, False)
+        finally:
+            self._cascading = False
 
     def clear_lists(self) -> None:
-        """Clear all checkbox lists."""
-        self._clear_checkboxes(self.system_remove_checks)
-        self._clear_checkboxes(self.system_add_checks)
-        self._clear_checkboxes(self.block_remove_checks)
-        self._clear_checkboxes(self.block_add_checks)
+        """Clear all trees."""
+        for model in (self.system_remove_model, self.system_add_model, self.block_remove_model, self.block_add_model):
+            model.clear()
 
     def save_item(self) -> None:
         """Save feature with systems and blocks selections."""
@@ -318,45 +233,27 @@ class OsobFeatureDialog(QDialog):
             self.show_error("Выберите тип самолета")
             return
 
-        try:
-            # Create or update feature
-            if self.osob:
-                self.osob.name = name # type: ignore
-                self.osob.plane_type = plane_type
-                self.osob.save()
-
-                # Delete existing relations
-                OsobSystemRemoveBase.delete().where(OsobSystemRemoveBase.osob == self.osob).execute()
-                OsobSystemAddBase.delete().where(OsobSystemAddBase.osob == self.osob).execute()
-                OsobAgregateRemoveBase.delete().where(OsobAgregateRemoveBase.osob == self.osob).execute()
-                OsobAgregateAddBase.delete().where(OsobAgregateAddBase.osob == self.osob).execute()
+        links = {
+            OsobSystemRemoveBase: self.system_remove_model.checked_ids(),
+            OsobSystemAddBase: self.system_add_model.checked_ids(),
+            OsobAgregateRemoveBase: self.block_remove_model.checked_ids(),
+            OsobAgregateAddBase: self.block_add_model.checked_ids(),
+        }
+
+        def save() -> OsobBase:
+            osob = self.osob
+            if osob:
+                osob.name = name # type: ignore
+                osob.plane_type = plane_type
+                osob.save()
             else:
-                self.osob = OsobBase.create(name=name, plane_type=plane_type)
-
-            # Save systems to remove
-            for system_id, cb in self.system_remove_checks.items():
-                if cb.isChecked():
-                    system = SystemBase.get_by_id(system_id)
-                    OsobSystemRemoveBase.create(osob=self.osob, system=system)
-
-            # Save systems to add
-            for system_id, cb in self.system_add_checks.items():
-                if cb.isChecked():
-                    system = SystemBase.get_by_id(system_id)
-                    OsobSystemAddBase.create(osob=self.osob, system=system)
-
-            # Save blocks to remove
-            for block_id, cb in self.block_remove_checks.items():
-                if cb.isChecked():
-                    block = AgregateBase.get_by_id(block_id)
-                    OsobAgregateRemoveBase.create(osob=self.osob, agregate=block)
-
-            # Save blocks to add
-            for block_id, cb in self.block_add_checks.items():
-                if cb.isChecked():
-                    block = AgregateBase.get_by_id(block_id)
-                    OsobAgregateAddBase.create(osob=self.osob, agregate=block)
+                osob = OsobBase.create(name=name, plane_type=plane_type)
+            for link_model, ids in links.items():
+                save_osob_links(osob, link_model, ids)
+            return osob
 
+        try:
+            self.osob = OsobBase.run_in_transaction(save)
             self.updated.emit()
             self.accept()
 
@@ -1,6 +1,7 @@
 """Aircraft serviceability dialog."""
 from typing import Any
 
+from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import (
     QCheckBox,
     QComboBox,
@@ -18,9 +19,12 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
-from app.ui.widgets.groups import PodrGroup
-from app.ui.widgets.tables import IspravnostTable, IspravnostTableModel
-from data.models.aircraft import GroupBase, PlaneBase, PodrazdBase
+from app.services.catalog import get_catalog
+from app.ui.widgets.busy import BusyIndicator
+from app.ui.widgets.fleet_grid import FleetGridModel
+from app.ui.widgets.groups import PodrGridGroup
+from app.ui.widgets.tables import IspravnostTable
+from data.models.aircraft import GroupBase, PlaneBase
 from data.models.failures import OtkazAgregateBase
 
 
@@ -28,45 +32,54 @@ class IspravnostFrame(QFrame):
     """Frame displaying aircraft by division."""
     def __init__(self) -> None:
         super().__init__()
+        self.fleet_model = FleetGridModel()
         self.podr_layout = QGridLayout()
         self.setLayout(self.podr_layout)
+        self._groups: dict[int, PodrGridGroup] = {}
+        self._group_order: list[int] = []
         self.load_data()
 
     def load_data(self) -> None:
-        """Load divisions with aircraft."""
-
-
-        podr_data = PodrazdBase.select()
-        for i, podr in enumerate(podr_data):
-            group = PodrGroup(podr)
-            group.open_signal.connect(self.open_dialog)
-            row = i // 2
-            col = i % 2
-            self.podr_layout.addWidget(group, row, col)
-
-    def open_dialog(self, btn: Any) -> None:
-        """Open aircraft serviceability dialog."""
-
-        dialog = PlaneIspravnost(btn.plane)
-        dialog.exec()
-        btn.update_color()
-
-    def clear_layout(self, layout: QGridLayout) -> None:
-        """Clear all widgets from layout."""
-        while layout.count():
-            item = layout.takeAt(0)
-            widget = item.widget() # type: ignore
-
-            if widget is not None:
-                widget.deleteLater()
+        """Sync division group boxes with the fleet model, keyed by division id."""
+        podrazd_ids = [
+            self.fleet_model.index(i, 0).data(Qt.ItemDataRole.UserRole).id
+            for i in range(self.fleet_model.rowCount())
+        ]
+
+        for podrazd_id in set(self._groups) - set(podrazd_ids):
+            group = self._groups.pop(podrazd_id)
+            self.podr_layout.removeWidget(group)
+            group.deleteLater()
+
+        for podrazd_id in podrazd_ids:
+            group = self._groups.get(podrazd_id)
+            if group is None:
+                group = PodrGridGroup(self.fleet_model, podrazd_id)
+                group.open_signal.connect(self.open_dialog)
+                self._groups[podrazd_id] = group
             else:
-                sublayout = item.layout() # type: ignore
-                if sublayout is not None:
-                    self.clear_layout(sublayout) # type: ignore
+                group.update_title()
+
+        if podrazd_ids != self._group_order:
+            for podrazd_id in podrazd_ids:
+                self.podr_layout.removeWidget(self._groups[podrazd_id])
+            for i, podrazd_id in enumerate(podrazd_ids):
+                row = i // 2
+                col = i % 2
+                self.podr_layout.addWidget(self._groups[podrazd_id], row, col)
+            self._group_order = podrazd_ids
+
+    def open_dialog(self, plane: PlaneBase, otkaz_id: int | None = None) -> None:
+        """Open aircraft serviceability dialog, optionally with a failure selected."""
+        dialog = PlaneIspravnost(plane)
+        if otkaz_id is not None:
+            dialog.table_view.select_otkaz(otkaz_id)
+        dialog.exec()
+        self.fleet_model.refresh_plane(plane.id)
 
     def update_podr(self) -> None:
-        """Update divisions display."""
-        self.clear_layout(self.podr_layout)
+        """Update divisions display, touching only changed divisions and tiles."""
+        self.fleet_model.sync()
         self.load_data()
 
 
@@ -85,15 +98,15 @@ class PlaneIspravnost(QDialog):
         self.control_layout = QHBoxLayout(self.control_panel)
 
         self.filter_combo = QComboBox()
-        self.filter_combo.addItem("Все группы")
-        groups = GroupBase.select().order_by(GroupBase.name)
-        for group in groups:
-            self.filter_combo.addItem(group.name)
-        self.filter_combo.currentTextChanged.connect(self.filter_by_category)
+        self.filter_combo.addItem("Все группы", None)
+        for group in get_catalog().children(GroupBase, self.plane.plane_type_id):
+            self.filter_combo.addItem(group.name, group.id)
+        self.filter_combo.currentIndexChanged.connect(self.filter_by_category)
 
         self.control_layout.addWidget(QLabel("Фильтр по группе:"))
         self.control_layout.addWidget(self.filter_combo)
         self.control_layout.addStretch()
+        self.control_layout.addWidget(BusyIndicator())
 
         self.add_btn = QPushButton("➕ Добавить блок / агрегат")
         self.add_btn.clicked.connect(self.add_item)
@@ -103,24 +116,24 @@ class PlaneIspravnost(QDialog):
         self.table_view = IspravnostTable(plane=plane)
         self.table_view.edit_signal.connect(self.edit_item)
         self.table_view.delete_signal.connect(self.delete_item)
+        self.finished.connect(self.table_view.table_model.cancel_load)
         self.setup_ui()
-        self.load_data()
 
-    def filter_by_category(self, category: str) -> None:
-        """Filter table by category."""
-        self.load_data(category_filter=category)
+    def filter_by_category(self) -> None:
+        """Filter table by the selected group without reloading it."""
+        self.table_view.set_group_filter(self.filter_combo.currentData())
 
     def edit_item(self, item: Any) -> None:
         """Edit failure item."""
         dialog = AddOtkazDialog(plane=self.plane, item=item)
         if dialog.exec():
-            self.refresh_data()
+            self.table_view.table_model.upsert_row(dialog.item.id)
 
     def add_item(self) -> None:
         """Add new failure item."""
         dialog = AddOtkazDialog(plane=self.plane)
         if dialog.exec():
-            self.refresh_data()
+            self.table_view.table_model.upsert_row(dialog.item.id)
 
     def delete_item(self, item: Any) -> None:
         """Delete failure item."""
@@ -132,8 +145,8 @@ class PlaneIspravnost(QDialog):
         )
         if reply == QMessageBox.StandardButton.Yes:
             try:
-                item.delete_instance()
-                self.refresh_data()
+                OtkazAgregateBase.run_in_transaction(item.delete_instance)
+                self.table_view.table_model.remove_row(item.id)
             except Exception as e:
                 QMessageBox.warning(self, "Ошибка", f"Не удалось удалить элемент: {str(e)}")
 
@@ -143,13 +156,12 @@ class PlaneIspravnost(QDialog):
 
     def on_double_click(self, index: Any) -> None:
         """Handle double click on table row."""
-        model = self.table_view.model()
-        if isinstance(model, IspravnostTableModel):
-            item = model.get_item(index)
-            if item:
-                dialog = AddOtkazDialog(plane=self.plane, item=item)
-                if dialog.exec():
-                    self.refresh_data()
+        model = self.table_view.table_model
+        item = model.fetch_item(index.data(Qt.ItemDataRole.UserRole))
+        if item:
+            dialog = AddOtkazDialog(plane=self.plane, item=item)
+            if dialog.exec():
+                model.upsert_row(dialog.item.id)
 
     def setup_ui(self) -> None:
         """Setup UI components."""
@@ -159,10 +171,9 @@ class PlaneIspravnost(QDialog):
         self.table_view.setSortingEnabled(False)
         self.table_view.doubleClicked.connect(self.on_double_click)
 
-    def load_data(self, category_filter: str | None = None) -> None:
-        """Load failure data."""
+    def load_data(self) -> None:
+        """Reload failure data; the group filter stays applied."""
         self.table_view.load_data()
-        self.table_view.set_span_for_groups()
 
 
 class AddOtkazDialog(QDialog):
@@ -281,14 +292,15 @@ class AddOtkazDialog(QDialog):
                 self.item.number = self.agregate_number.text() # type: ignore
                 self.item.removed = self.remove_checkbox.isChecked() # type: ignore
                 self.item.description = self.desc.text() # type: ignore
-                self.item.save()
+                OtkazAgregateBase.run_in_transaction(self.item.save)
                 self.accept()
             except Exception as e:
                 QMessageBox.warning(self, "Ошибка", f"Не удалось изменить агрегат/блок: {str(e)}")
         else:
             try:
                 agregate = self.agregate_combo.currentData()
-                OtkazAgregateBase.create(
+                self.item = OtkazAgregateBase.run_in_transaction(
+                    OtkazAgregateBase.create,
                     agregate=agregate,
                     plane=self.plane.id,
                     number=self.agregate_number.text(),
@@ -0,0 +1,107 @@
+"""Debug dialog showing SQL statement statistics."""
+from typing import Any
+
+from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtGui import QBrush, QColor
+from PyQt6.QtWidgets import (
+    QDialog,
+    QHBoxLayout,
+    QHeaderView,
+    QLabel,
+    QPushButton,
+    QTableWidget,
+    QTableWidgetItem,
+    QVBoxLayout,
+)
+
+from app.database import IASDatabase, QueryRecorder, get_database
+
+
+class QueryStatsDialog(QDialog):
+    """Records statements of the application database while recording is on.
+
+    Reset before a user action and look at the table after it: rows are
+    statements grouped by shape; rows where one identical statement ran
+    more than once (the N+1 signature) are highlighted.
+    """
+
+    HEADERS: list[str] = ["Запрос", "Кол-во", "Всего, мс", "Макс, мс", "Повторы"]
+    REPEATED_COLOR = QColor(255, 220, 220)
+    REFRESH_INTERVAL = 1000
+
+    def __init__(self, database: IASDatabase | None = None, parent: Any | None = None) -> None:
+        super().__init__(parent)
+        self.setWindowTitle("Статистика SQL-запросов")
+        self.setGeometry(150, 150, 900, 500)
+        self.database = database or get_database()
+        self.recorder = QueryRecorder()
+
+        self.summary = QLabel()
+        self.table = QTableWidget(0, len(self.HEADERS))
+        self.table.setHorizontalHeaderLabels(self.HEADERS)
+        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)  # type: ignore
+
+        self.record_btn = QPushButton("Запись")
+        self.record_btn.setCheckable(True)
+        self.record_btn.toggled.connect(self.set_recording)
+        self.clear_btn = QPushButton("Сбросить")
+        self.clear_btn.clicked.connect(self.clear)
+
+        button_layout = QHBoxLayout()
+        button_layout.addWidget(self.record_btn)
+        button_layout.addWidget(self.clear_btn)
+        button_layout.addStretch()
+
+        layout = QVBoxLayout()
+        layout.addLayout(button_layout)
+        layout.addWidget(self.summary)
+        layout.addWidget(self.table)
+        self.setLayout(layout)
+
+        self.timer = QTimer(self)
+        self.timer.setInterval(self.REFRESH_INTERVAL)
+        self.timer.timeout.connect(self.refresh)
+        self.finished.connect(lambda result: self.record_btn.setChecked(False))
+        self.refresh()
+
+    def set_recording(self, recording: bool) -> None:
+        """Attach or detach the recorder."""
+        if recording and self.recorder not in self.database.recorders:
+            self.database.recorders.append(self.recorder)
+            self.timer.start()
+        elif not recording and self.recorder in self.database.recorders:
+            self.database.recorders.remove(self.recorder)
+            self.timer.stop()
+        self.refresh()
+
+    def clear(self) -> None:
+        """Drop recorded statements."""
+        self.recorder.clear()
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Show recorded statistics, most frequent statements first."""
+        recorder = self.recorder
+        self.summary.setText(
+            f"Запросов: {recorder.count}, всего {recorder.total_time * 1000:.1f} мс, "
+            f"макс. {recorder.max_time * 1000:.1f} мс, повторяющихся: {len(recorder.repeated())}"
+        )
+        groups = sorted(recorder.groups.values(), key=lambda group: -group.count)
+        self.table.setRowCount(len(groups))
+        for row, group in enumerate(groups):
+            values = [
+                group.sql,
+                group.count,
+                f"{group.total_time * 1000:.1f}",
+                f"{group.max_time * 1000:.1f}",
+                group.max_identical if group.max_identical > 1 else "",
+            ]
+            for col, value in enumerate(values):
+                item = QTableWidgetItem(str(value))
+                if col:
+                    item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+                if group.max_identical > 1:
+                    item.setBackground(QBrush(self.REPEATED_COLOR))
+                self.table.setItem(row, col, item)
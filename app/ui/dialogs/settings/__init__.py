@@ -1,13 +1,36 @@
 """Settings dialogs for managing reference data."""
+from typing import TYPE_CHECKING
 
-from app.ui.dialogs.settings.agregate import AddAgregate, SettingsAgregate
-from app.ui.dialogs.settings.base import SingleFieldMixin, UnAddEditDialog, UnDialog
-from app.ui.dialogs.settings.group import AddGroup, SettingsGroup
-from app.ui.dialogs.settings.osob import SettingsOsob
-from app.ui.dialogs.settings.plane_type import AddPlaneType, SettingsPlaneType
-from app.ui.dialogs.settings.planes import AddPlane, SettingsPlanes
-from app.ui.dialogs.settings.podrazd import AddPodrazd, SettingsPodrazd
-from app.ui.dialogs.settings.systems import AddSystem, SettingsSystem
+from app.ui.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from app.ui.dialogs.settings.agregate import AddAgregate, SettingsAgregate
+    from app.ui.dialogs.settings.base import SingleFieldMixin, UnAddEditDialog, UnDialog
+    from app.ui.dialogs.settings.group import AddGroup, SettingsGroup
+    from app.ui.dialogs.settings.osob import SettingsOsob
+    from app.ui.dialogs.settings.plane_type import AddPlaneType, SettingsPlaneType
+    from app.ui.dialogs.settings.planes import AddPlane, SettingsPlanes
+    from app.ui.dialogs.settings.podrazd import AddPodrazd, SettingsPodrazd
+    from app.ui.dialogs.settings.systems import AddSystem, SettingsSystem
+
+__getattr__ = lazy_exports(__name__, {
+    "UnDialog": ".base",
+    "UnAddEditDialog": ".base",
+    "SingleFieldMixin": ".base",
+    "SettingsPlaneType": ".plane_type",
+    "SettingsPodrazd": ".podrazd",
+    "SettingsGroup": ".group",
+    "SettingsSystem": ".systems",
+    "SettingsAgregate": ".agregate",
+    "SettingsPlanes": ".planes",
+    "SettingsOsob": ".osob",
+    "AddPlaneType": ".plane_type",
+    "AddPodrazd": ".podrazd",
+    "AddGroup": ".group",
+    "AddSystem": ".systems",
+    "AddAgregate": ".agregate",
+    "AddPlane": ".planes",
+})
 
 __all__ = [
     # Base classes
@@ -23,18 +23,23 @@ class SettingsAgregate(UnDialog):
         self.plane_type_combo = PlaneTypeComboBox()
         self.group_combo = GroupComboBox()
         self.system_combo = SystemComboBox()
+        self.name_filter = QLineEdit()
+        self.name_filter.setPlaceholderText("Фильтр по началу названия")
+        self.name_filter.setClearButtonEnabled(True)
 
         self.plane_type_combo.changed.connect(self.group_combo.set_filter)
         self.group_combo.changed.connect(self.system_combo.set_filter)
 
         self.plane_type_combo.currentTextChanged.connect(self.on_data_changed)
         self.system_combo.currentTextChanged.connect(self.on_data_changed)
+        self.name_filter.textChanged.connect(self.on_data_changed)
 
         self.setup_ui(AgregateTable)
 
         self.main_layout.insertWidget(0, self.plane_type_combo)
         self.main_layout.insertWidget(1, self.group_combo)
         self.main_layout.insertWidget(2, self.system_combo)
+        self.main_layout.insertWidget(3, self.name_filter)
 
     def get_filter_params(self) -> dict[str, Any]:
         """Get current filter parameters."""
@@ -45,34 +50,28 @@ class SettingsAgregate(UnDialog):
         }
 
     def on_data_changed(self) -> None:
-        self.refresh_data(**self.get_filter_params())
+        self.refresh_data(**self.get_filter_params(), name_prefix=self.name_filter.text().strip() or None)
 
     def add_item(self) -> None:
         filters = self.get_filter_params()
         dialog = AddAgregate(self)
-        dialog.updated.connect(self.refresh_data)
+        dialog.updated.connect(lambda: self.item_saved(dialog.saved_item))
         dialog.add_dialog(**filters)
         if dialog.exec():
             self.update_after_dialog(dialog)
 
     def edit_item(self, item: Any) -> None:
         dialog = AddAgregate(self)
-        dialog.updated.connect(self.refresh_data)
+        dialog.updated.connect(lambda: self.item_saved(dialog.saved_item))
         dialog.edit_dialog(item)
         if dialog.exec():
             self.update_after_dialog(dialog)
 
-    def delete_item(self, item: Any) -> None:
-        self.table.table_model.delete_item(item)
-        self.refresh_data(**self.get_filter_params())
-        self.updated.emit()
-
     def update_after_dialog(self, dialog: "AddAgregate") -> None:
-        """Synchronize filters with dialog and refresh table."""
+        """Synchronize filters with dialog; the table reloads only if they changed."""
         self.plane_type_combo.setCurrentText(dialog.type_combo.currentText())
         self.group_combo.setCurrentText(dialog.group_combo.currentText())
         self.system_combo.setCurrentText(dialog.system_combo.currentText())
-        self.refresh_data(**self.get_filter_params())
 
 
 class AddAgregate(UnAddEditDialog):
@@ -176,12 +175,7 @@ class AddAgregate(UnAddEditDialog):
             self.show_error("Некорректная система: проверьте, что система выбрана корректно")
             return
 
-        if self.item:
-            self.item.name = name
-            self.item.system = system
-            self.item.save()
-        else:
-            AgregateBase.create(name=name, system=system)
+        self.save_or_create(AgregateBase, name=name, system=system)
 
         self.updated.emit()
         self.accept()
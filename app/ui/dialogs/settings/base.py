@@ -13,6 +13,9 @@ from PyQt6.QtWidgets import (
     QVBoxLayout,
 )
 
+from app.services.catalog import invalidate_catalog
+from app.ui.widgets.busy import BusyIndicator
+
 
 class UnDialog(QDialog):
     """Base dialog for viewing and editing reference data."""
@@ -34,12 +37,14 @@ class UnDialog(QDialog):
         self.button_layout = QHBoxLayout()
         self.button_layout.addWidget(self.btn_ok)
         self.button_layout.addWidget(self.btn_add)
+        self.button_layout.addWidget(BusyIndicator())
 
     def setup_ui(self, table_class: type, table_kwargs: dict | None = None) -> None:
         """Initialize table and connect signals."""
         self.table = table_class(**(table_kwargs or {}))
         self.table.edit_signal.connect(self.edit_item)
         self.table.delete_signal.connect(self.delete_item)
+        self.finished.connect(self.table.table_model.cancel_load)
         self.main_layout.insertWidget(0, self.table)
         self.main_layout.addLayout(self.button_layout)
 
@@ -52,20 +57,27 @@ class UnDialog(QDialog):
         raise NotImplementedError()
 
     def delete_item(self, item: Any) -> None:
-        """Override in subclasses."""
-        raise NotImplementedError()
+        """Delete item and drop its row from the table."""
+        self.table.table_model.delete_item(item)
+        self.table.table_model.remove_row(item.id)
+        self.updated.emit()
 
     def refresh_data(self, **kwargs: Any) -> None:
         """Refresh table data."""
         if hasattr(self.table, "table_model"):
             self.table.table_model.load_data(**kwargs)
 
+    def item_saved(self, item: Any | None) -> None:
+        """Show a saved item in the table without reloading it."""
+        if item is not None:
+            self.table.table_model.upsert_row(item.id)
+
     def handle_dialog(
         self, dialog_class: type, method: str = "add", item: Any | None = None, **dialog_kwargs: Any
     ) -> QDialog | None:
         """Common method for opening add/edit dialogs."""
         dialog = dialog_class(self)
-        dialog.updated.connect(self.refresh_data)
+        dialog.updated.connect(lambda: self.item_saved(dialog.saved_item))
 
         if method == "add":
             dialog.add_dialog(**dialog_kwargs)
@@ -86,6 +98,7 @@ class UnAddEditDialog(QDialog):
     def __init__(self, parent: Any | None = None) -> None:
         super().__init__(parent)
         self.item: Any | None = None
+        self.saved_item: Any | None = None
         self.setModal(True)
         self.setFixedWidth(400)
         self.main_layout = QVBoxLayout()
@@ -117,6 +130,21 @@ class UnAddEditDialog(QDialog):
         self.item = item
         self.btn_ok.setText("Сохранить")
 
+    def save_or_create(self, model: Any, **fields: Any) -> Any:
+        """Update edited item or create a new one in one retried transaction, then drop cached catalog."""
+        def save() -> Any:
+            if self.item is None:
+                return model.create(**fields)
+            for name, value in fields.items():
+                setattr(self.item, name, value)
+            self.item.save()
+            return self.item
+
+        item = model.run_in_transaction(save)
+        invalidate_catalog()
+        self.saved_item = item
+        return item
+
     def show_error(self, message: str) -> None:
         """Show error message."""
         QMessageBox.warning(self, "Ошибка", message)
@@ -29,11 +29,6 @@ class SettingsGroup(UnDialog):
     def edit_item(self, item: Any) -> None:
         self.handle_dialog(AddGroup, "edit", item)
 
-    def delete_item(self, item: Any) -> None:
-        self.table.table_model.delete_item(item)
-        self.refresh_data()
-        self.updated.emit()
-
 
 class AddGroup(UnAddEditDialog):
     """Dialog for adding/editing maintenance group."""
@@ -69,12 +64,7 @@ class AddGroup(UnAddEditDialog):
             self.show_error("Выберите тип самолета")
             return
 
-        if self.item:
-            self.item.name = name
-            self.item.plane_type = plane_type
-            self.item.save()
-        else:
-            GroupBase.create(name=name, plane_type=plane_type)
+        self.save_or_create(GroupBase, name=name, plane_type=plane_type)
 
         self.updated.emit()
         self.accept()
@@ -31,7 +31,7 @@ class SettingsOsob(UnDialog):
         from app.ui.dialogs.osob_features import OsobFeatureDialog
 
         dialog = OsobFeatureDialog(parent=self)
-        dialog.updated.connect(self.refresh_data)
+        dialog.updated.connect(lambda: self.item_saved(dialog.osob))
         if dialog.exec():
             self.updated.emit()
 
@@ -39,11 +39,6 @@ class SettingsOsob(UnDialog):
         from app.ui.dialogs.osob_features import OsobFeatureDialog
 
         dialog = OsobFeatureDialog(osob=item, parent=self)
-        dialog.updated.connect(self.refresh_data)
+        dialog.updated.connect(lambda: self.item_saved(dialog.osob))
         if dialog.exec():
             self.updated.emit()
-
-    def delete_item(self, item: Any) -> None:
-        self.table.table_model.delete_item(item)
-        self.refresh_data()
-        self.updated.emit()
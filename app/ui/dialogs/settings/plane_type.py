@@ -21,11 +21,6 @@ class SettingsPlaneType(UnDialog):
     def edit_item(self, item: Any) -> None:
         self.handle_dialog(AddPlaneType, "edit", item)
 
-    def delete_item(self, item: Any) -> None:
-        self.table.table_model.delete_item(item)
-        self.refresh_data()
-        self.updated.emit()
-
 
 class AddPlaneType(SingleFieldMixin, UnAddEditDialog):
     """Dialog for adding/editing aircraft type."""
@@ -45,11 +40,7 @@ class AddPlaneType(SingleFieldMixin, UnAddEditDialog):
             self.show_error("Название не может быть пустым")
             return
 
-        if self.item:
-            self.item.name = name
-            self.item.save()
-        else:
-            TypeBase.create(name=name)
+        self.save_or_create(TypeBase, name=name)
 
         self.updated.emit()
         self.accept()
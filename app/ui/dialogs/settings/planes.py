@@ -40,11 +40,6 @@ class SettingsPlanes(UnDialog):
     def edit_item(self, item: Any) -> None:
         self.handle_dialog(AddPlane, "edit", item)
 
-    def delete_item(self, item: Any) -> None:
-        self.table.table_model.delete_item(item)
-        self.refresh_data()
-        self.updated.emit()
-
 
 class AddPlane(UnAddEditDialog):
     """Dialog for adding/editing aircraft."""
@@ -107,23 +102,18 @@ class AddPlane(UnAddEditDialog):
             self.show_error("Выберите подразделение")
             return
 
-        if self.item:
-            plane = self.item
-            plane.plane_type = plane_type
-            plane.podrazd = podrazd
-            plane.bort_number = bort
-            plane.zav_num = zav
-            plane.save()
-        else:
-            plane = PlaneBase.create(
+        def save() -> None:
+            plane = self.save_or_create(
+                PlaneBase,
                 plane_type=plane_type,
                 podrazd=podrazd,
                 bort_number=bort,
                 zav_num=zav,
             )
+            # Сохраняем выбранные модернизации
+            self.osob_group.save_osobs(plane)
 
-        # Сохраняем выбранные модернизации
-        self.osob_group.save_osobs(plane)
+        PlaneBase.run_in_transaction(save)
 
         self.updated.emit()
         self.accept()
@@ -21,11 +21,6 @@ class SettingsPodrazd(UnDialog):
     def edit_item(self, item: Any) -> None:
         self.handle_dialog(AddPodrazd, "edit", item)
 
-    def delete_item(self, item: Any) -> None:
-        self.table.table_model.delete_item(item)
-        self.refresh_data()
-        self.updated.emit()
-
 
 class AddPodrazd(SingleFieldMixin, UnAddEditDialog):
     """Dialog for adding/editing division."""
@@ -45,11 +40,7 @@ class AddPodrazd(SingleFieldMixin, UnAddEditDialog):
             self.show_error("Название не может быть пустым")
             return
 
-        if self.item:
-            self.item.name = name
-            self.item.save()
-        else:
-            PodrazdBase.create(name=name)
+        self.save_or_create(PodrazdBase, name=name)
 
         self.updated.emit()
         self.accept()
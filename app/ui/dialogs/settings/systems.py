@@ -50,11 +50,6 @@ class SettingsSystem(UnDialog):
     def edit_item(self, item: Any) -> None:
         self.handle_dialog(AddSystem, "edit", item)
 
-    def delete_item(self, item: Any) -> None:
-        self.table.table_model.delete_item(item)
-        self.refresh_data()
-        self.updated.emit()
-
 
 class AddSystem(UnAddEditDialog):
     """Dialog for adding/editing aircraft system."""
@@ -131,13 +126,7 @@ class AddSystem(UnAddEditDialog):
         # Explicitly fetch plane_type to avoid lazy loading issues
         plane_type = group.plane_type
 
-        if self.item:
-            self.item.name = name
-            self.item.group = group
-            self.item.plane_type = plane_type
-            self.item.save()
-        else:
-            SystemBase.create(name=name, group=group, plane_type=plane_type)
+        self.save_or_create(SystemBase, name=name, group=group, plane_type=plane_type)
 
         self.updated.emit()
         self.accept()
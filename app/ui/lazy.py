@@ -0,0 +1,21 @@
+"""Lazy re-exports for UI packages."""
+from collections.abc import Callable
+from importlib import import_module
+from typing import Any
+
+
+def lazy_exports(package: str, exports: dict[str, str]) -> Callable[[str], Any]:
+    """Make a module ``__getattr__`` importing names from their modules on first access.
+
+    ``exports`` maps a name to the module defining it, relative to
+    ``package``. Importing one module of a package then no longer imports
+    all of them, which keeps application startup short.
+    """
+
+    def __getattr__(name: str) -> Any:
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        return getattr(import_module(module, package), name)
+
+    return __getattr__
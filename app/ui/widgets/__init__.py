@@ -1,19 +1,49 @@
 """Custom widgets package."""
-from app.ui.widgets.buttons import IASButton, PlaneBtn
-from app.ui.widgets.combo_box import (
-    AgregateComboBox,
-    ComboBoxModel,
-    GroupComboBox,
-    IASComboBox,
-    PlaneTypeComboBox,
-    PodrazdComboBox,
-    SystemComboBox,
-)
-from app.ui.widgets.groups import PodrGroup
+from typing import TYPE_CHECKING
+
+from app.ui.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from app.ui.widgets.busy import BusyIndicator
+    from app.ui.widgets.buttons import IASButton
+    from app.ui.widgets.check_tree import CatalogCheckModel, CatalogCheckTree
+    from app.ui.widgets.combo_box import (
+        AgregateComboBox,
+        ComboBoxModel,
+        GroupComboBox,
+        IASComboBox,
+        PlaneTypeComboBox,
+        PodrazdComboBox,
+        SystemComboBox,
+    )
+    from app.ui.widgets.fleet_grid import FleetGridModel, FleetGridView, PlaneTileDelegate
+    from app.ui.widgets.groups import PodrGridGroup
+    from app.ui.widgets.search_panel import SearchPanel
+
+__getattr__ = lazy_exports(__name__, {
+    "BusyIndicator": ".busy",
+    "IASButton": ".buttons",
+    "CatalogCheckModel": ".check_tree",
+    "CatalogCheckTree": ".check_tree",
+    "IASComboBox": ".combo_box",
+    "ComboBoxModel": ".combo_box",
+    "PlaneTypeComboBox": ".combo_box",
+    "PodrazdComboBox": ".combo_box",
+    "GroupComboBox": ".combo_box",
+    "SystemComboBox": ".combo_box",
+    "AgregateComboBox": ".combo_box",
+    "PodrGridGroup": ".groups",
+    "FleetGridModel": ".fleet_grid",
+    "FleetGridView": ".fleet_grid",
+    "PlaneTileDelegate": ".fleet_grid",
+    "SearchPanel": ".search_panel",
+})
 
 __all__ = [
+    "BusyIndicator",
     "IASButton",
-    "PlaneBtn",
+    "CatalogCheckModel",
+    "CatalogCheckTree",
     "IASComboBox",
     "ComboBoxModel",
     "PlaneTypeComboBox",
@@ -21,5 +51,9 @@ __all__ = [
     "GroupComboBox",
     "SystemComboBox",
     "AgregateComboBox",
-    "PodrGroup",
+    "PodrGridGroup",
+    "FleetGridModel",
+    "FleetGridView",
+    "PlaneTileDelegate",
+    "SearchPanel",
 ]
@@ -0,0 +1,19 @@
+"""Busy indicator for background database work."""
+from typing import Any
+
+from PyQt6.QtWidgets import QProgressBar
+
+from app.services.db_worker import get_executor
+
+
+class BusyIndicator(QProgressBar):
+    """Indeterminate progress bar visible while the database worker is busy."""
+
+    def __init__(self, parent: Any | None = None) -> None:
+        super().__init__(parent)
+        self.setRange(0, 0)
+        self.setTextVisible(False)
+        self.setFixedSize(100, 12)
+        executor = get_executor()
+        executor.busy_changed.connect(self.setVisible)
+        self.setVisible(executor.is_busy())
@@ -0,0 +1,280 @@
+"""Checkable catalog tree (group → system → agregate) for feature editing."""
+from collections.abc import Iterable
+from typing import Any
+
+from PyQt6.QtCore import QAbstractItemModel, QModelIndex, QSortFilterProxyModel, Qt, pyqtSignal
+from PyQt6.QtWidgets import QTreeView
+from peewee import Model
+
+from app.services.catalog import get_catalog
+from data.models.aircraft import AgregateBase, GroupBase, SystemBase
+
+LEVELS: list[type[Model]] = [GroupBase, SystemBase, AgregateBase]
+
+
+class CatalogCheckModel(QAbstractItemModel):
+    """Tree of catalog items of a type down to ``leaf_model``, with checkable leaves.
+
+    Nodes are kept in flat lists addressed by position (the index internalId)
+    with a (level, id) -> position index, so parent lookups never query the
+    database. Checked state is the set of checked leaf ids; parents are
+    tri-state, derived from per-node counts of checked leaves. Changes are
+    applied in batches: ``checked_changed`` carries all leaf ids changed by
+    one action and each affected row range is refreshed once.
+    """
+
+    checked_changed = pyqtSignal(list, bool)
+
+    def __init__(self, leaf_model: type[Model] = AgregateBase, parent: Any | None = None) -> None:
+        super().__init__(parent)
+        self.leaf_model = leaf_model
+        self._depth = LEVELS.index(leaf_model)
+        self._reset_nodes()
+
+    def clear(self) -> None:
+        """Remove all nodes."""
+        self.beginResetModel()
+        self._reset_nodes()
+        self.endResetModel()
+
+    def _reset_nodes(self) -> None:
+        """Drop node storage."""
+        self._level: list[int] = []
+        self._ids: list[int] = []
+        self._names: list[str] = []
+        self._parent: list[int] = []
+        self._row: list[int] = []
+        self._children: list[list[int]] = []
+        self._roots: list[int] = []
+        self._leaf_count: list[int] = []
+        self._checked_count: list[int] = []
+        self._positions: dict[tuple[int, int], int] = {}
+        self._checked: set[int] = set()
+
+    def load(self, plane_type: Any, checked: Iterable[int] = ()) -> None:
+        """Build the tree for an aircraft type from the catalog cache."""
+        self.beginResetModel()
+        self._reset_nodes()
+        catalog = get_catalog()
+        for group in catalog.children(GroupBase, plane_type):
+            self._add_branch(catalog, group, 0, -1)
+        self._positions = {
+            (level, item_id): position for position, (level, item_id) in enumerate(zip(self._level, self._ids))
+        }
+        for leaf_id in set(checked):
+            position = self._positions.get((self._depth, leaf_id))
+            if position is not None:
+                self._checked.add(leaf_id)
+                self._count_checked(position, 1)
+        self.endResetModel()
+
+    def _add_branch(self, catalog: Any, item: Model, level: int, parent: int) -> int:
+        """Add item and its descendants; skip branches without leaves."""
+        position = len(self._ids)
+        self._level.append(level)
+        self._ids.append(item.id)
+        self._names.append(item.name)
+        self._parent.append(parent)
+        self._row.append(0)
+        self._children.append([])
+        self._leaf_count.append(1 if level == self._depth else 0)
+        self._checked_count.append(0)
+
+        if level < self._depth:
+            for child in catalog.children(LEVELS[level + 1], item):
+                child_position = self._add_branch(catalog, child, level + 1, position)
+                if child_position >= 0:
+                    self._row[child_position] = len(self._children[position])
+                    self._children[position].append(child_position)
+                    self._leaf_count[position] += self._leaf_count[child_position]
+            if not self._leaf_count[position]:
+                self._truncate(position)
+                return -1
+
+        if parent < 0:
+            self._row[position] = len(self._roots)
+            self._roots.append(position)
+        return position
+
+    def _truncate(self, position: int) -> None:
+        """Drop nodes from position on (an empty branch added last)."""
+        for name in ("_level", "_ids", "_names", "_parent", "_row", "_children", "_leaf_count", "_checked_count"):
+            del getattr(self, name)[position:]
+
+    def _count_checked(self, position: int, delta: int) -> None:
+        """Update checked leaf counts of a node and its ancestors."""
+        while position >= 0:
+            self._checked_count[position] += delta
+            position = self._parent[position]
+
+    def _index_of(self, position: int) -> QModelIndex:
+        """Get index of a node."""
+        return self.createIndex(self._row[position], 0, position)
+
+    def _leaf_positions(self, position: int) -> list[int]:
+        """Get leaf nodes under a node."""
+        if self._level[position] == self._depth:
+            return [position]
+        leaves: list[int] = []
+        for child in self._children[position]:
+            leaves.extend(self._leaf_positions(child))
+        return leaves
+
+    def checked_ids(self) -> set[int]:
+        """Get ids of checked leaves."""
+        return set(self._checked)
+
+    def is_checked(self, leaf_id: int) -> bool:
+        """Check if a leaf is checked."""
+        return leaf_id in self._checked
+
+    def leaf_ids(self, model: type[Model], item_id: int) -> list[int]:
+        """Get leaf ids under a catalog item of the tree."""
+        position = self._positions.get((LEVELS.index(model), item_id))
+        if position is None:
+            return []
+        return [self._ids[leaf] for leaf in self._leaf_positions(position)]
+
+    def parent_id(self, model: type[Model], item_id: int) -> int | None:
+        """Get id of the parent node of a catalog item."""
+        position = self._positions.get((LEVELS.index(model), item_id))
+        if position is None or self._parent[position] < 0:
+            return None
+        return self._ids[self._parent[position]]
+
+    def check_state(self, model: type[Model], item_id: int) -> Qt.CheckState:
+        """Get check state of a catalog item of the tree."""
+        position = self._positions.get((LEVELS.index(model), item_id))
+        if position is None:
+            return Qt.CheckState.Unchecked
+        return self._state(position)
+
+    def _state(self, position: int) -> Qt.CheckState:
+        """Derive check state from checked leaf count."""
+        checked = self._checked_count[position]
+        if not checked:
+            return Qt.CheckState.Unchecked
+        if checked == self._leaf_count[position]:
+            return Qt.CheckState.Checked
+        return Qt.CheckState.PartiallyChecked
+
+    def set_checked(self, leaf_id: int, checked: bool) -> None:
+        """Check or uncheck a leaf."""
+        self.set_checked_many([leaf_id], checked)
+
+    def set_checked_many(self, leaf_ids: Iterable[int], checked: bool) -> None:
+        """Check or uncheck leaves as one batch."""
+        positions = (self._positions.get((self._depth, leaf_id)) for leaf_id in leaf_ids)
+        self._set_leaves([position for position in positions if position is not None], checked)
+
+    def _set_leaves(self, positions: list[int], checked: bool) -> None:
+        """Change leaf states, then refresh changed rows and their ancestors once and notify once."""
+        changed = [position for position in positions if (self._ids[position] in self._checked) != checked]
+        if not changed:
+            return
+
+        rows: dict[int, list[int]] = {}
+        for position in changed:
+            if checked:
+                self._checked.add(self._ids[position])
+            else:
+                self._checked.discard(self._ids[position])
+            self._count_checked(position, 1 if checked else -1)
+            rows.setdefault(self._parent[position], []).append(self._row[position])
+
+        ancestors: set[int] = set()
+        for parent, parent_rows in rows.items():
+            parent_index = self._index_of(parent) if parent >= 0 else QModelIndex()
+            top = self.index(min(parent_rows), 0, parent_index)
+            bottom = self.index(max(parent_rows), 0, parent_index)
+            self.dataChanged.emit(top, bottom, [Qt.ItemDataRole.CheckStateRole])
+            while parent >= 0 and parent not in ancestors:
+                ancestors.add(parent)
+                parent = self._parent[parent]
+        for ancestor in sorted(ancestors, key=lambda position: -self._level[position]):
+            index = self._index_of(ancestor)
+            self.dataChanged.emit(index, index, [Qt.ItemDataRole.CheckStateRole])
+
+        self.checked_changed.emit([self._ids[position] for position in changed], checked)
+
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        """Create index for a child of parent."""
+        children = self._children[parent.internalId()] if parent.isValid() else self._roots
+        if column != 0 or not 0 <= row < len(children):
+            return QModelIndex()
+        return self.createIndex(row, column, children[row])
+
+    def parent(self, index: QModelIndex = QModelIndex()) -> QModelIndex:  # type: ignore[override]
+        """Get parent index."""
+        if not index.isValid():
+            return QModelIndex()
+        parent = self._parent[index.internalId()]
+        return self._index_of(parent) if parent >= 0 else QModelIndex()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Return number of children."""
+        if not parent.isValid():
+            return len(self._roots)
+        if parent.column() > 0:
+            return 0
+        return len(self._children[parent.internalId()])
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Return number of columns."""
+        return 1
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        """Return name, check state or id of a node."""
+        if not index.isValid():
+            return None
+        position = index.internalId()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._names[position]
+        if role == Qt.ItemDataRole.CheckStateRole:
+            return self._state(position)
+        if role == Qt.ItemDataRole.UserRole:
+            return self._ids[position]
+        return None
+
+    def setData(self, index: QModelIndex, value: Any, role: int = Qt.ItemDataRole.EditRole) -> bool:
+        """Check or uncheck a node; parents apply to all their leaves."""
+        if not index.isValid() or role != Qt.ItemDataRole.CheckStateRole:
+            return False
+        checked = Qt.CheckState(value) == Qt.CheckState.Checked
+        self._set_leaves(self._leaf_positions(index.internalId()), checked)
+        return True
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        """Return item flags."""
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsUserCheckable
+
+
+class CatalogCheckTree(QTreeView):
+    """Tree view of a CatalogCheckModel with a case-insensitive name filter."""
+
+    def __init__(self, check_model: CatalogCheckModel, parent: Any | None = None) -> None:
+        super().__init__(parent)
+        self.check_model = check_model
+        self.proxy = QSortFilterProxyModel(self)
+        self.proxy.setSourceModel(check_model)
+        self.proxy.setRecursiveFilteringEnabled(True)
+        self.proxy.setFilterCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        self.setModel(self.proxy)
+        self.setHeaderHidden(True)
+        self.setUniformRowHeights(True)
+        check_model.modelReset.connect(self.expand_default)
+
+    def expand_default(self) -> None:
+        """Expand groups only."""
+        self.collapseAll()
+        self.expandToDepth(0)
+
+    def set_filter_text(self, text: str) -> None:
+        """Show only items whose name (or a descendant's) contains text."""
+        self.proxy.setFilterFixedString(text)
+        if text:
+            self.expandAll()
+        else:
+            self.expand_default()
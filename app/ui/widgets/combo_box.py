@@ -4,11 +4,18 @@ from typing import Any
 from PyQt6.QtCore import QAbstractListModel, Qt, pyqtSignal
 from PyQt6.QtWidgets import QComboBox
 
+from app.collation import RUSSIAN
+from app.services.catalog import get_catalog
 from data.models.aircraft import AgregateBase, GroupBase, PodrazdBase, SystemBase, TypeBase
 
 
 class ComboBoxModel(QAbstractListModel):
-    """Model for combo boxes with Peewee ORM integration."""
+    """Model for combo boxes with Peewee ORM integration.
+
+    Catalog levels (type, group, system, agregate) filtered by their parent
+    are served from the shared catalog cache without querying the database.
+    Items come in Russian alphabetical order of the display field.
+    """
 
     def __init__(
         self,
@@ -40,7 +47,11 @@ class ComboBoxModel(QAbstractListModel):
         if self._custom_data is not None:
             return self._custom_data
 
-        query = self._peewee_model.select()
+        cached = get_catalog().select(self._peewee_model, self.filter)
+        if cached is not None:
+            return cached
+
+        query = self._peewee_model.select().order_by(getattr(self._peewee_model, self.display_field).collate(RUSSIAN))
         for key, value in self.filter.items():
             # Extract ID if value is a model instance
             filter_value = value.id if hasattr(value, 'id') else value
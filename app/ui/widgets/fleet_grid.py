@@ -0,0 +1,279 @@
+"""Model/view fleet grid: aircraft tiles grouped by division."""
+from typing import Any
+
+from PyQt6.QtCore import QAbstractItemModel, QModelIndex, QRectF, QSize, Qt, pyqtSignal
+from PyQt6.QtGui import QColor, QFont, QPainter
+from PyQt6.QtWidgets import QAbstractItemView, QListView, QStyle, QStyledItemDelegate, QStyleOptionViewItem
+
+from app.services.fleet_status import FleetStatusService, PlaneStatus
+from data.models.aircraft import PlaneBase, PodrazdBase
+
+
+class FleetGridModel(QAbstractItemModel):
+    """Two-level model: divisions at top level, their aircraft as children.
+
+    Indexes carry a plain integer ``internalId``: 0 for divisions, the
+    parent division id + 1 for aircraft, so they never reference Python
+    objects a reset may drop.
+    """
+
+    STATUS_ROLE = Qt.ItemDataRole.UserRole + 1
+
+    def __init__(self, fleet: FleetStatusService | None = None, parent: Any | None = None) -> None:
+        super().__init__(parent)
+        self.fleet = fleet or FleetStatusService()
+        self._podrazds: list[PodrazdBase] = []
+        self._planes: list[list[PlaneBase]] = []
+        self._podrazd_rows: dict[int, int] = {}
+        self._plane_pos: dict[int, tuple[int, int]] = {}
+        self.load_data()
+
+    def load_data(self) -> None:
+        """Load the whole fleet from database."""
+        self.beginResetModel()
+        self.fleet.load()
+        self._podrazds = list(self.fleet.podrazds)
+        self._planes = [list(self.fleet.planes_for(podr.id)) for podr in self._podrazds]
+        self._rebuild_index()
+        self.endResetModel()
+
+    def sync(self) -> None:
+        """Bring the model in line with the database without resetting it.
+
+        Divisions and aircraft are matched by id: missing rows are removed,
+        new rows inserted, reordered rows moved and changed rows relabelled.
+        An aircraft moved to another division is removed from the old one
+        and inserted into the new one.
+        """
+        old_statuses = {plane_id: self.fleet.status(plane_id) for plane_id in self._plane_pos}
+        self.fleet.load()
+
+        target_podrazds = list(self.fleet.podrazds)
+        self._sync_rows(QModelIndex(), self._podrazds, target_podrazds, self._planes)
+
+        for podr_row, podr in enumerate(self._podrazds):
+            parent = self.createIndex(podr_row, 0, 0)
+            self._sync_rows(parent, self._planes[podr_row], list(self.fleet.planes_for(podr.id)))
+
+        for plane_id, (podr_row, row) in self._plane_pos.items():
+            if old_statuses.get(plane_id) != self.fleet.status(plane_id):
+                index = self._plane_index_at(podr_row, row)
+                self.dataChanged.emit(index, index, [self.STATUS_ROLE])
+
+    def _sync_rows(
+        self,
+        parent: QModelIndex,
+        current: list[Any],
+        target: list[Any],
+        children: list[list[Any]] | None = None,
+    ) -> None:
+        """Reconcile rows under parent with target list, keyed by id.
+
+        Existing instances are updated in place. For top-level rows
+        ``children`` is kept aligned.
+        """
+        target_ids = {item.id for item in target}
+        for row in reversed(range(len(current))):
+            if current[row].id not in target_ids:
+                self.beginRemoveRows(parent, row, row)
+                del current[row]
+                if children is not None:
+                    del children[row]
+                self._rebuild_index()
+                self.endRemoveRows()
+
+        for row, item in enumerate(target):
+            pos = next((i for i in range(row, len(current)) if current[i].id == item.id), None)
+            if pos is None:
+                self.beginInsertRows(parent, row, row)
+                current.insert(row, item)
+                if children is not None:
+                    children.insert(row, [])
+                self._rebuild_index()
+                self.endInsertRows()
+                continue
+
+            if pos != row:
+                self.beginMoveRows(parent, pos, pos, parent, row)
+                current.insert(row, current.pop(pos))
+                if children is not None:
+                    children.insert(row, children.pop(pos))
+                self._rebuild_index()
+                self.endMoveRows()
+
+            existing = current[row]
+            if existing.__data__ != item.__data__:
+                existing.__data__.update(item.__data__)
+                index = self.index(row, 0, parent)
+                self.dataChanged.emit(index, index, [Qt.ItemDataRole.DisplayRole])
+
+    def _rebuild_index(self) -> None:
+        """Rebuild id -> position lookup tables."""
+        self._podrazd_rows = {podr.id: row for row, podr in enumerate(self._podrazds)}
+        self._plane_pos = {
+            plane.id: (podr_row, row)
+            for podr_row, planes in enumerate(self._planes)
+            for row, plane in enumerate(planes)
+        }
+
+    def _plane_index_at(self, podr_row: int, row: int) -> QModelIndex:
+        """Create index of an aircraft row under a division row."""
+        return self.createIndex(row, 0, self._podrazds[podr_row].id + 1)
+
+    def _podrazd_row_of(self, index: QModelIndex) -> int | None:
+        """Get division row of an aircraft index, None for division indexes."""
+        internal_id = index.internalId()
+        if internal_id == 0:
+            return None
+        return self._podrazd_rows.get(internal_id - 1)
+
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        """Return index for row under parent."""
+        if column != 0:
+            return QModelIndex()
+        if not parent.isValid():
+            if 0 <= row < len(self._podrazds):
+                return self.createIndex(row, 0, 0)
+            return QModelIndex()
+        if parent.internalId() != 0:
+            return QModelIndex()
+        podr_row = parent.row()
+        if 0 <= row < len(self._planes[podr_row]):
+            return self._plane_index_at(podr_row, row)
+        return QModelIndex()
+
+    def parent(self, child: QModelIndex = QModelIndex()) -> QModelIndex:  # type: ignore[override]
+        """Return parent division index for aircraft indexes."""
+        if not child.isValid():
+            return QModelIndex()
+        podr_row = self._podrazd_row_of(child)
+        if podr_row is None:
+            return QModelIndex()
+        return self.createIndex(podr_row, 0, 0)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Return number of divisions or aircraft in a division."""
+        if not parent.isValid():
+            return len(self._podrazds)
+        if parent.internalId() == 0:
+            return len(self._planes[parent.row()])
+        return 0
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Return number of columns."""
+        return 1
+
+    def data(self, index: QModelIndex, role: Qt.ItemDataRole = Qt.ItemDataRole.DisplayRole) -> Any:
+        """Return data for the given index and role."""
+        if not index.isValid():
+            return None
+
+        if index.internalId() == 0:
+            if role == Qt.ItemDataRole.DisplayRole:
+                return str(self._podrazds[index.row()].name)
+            if role == Qt.ItemDataRole.UserRole:
+                return self._podrazds[index.row()]
+            return None
+
+        podr_row = self._podrazd_row_of(index)
+        if podr_row is None or index.row() >= len(self._planes[podr_row]):
+            return None
+        plane = self._planes[podr_row][index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return str(plane.bort_number)
+        if role == Qt.ItemDataRole.UserRole:
+            return plane
+        if role == self.STATUS_ROLE:
+            return self.fleet.status(plane.id)
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        """Aircraft tiles are selectable, divisions are not."""
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        if index.internalId() == 0:
+            return Qt.ItemFlag.ItemIsEnabled
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+    def podrazd_index(self, podrazd_id: int) -> QModelIndex:
+        """Get index of a division."""
+        row = self._podrazd_rows.get(podrazd_id)
+        if row is None:
+            return QModelIndex()
+        return self.createIndex(row, 0, 0)
+
+    def plane_index(self, plane_id: int) -> QModelIndex:
+        """Get index of an aircraft."""
+        pos = self._plane_pos.get(plane_id)
+        if pos is None:
+            return QModelIndex()
+        podr_row, row = pos
+        return self._plane_index_at(podr_row, row)
+
+    def refresh_plane(self, plane_id: int) -> PlaneStatus:
+        """Recompute status of one aircraft and repaint its tile."""
+        status = self.fleet.refresh_plane(plane_id)
+        index = self.plane_index(plane_id)
+        if index.isValid():
+            self.dataChanged.emit(index, index, [self.STATUS_ROLE])
+        return status
+
+
+class PlaneTileDelegate(QStyledItemDelegate):
+    """Paints aircraft as colored tiles with bort number."""
+
+    TILE_SIZE = QSize(60, 40)
+    FAILURE_COLOR = QColor(200, 40, 40)
+    OK_COLOR = QColor(40, 150, 60)
+    TEXT_COLOR = QColor(255, 255, 255)
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex) -> None:  # type: ignore[override]
+        """Paint a single tile."""
+        status = index.data(FleetGridModel.STATUS_ROLE) or PlaneStatus()
+        color = self.FAILURE_COLOR if status.has_failures else self.OK_COLOR
+        if option.state & QStyle.StateFlag.State_MouseOver:
+            color = color.darker(120)
+
+        rect = QRectF(option.rect).adjusted(2, 2, -2, -2)
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(color)
+        painter.drawRoundedRect(rect, 4, 4)
+
+        font = QFont(option.font)
+        font.setBold(True)
+        painter.setFont(font)
+        painter.setPen(self.TEXT_COLOR)
+        painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, str(index.data() or ""))
+        painter.restore()
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        """Return fixed tile size."""
+        return self.TILE_SIZE
+
+
+class FleetGridView(QListView):
+    """Icon-mode view showing aircraft tiles of one division."""
+
+    open_signal = pyqtSignal(object)
+
+    def __init__(self, parent: Any | None = None) -> None:
+        super().__init__(parent)
+        self.setViewMode(QListView.ViewMode.IconMode)
+        self.setFlow(QListView.Flow.LeftToRight)
+        self.setWrapping(True)
+        self.setResizeMode(QListView.ResizeMode.Adjust)
+        self.setMovement(QListView.Movement.Static)
+        self.setUniformItemSizes(True)
+        self.setSpacing(2)
+        self.setMouseTracking(True)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.setItemDelegate(PlaneTileDelegate(self))
+        self.clicked.connect(self.open_plane)
+
+    def open_plane(self, index: QModelIndex) -> None:
+        """Emit open signal with aircraft under index."""
+        plane = index.data(Qt.ItemDataRole.UserRole)
+        if isinstance(plane, PlaneBase):
+            self.open_signal.emit(plane)
@@ -2,38 +2,36 @@
 from typing import TYPE_CHECKING, Any
 
 from PyQt6.QtCore import pyqtSignal
-from PyQt6.QtWidgets import QGridLayout, QGroupBox
+from PyQt6.QtWidgets import QGridLayout, QGroupBox, QVBoxLayout
 
-from app.ui.widgets.buttons import OsobBtn, PlaneBtn
-from data.models import OsobBase, OsobPlaneBase, PlaneBase, PodrazdBase, TypeBase
+from app.ui.widgets.buttons import OsobBtn
+from app.ui.widgets.fleet_grid import FleetGridModel, FleetGridView
+from data.models import OsobBase, OsobPlaneBase, PlaneBase, TypeBase
 
 
-class PodrGroup(QGroupBox):
-    """Group box displaying aircraft buttons for a division."""
+class PodrGridGroup(QGroupBox):
+    """Group box displaying aircraft tiles of a division from a shared fleet model."""
 
     open_signal = pyqtSignal(object)
 
-    def __init__(self, podr: "PodrazdBase", parent: Any | None = None) -> None:
+    def __init__(self, model: FleetGridModel, podrazd_id: int, parent: Any | None = None) -> None:
         super().__init__(parent)
-        self.podr = podr
-        self.setTitle(str(podr.name))
-        self.groupLayout = QGridLayout()
+        self.podrazd_id = podrazd_id
+        self.view = FleetGridView()
+        self.view.setModel(model)
+        self.view.open_signal.connect(self.open_signal)
+        self.groupLayout = QVBoxLayout()
+        self.groupLayout.addWidget(self.view)
         self.setLayout(self.groupLayout)
-        self.load_planes()
+        self.update_title()
 
-    def load_planes(self) -> None:
-        """Load aircraft buttons for this division."""
-        planes = PlaneBase.select().where(PlaneBase.podrazd == self.podr.id)
-        for p, plane in enumerate(planes):
-            row_p = p // 3
-            col_p = p % 3
-            btn = PlaneBtn(plane)
-            btn.open_signal.connect(self.open_ispravnost)
-            self.groupLayout.addWidget(btn, row_p, col_p)
+    def update_title(self) -> None:
+        """Sync title and root index with the model."""
+        model = self.view.model()
+        index = model.podrazd_index(self.podrazd_id)  # type: ignore
+        self.setTitle(str(index.data() or ""))
+        self.view.setRootIndex(index)
 
-    def open_ispravnost(self, btn: PlaneBtn) -> None:
-        """Emit open signal with aircraft button."""
-        self.open_signal.emit(btn)
 
 class OsobGroup(QGroupBox):
     def __init__(self, type:TypeBase = None, parent = None):
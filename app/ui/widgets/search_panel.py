@@ -0,0 +1,98 @@
+"""Global search panel over failures and aircraft."""
+import logging
+from functools import partial
+from typing import Any
+
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
+from PyQt6.QtWidgets import QLabel, QLineEdit, QListWidget, QListWidgetItem, QVBoxLayout, QWidget
+
+from app.services.db_worker import DbTaskError, get_executor
+from app.services.search import SearchResult, match_expression, search
+from app.ui.widgets.tables.base_table import cancel_load
+
+logger = logging.getLogger(__name__)
+
+
+class SearchPanel(QWidget):
+    """Search box with results updated as the user types.
+
+    A search runs on the database worker a moment after the last keystroke
+    and supersedes the previous one. Activating a result emits
+    ``plane_selected`` with the aircraft id and the failure id (None for an
+    aircraft hit).
+    """
+
+    # Delay after the last keystroke, ms
+    DELAY = 150
+    LIMIT = 50
+
+    plane_selected = pyqtSignal(int, object)
+
+    def __init__(self, parent: Any | None = None) -> None:
+        super().__init__(parent)
+        self.edit = QLineEdit()
+        self.edit.setPlaceholderText("Поиск: агрегат, номер, примечание, борт")
+        self.edit.setClearButtonEnabled(True)
+        self.summary = QLabel()
+        self.summary.hide()
+        self.results = QListWidget()
+        self.results.setWordWrap(True)
+
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self.edit)
+        layout.addWidget(self.summary)
+        layout.addWidget(self.results)
+        self.setLayout(layout)
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(self.DELAY)
+        self.timer.timeout.connect(self.search)
+        self.edit.textChanged.connect(self.timer.start)
+        self.edit.returnPressed.connect(self.activate_first)
+        self.results.itemActivated.connect(self.on_activated)
+
+        self._search_key = object()
+        self.destroyed.connect(partial(cancel_load, self._search_key))
+
+    def search(self) -> None:
+        """Search the current text in background."""
+        text = self.edit.text()
+        if match_expression(text) is None:
+            get_executor().cancel(self._search_key)
+            self.show_results([])
+            return
+        get_executor().submit(
+            search, text, self.LIMIT, key=self._search_key, on_result=self.show_results, on_error=self._search_failed
+        )
+
+    def show_results(self, results: list[SearchResult]) -> None:
+        """Replace the result list."""
+        self.results.clear()
+        for result in results:
+            if result.otkaz_id is None:
+                text = result.plane
+            else:
+                details = ", ".join(value for value in (result.system, result.number, result.description) if value)
+                text = f"{result.plane}: {result.agregate}\n{details}"
+            item = QListWidgetItem(text)
+            item.setData(Qt.ItemDataRole.UserRole, (result.plane_id, result.otkaz_id))
+            self.results.addItem(item)
+        has_text = match_expression(self.edit.text()) is not None
+        self.summary.setText(f"Найдено: {len(results)}" if has_text else "")
+        self.summary.setVisible(has_text)
+
+    def activate_first(self) -> None:
+        """Open the best match on Enter."""
+        if self.results.count():
+            self.on_activated(self.results.item(0))
+
+    def on_activated(self, item: QListWidgetItem) -> None:
+        """Emit the aircraft of an activated result."""
+        plane_id, otkaz_id = item.data(Qt.ItemDataRole.UserRole)
+        self.plane_selected.emit(plane_id, otkaz_id)
+
+    def _search_failed(self, error: DbTaskError) -> None:
+        """Log a failed search."""
+        logger.error("Search failed:\n%s", error.details)
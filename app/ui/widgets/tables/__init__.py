@@ -1,13 +1,39 @@
 """Table views and models for IAS application."""
-from app.ui.widgets.tables.agregate_table import AgregateModel, AgregateTable
-from app.ui.widgets.tables.base_table import UnTableModel, UnTableView
-from app.ui.widgets.tables.group_table import GroupModel, GroupTable
-from app.ui.widgets.tables.ispravnost_table import IspravnostTable, IspravnostTableModel
-from app.ui.widgets.tables.osobs_table import OsobModel, OsobTable
-from app.ui.widgets.tables.plane_types_table import PlanesTypesModel, PlaneTypesTable
-from app.ui.widgets.tables.planes_table import PlanesModel, PlanesTable
-from app.ui.widgets.tables.podrazd_table import PodrazdModel, PodrazdTable
-from app.ui.widgets.tables.system_table import SystemModel, SystemTable
+from typing import TYPE_CHECKING
+
+from app.ui.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from app.ui.widgets.tables.agregate_table import AgregateModel, AgregateTable
+    from app.ui.widgets.tables.base_table import UnTableModel, UnTableView
+    from app.ui.widgets.tables.group_table import GroupModel, GroupTable
+    from app.ui.widgets.tables.ispravnost_table import IspravnostTable, IspravnostTableModel
+    from app.ui.widgets.tables.osobs_table import OsobModel, OsobTable
+    from app.ui.widgets.tables.plane_types_table import PlanesTypesModel, PlaneTypesTable
+    from app.ui.widgets.tables.planes_table import PlanesModel, PlanesTable
+    from app.ui.widgets.tables.podrazd_table import PodrazdModel, PodrazdTable
+    from app.ui.widgets.tables.system_table import SystemModel, SystemTable
+
+__getattr__ = lazy_exports(__name__, {
+    "UnTableModel": ".base_table",
+    "UnTableView": ".base_table",
+    "PlanesTypesModel": ".plane_types_table",
+    "PlaneTypesTable": ".plane_types_table",
+    "PodrazdModel": ".podrazd_table",
+    "PodrazdTable": ".podrazd_table",
+    "GroupModel": ".group_table",
+    "GroupTable": ".group_table",
+    "SystemModel": ".system_table",
+    "SystemTable": ".system_table",
+    "AgregateModel": ".agregate_table",
+    "AgregateTable": ".agregate_table",
+    "PlanesModel": ".planes_table",
+    "PlanesTable": ".planes_table",
+    "OsobModel": ".osobs_table",
+    "OsobTable": ".osobs_table",
+    "IspravnostTableModel": ".ispravnost_table",
+    "IspravnostTable": ".ispravnost_table",
+})
 
 __all__ = [
     # Base
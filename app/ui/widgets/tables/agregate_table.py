@@ -1,7 +1,10 @@
 """Table view for aggregates/units."""
 from typing import Any
 
-from data.models.aircraft import AgregateBase, GroupBase, SystemBase, TypeBase
+from peewee import fn
+
+from app.collation import RUSSIAN, prefix_range
+from data.models.aircraft import AgregateBase, SystemBase
 
 from .base_table import UnTableModel, UnTableView
 
@@ -9,12 +12,14 @@ from .base_table import UnTableModel, UnTableView
 class AgregateModel(UnTableModel):
     """Table model for aggregates/units."""
 
-    HEADERS: list[str] = [
-        "Блок/Агрегат",
-        "Система",
-        "Группа",
-        "Тип самолета"
-    ]
+    COLUMNS: dict[str, str] = {
+        "Блок/Агрегат": "name",
+        "Система": "system.name",
+        "Группа": "system.group.name",
+        "Тип самолета": "system.plane_type.name",
+    }
+    MODEL = AgregateBase
+    ORDER_BY = (AgregateBase.name.collate(RUSSIAN),)
 
     def __init__(self, parent: Any | None = None) -> None:
         super().__init__(parent)
@@ -24,35 +29,34 @@ class AgregateModel(UnTableModel):
         filter_type: Any | None = None,
         filter_group: Any | None = None,
         filter_system: Any | None = None,
+        name_prefix: str | None = None,
     ) -> None:
         """Load aggregates with optional filters."""
-        self.beginResetModel()
-        query = (
-            AgregateBase.select()
-            .join(SystemBase)
-            .join(GroupBase)
-            .join(TypeBase)
+        self.load_async(
+            filter_type=filter_type, filter_group=filter_group, filter_system=filter_system, name_prefix=name_prefix
         )
 
+    def query(
+        self,
+        filter_type: Any | None = None,
+        filter_group: Any | None = None,
+        filter_system: Any | None = None,
+        name_prefix: str | None = None,
+    ) -> Any:
+        """Select aggregate rows with optional filters; name_prefix matches regardless of case."""
+        query = super().query()
+        if name_prefix:
+            low, high = prefix_range(name_prefix)
+            name = fn.casefold(AgregateBase.name)
+            query = query.where(name >= low, name < high)
         if filter_system:
             query = query.where(AgregateBase.system == filter_system)
         elif filter_group:
-            query = query.where(AgregateBase.system.group == filter_group)
+            query = query.where(SystemBase.group == filter_group)
         elif filter_type:
-            query = query.where(AgregateBase.system.plane_type == filter_type)
+            query = query.where(SystemBase.plane_type == filter_type)
 
-        self.clear_data()
-        for agregate in query:
-            self._data.append(
-                [
-                    agregate,
-                    agregate.name,
-                    agregate.system.name,
-                    agregate.system.group.name,
-                    agregate.system.plane_type.name,
-                ]
-            )
-        self.endResetModel()
+        return query
 
 
 class AgregateTable(UnTableView):
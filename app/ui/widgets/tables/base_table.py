@@ -1,28 +1,202 @@
 """Base table view for IAS application."""
+import logging
+from array import array
+from functools import partial
 from typing import Any
 
-from PyQt6.QtCore import QAbstractTableModel, Qt, pyqtSignal
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt, pyqtSignal
 from PyQt6.QtGui import QAction
 from PyQt6.QtWidgets import QAbstractItemView, QHeaderView, QMenu, QSizePolicy, QTableView
+from peewee import JOIN, Model
+
+from app.services.catalog import invalidate_catalog
+from app.services.db_worker import DbTaskError, get_executor
+
+logger = logging.getLogger(__name__)
+
+
+def cancel_load(key: object) -> None:
+    """Cancel a pending load on the current executor (called when a model is destroyed)."""
+    get_executor().cancel(key)
 
 
 class UnTableModel(QAbstractTableModel):
-    """Base table model with common functionality."""
+    """Base table model with common functionality.
 
+    Columns are declared in ``COLUMNS`` as header -> field path from
+    ``MODEL`` (``"system.group.name"``); ``query`` selects the id and exactly
+    those fields in one select joining each path once. Rows are plain tuples
+    ``(id, *columns)`` fetched on the database worker thread (``load_async``) and stored by column: ids in an
+    integer array, each column in its own list with repeated values (names
+    of types, divisions, groups) shared. ``UserRole`` returns the id;
+    ``fetch_item`` loads the object when a handler needs it. After an edit,
+    ``upsert_row``/``remove_row`` update the single affected row through an
+    id -> row index instead of reloading the table. Rows come sorted by
+    ``ORDER_BY`` (names with ``COLLATE RU``, served by collated indexes).
+    """
+
+    COLUMNS: dict[str, str] = {}
     HEADERS: list[str] = []
+    MODEL: type[Model] | None = None
+    ORDER_BY: tuple[Any, ...] = ()
+
+    loading_changed = pyqtSignal(bool)
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Derive headers from the column spec."""
+        super().__init_subclass__(**kwargs)
+        cls.HEADERS = list(cls.COLUMNS)
 
     def __init__(self, parent: Any | None = None) -> None:
         super().__init__(parent)
-        self._data: list[list[Any]] = []
+        self._ids = array("q")
+        self._columns: list[list[Any]] = [[] for _ in self.HEADERS]
+        self._rows: dict[Any, int] = {}
+        self._filters: dict[str, Any] = {}
+        self.loading = False
+        self._load_key = object()
+        self.destroyed.connect(partial(cancel_load, self._load_key))
         self.load_data()
 
     def load_data(self) -> None:
         """Load data from database. Override in subclasses."""
         pass
 
+    def query(self, **kwargs: Any) -> Any | None:
+        """Build the select of (id, *columns) rows; subclasses add their filters to it.
+
+        Runs in the worker thread, so it must not touch Qt objects.
+        """
+        if self.MODEL is None:
+            return None
+        return self.select_columns().order_by(*self.ORDER_BY)
+
+    @classmethod
+    def select_columns(cls) -> Any:
+        """Select the id and COLUMNS fields, joining every model on the paths once.
+
+        The first join of a model uses the model itself, so filters can name
+        its fields directly; further joins of the same model get an alias.
+        """
+        joined: dict[str, Any] = {"": cls.MODEL}
+        joined_models = {cls.MODEL}
+        joins = []
+        fields = [cls.MODEL._meta.primary_key]
+        for path in cls.COLUMNS.values():
+            *links, name = path.split(".")
+            prefix = ""
+            for link in links:
+                source = joined[prefix]
+                prefix = f"{prefix}.{link}" if prefix else link
+                if prefix not in joined:
+                    foreign_key = getattr(source, link)
+                    target = foreign_key.rel_model
+                    target = target.alias() if target in joined_models else target
+                    joined_models.add(foreign_key.rel_model)
+                    join_type = JOIN.LEFT_OUTER if foreign_key.null else JOIN.INNER
+                    target_key = getattr(target, foreign_key.rel_field.name)
+                    joins.append((source, target, join_type, foreign_key == target_key))
+                    joined[prefix] = target
+            fields.append(getattr(joined[prefix], name))
+
+        query = cls.MODEL.select(*fields)
+        for source, target, join_type, on in joins:
+            query = query.join_from(source, target, join_type, on=on)
+        return query
+
+    def fetch_rows(self, *args: Any, **kwargs: Any) -> list[tuple]:
+        """Query rows as (id, *columns) tuples."""
+        query = self.query(*args, **kwargs)
+        return [] if query is None else list(query.tuples())
+
+    def fetch_row(self, item_id: Any) -> tuple | None:
+        """Query the row of one item under the current filters, None if deleted or filtered out."""
+        query = self.query(**self._filters)
+        if query is None or self.MODEL is None:
+            return None
+        return query.where(self.MODEL._meta.primary_key == item_id).tuples().first()
+
+    def load_async(self, **kwargs: Any) -> None:
+        """Load rows with fetch_rows in background, superseding a pending load."""
+        self._filters = kwargs
+        self._set_loading(True)
+        get_executor().submit(
+            self.fetch_rows, key=self._load_key, on_result=self.set_rows, on_error=self._load_failed, **kwargs
+        )
+
+    def cancel_load(self) -> None:
+        """Cancel a pending background load."""
+        get_executor().cancel(self._load_key)
+        self._set_loading(False)
+
+    def set_rows(self, rows: list[tuple]) -> None:
+        """Replace model contents with fetched rows."""
+        self.beginResetModel()
+        self._ids = array("q", (row[0] for row in rows))
+        self._columns = [self._compact(row[column] for row in rows) for column in range(1, len(self.HEADERS) + 1)]
+        self._rows = {item_id: position for position, item_id in enumerate(self._ids)}
+        self.endResetModel()
+        self._set_loading(False)
+
+    @staticmethod
+    def _compact(values: Any) -> list[Any]:
+        """Collect column values, sharing one object per distinct value."""
+        shared: dict[Any, Any] = {}
+        return [shared.setdefault(value, value) for value in values]
+
+    def upsert_row(self, item_id: Any) -> None:
+        """Refresh, add or drop the row of an item after it was saved."""
+        row = self.fetch_row(item_id)
+        if row is None:
+            self.remove_row(item_id)
+            return
+        position = self._rows.get(item_id)
+        if position is None:
+            position = len(self._ids)
+            self.beginInsertRows(QModelIndex(), position, position)
+            self._ids.append(item_id)
+            for column, value in zip(self._columns, row[1:]):
+                column.append(value)
+            self._rows[item_id] = position
+            self.endInsertRows()
+        else:
+            for column, value in zip(self._columns, row[1:]):
+                column[position] = value
+            self.dataChanged.emit(self.index(position, 0), self.index(position, self.columnCount() - 1))
+
+    def remove_row(self, item_id: Any) -> None:
+        """Drop the row of an item after it was deleted."""
+        position = self._rows.pop(item_id, None)
+        if position is None:
+            return
+        self.beginRemoveRows(QModelIndex(), position, position)
+        del self._ids[position]
+        for column in self._columns:
+            del column[position]
+        for shifted, shifted_id in enumerate(self._ids[position:], position):
+            self._rows[shifted_id] = shifted
+        self.endRemoveRows()
+
+    def _load_failed(self, error: DbTaskError) -> None:
+        """Stop loading state after failed background load."""
+        self._set_loading(False)
+        logger.error("Failed to load %s:\n%s", type(self).__name__, error.details)
+
+    def _set_loading(self, loading: bool) -> None:
+        """Update loading state."""
+        if loading != self.loading:
+            self.loading = loading
+            self.loading_changed.emit(loading)
+
+    def fetch_item(self, item_id: Any) -> Any:
+        """Fetch database object by id taken from UserRole."""
+        if self.MODEL is None or item_id is None:
+            return None
+        return self.MODEL.get_or_none(self.MODEL._meta.primary_key == item_id)
+
     def rowCount(self, parent: Any | None = None) -> int:
         """Return number of rows."""
-        return len(self._data)
+        return len(self._ids)
 
     def columnCount(self, parent: Any | None = None) -> int:
         """Return number of columns."""
@@ -37,9 +211,9 @@ class UnTableModel(QAbstractTableModel):
 
         if 0 <= row < self.rowCount() and 0 <= col < self.columnCount():
             if role == Qt.ItemDataRole.DisplayRole:
-                return self._data[row][col + 1]
+                return self._columns[col][row]
             elif role == Qt.ItemDataRole.UserRole:
-                return self._data[row][0]
+                return self._ids[row]
         return None
 
     def headerData(
@@ -52,12 +226,15 @@ class UnTableModel(QAbstractTableModel):
 
     def clear_data(self) -> None:
         """Clear all data."""
-        self._data = []
+        self._ids = array("q")
+        self._columns = [[] for _ in self.HEADERS]
+        self._rows = {}
 
     @staticmethod
     def delete_item(item: Any) -> None:
-        """Delete item from database."""
-        item.delete_instance()
+        """Delete item from database in one retried transaction, then drop cached catalog."""
+        type(item).run_in_transaction(item.delete_instance)
+        invalidate_catalog()
 
 
 class UnTableView(QTableView):
@@ -86,20 +263,24 @@ class UnTableView(QTableView):
         menu = QMenu(self)
 
         if index.isValid():
-            item = model.data(index, role=Qt.ItemDataRole.UserRole)  # type: ignore
+            item_id = model.data(index, role=Qt.ItemDataRole.UserRole)  # type: ignore
             edit_action = QAction("✏️ Изменить элемент", self)
-            edit_action.triggered.connect(lambda checked: self.edit_item(item))
+            edit_action.triggered.connect(lambda checked: self.edit_item(item_id))
             menu.addAction(edit_action)
             delete_action = QAction("🗑️ Удалить элемент", self)
-            delete_action.triggered.connect(lambda checked: self.delete_item(item))
+            delete_action.triggered.connect(lambda checked: self.delete_item(item_id))
             menu.addAction(delete_action)
 
         menu.exec(self.viewport().mapToGlobal(position))  # type: ignore
 
-    def edit_item(self, item: Any) -> None:
-        """Emit edit signal with item."""
-        self.edit_signal.emit(item)
+    def edit_item(self, item_id: Any) -> None:
+        """Fetch item by id and emit edit signal with it."""
+        item = self.table_model.fetch_item(item_id)
+        if item is not None:
+            self.edit_signal.emit(item)
 
-    def delete_item(self, item: Any) -> None:
-        """Emit delete signal with item."""
-        self.delete_signal.emit(item)
+    def delete_item(self, item_id: Any) -> None:
+        """Fetch item by id and emit delete signal with it."""
+        item = self.table_model.fetch_item(item_id)
+        if item is not None:
+            self.delete_signal.emit(item)
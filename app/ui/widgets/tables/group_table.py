@@ -1,6 +1,7 @@
 """Table view for maintenance groups."""
 from typing import Any
 
+from app.collation import RUSSIAN
 from data.models.aircraft import GroupBase, TypeBase
 
 from .base_table import UnTableModel, UnTableView
@@ -8,24 +9,26 @@ from .base_table import UnTableModel, UnTableView
 
 class GroupModel(UnTableModel):
     """Table model for maintenance groups."""
-    HEADERS: list[str] = [
-        "Группа",
-        "Тип"
-    ]
+    COLUMNS: dict[str, str] = {
+        "Группа": "name",
+        "Тип": "plane_type.name",
+    }
+    MODEL = GroupBase
+    ORDER_BY = (GroupBase.name.collate(RUSSIAN),)
 
     def __init__(self, parent: Any | None = None) -> None:
         super().__init__(parent)
 
     def load_data(self, filter_str: str | None = None) -> None:
         """Load maintenance groups with optional filter."""
-        self.beginResetModel()
-        self.clear_data()
-        query = GroupBase.select().join(TypeBase)
+        self.load_async(filter_str=filter_str)
+
+    def query(self, filter_str: str | None = None) -> Any:
+        """Select group rows with optional filter."""
+        query = super().query()
         if filter_str is not None:
             query = query.where(TypeBase.name == filter_str)
-        for data in query:
-            self._data.append([data, data.name, data.plane_type.name])
-        self.endResetModel()
+        return query
 
 
 class GroupTable(UnTableView):
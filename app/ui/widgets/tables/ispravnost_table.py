@@ -1,17 +1,35 @@
 """Table view for aircraft serviceability data."""
+import logging
+from bisect import bisect_left
+from functools import partial
 from typing import Any
 
-from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt, QTimer
-from PyQt6.QtGui import QBrush, QColor, QFont
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, QRect, QSortFilterProxyModel, Qt, pyqtSignal
+from PyQt6.QtGui import QBrush, QColor, QFont, QPainter
+from PyQt6.QtWidgets import QStyle, QStyledItemDelegate, QStyleOptionViewItem
+from peewee import Tuple
 
+from app.services.db_worker import DbTaskError, get_executor
 from data.models.aircraft import PlaneBase, SystemBase, AgregateBase, GroupBase
 from data.models.failures import OtkazAgregateBase
 
-from .base_table import UnTableView
+from .base_table import UnTableView, cancel_load
+
+logger = logging.getLogger(__name__)
 
 
 class IspravnostTableModel(QAbstractTableModel):
-    """Table model for aircraft serviceability data with grouping."""
+    """Table model for aircraft serviceability data with grouping.
+
+    Rows are fetched in pages of ``PAGE_SIZE`` ordered by (group id, failure
+    id): ``load_data`` brings the first page, views pull the rest through
+    ``canFetchMore``/``fetchMore`` as they scroll. Group header rows are
+    inserted as new groups arrive. Every row keeps its sort key (group id,
+    failure id; 0 for headers), so ``upsert_row``/``remove_row`` can place or
+    drop a single edited failure, and its header, without a reload.
+    """
+
+    PAGE_SIZE = 200
 
     HEADERS: list[str] = [
         "Наименование",
@@ -21,66 +39,245 @@ class IspravnostTableModel(QAbstractTableModel):
         "Примечание",
     ]
 
+    # True for group header rows
+    GROUP_ROLE = Qt.ItemDataRole.UserRole + 1
+
     GROUP_BG_COLOR = QColor(220, 220, 220)
     GROUP_FG_COLOR = QColor(0, 0, 139)
     ROW_BG_COLOR = QColor(255, 255, 255)
 
+    loading_changed = pyqtSignal(bool)
+    # Emitted after a page of rows was applied
+    page_loaded = pyqtSignal()
+
     def __init__(self, plane: PlaneBase, parent: Any | None = None) -> None:
         super().__init__(parent)
         self.plane = plane
-        self._data: list[Any] = []
         self._prepared_data: list[list[Any]] = []
-        self._group_rows: set[int] = set()
-        self._row_type: list[str] = []
+        self._keys: list[tuple[int, int]] = []
+        self._rows: dict[int, int] = {}
+        self._last_group_id: int | None = None
+        self._cursor: tuple[int, int] | None = None
+        self._has_more = False
+        self.loading = False
+        self._load_key = object()
+        self.destroyed.connect(partial(cancel_load, self._load_key))
         self.load_data()
 
     def load_data(self) -> None:
-        """Load failure data for the aircraft."""
+        """Reload failure data of the aircraft from its first page in background."""
+        self._set_loading(True)
+        get_executor().submit(
+            self.fetch_rows,
+            self.plane.id,
+            limit=self.PAGE_SIZE + 1,
+            key=self._load_key,
+            on_result=self.set_rows,
+            on_error=self._load_failed,
+        )
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        """Check if more pages are left (and none is being fetched)."""
+        return not parent.isValid() and self._has_more and not self.loading
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()) -> None:
+        """Fetch the next page in background."""
+        if not self.canFetchMore(parent):
+            return
+        self._set_loading(True)
+        get_executor().submit(
+            self.fetch_rows,
+            self.plane.id,
+            after=self._cursor,
+            limit=self.PAGE_SIZE + 1,
+            key=self._load_key,
+            on_result=self.append_rows,
+            on_error=self._load_failed,
+        )
+
+    def cancel_load(self) -> None:
+        """Cancel a pending background load."""
+        get_executor().cancel(self._load_key)
+        self._set_loading(False)
+
+    @staticmethod
+    def fetch_rows(
+        plane_id: int,
+        after: tuple[int, int] | None = None,
+        limit: int | None = None,
+        otkaz_id: int | None = None,
+    ) -> list[tuple]:
+        """Query failure rows of an aircraft with one joined select. Runs in the worker thread.
+
+        Rows come ordered by (group id, failure id); ``after`` is the key of
+        the last row already loaded, ``otkaz_id`` restricts to one failure.
+        """
+        query = (
+            OtkazAgregateBase
+            .select(
+                OtkazAgregateBase.id,
+                SystemBase.group,
+                GroupBase.name,
+                AgregateBase.name,
+                SystemBase.name,
+                OtkazAgregateBase.number,
+                OtkazAgregateBase.removed,
+                OtkazAgregateBase.description,
+            )
+            .join(AgregateBase)
+            .join(SystemBase)
+            .join(GroupBase)
+            .where(OtkazAgregateBase.plane == plane_id)
+            .order_by(SystemBase.group, OtkazAgregateBase.id)
+        )
+        if after is not None:
+            query = query.where(Tuple(SystemBase.group, OtkazAgregateBase.id) > Tuple(*after))
+        if otkaz_id is not None:
+            query = query.where(OtkazAgregateBase.id == otkaz_id)
+        if limit is not None:
+            query = query.limit(limit)
+        return list(query.tuples())
+
+    def set_rows(self, rows: list[tuple]) -> None:
+        """Replace contents with the first page of fetched tuples."""
         self.beginResetModel()
-        self._data = []
-        self._group_rows = set()
-        self._row_type = []
         self._prepared_data = []
-
-        self._data = (OtkazAgregateBase
-                      .select()
-                      .join(AgregateBase)
-                      .join(SystemBase)
-                      .join(GroupBase)
-                      .where(OtkazAgregateBase.plane == self.plane)
-                      .order_by(OtkazAgregateBase.agregate.system.group))
-
-        current_group: str | None = None
-
-        for item in self._data:
-            group_value = str(item.agregate.system.group.name)
-            if group_value != current_group:
-                self._add_group_row(group_value)
-                current_group = group_value
-
-            self._add_agregate_row(item)
+        self._keys = []
+        self._rows = {}
+        self._last_group_id = None
+        self._cursor = None
+        self._extend(*self._build_page(rows))
         self.endResetModel()
+        self._set_loading(False)
+        self.page_loaded.emit()
+
+    def append_rows(self, rows: list[tuple]) -> None:
+        """Append the next page of fetched tuples."""
+        prepared, keys = self._build_page(rows)
+        if prepared:
+            first = len(self._prepared_data)
+            self.beginInsertRows(QModelIndex(), first, first + len(prepared) - 1)
+            self._extend(prepared, keys)
+            self.endInsertRows()
+        self._set_loading(False)
+        self.page_loaded.emit()
+
+    def _build_page(self, rows: list[tuple]) -> tuple[list[list[Any]], list[tuple[int, int]]]:
+        """Prepare rows of a page with their keys, opening a group header when the group changes."""
+        self._has_more = len(rows) > self.PAGE_SIZE
+        rows = rows[:self.PAGE_SIZE]
+        prepared: list[list[Any]] = []
+        keys: list[tuple[int, int]] = []
+        for otkaz_id, group_id, group_name, *columns in rows:
+            if group_id != self._last_group_id:
+                prepared.append(self._group_row(str(group_name)))
+                keys.append((group_id, 0))
+                self._last_group_id = group_id
+            prepared.append(self._agregate_row(otkaz_id, *columns))
+            keys.append((group_id, otkaz_id))
+        if rows:
+            self._cursor = (rows[-1][1], rows[-1][0])
+        return prepared, keys
+
+    def _extend(self, prepared: list[list[Any]], keys: list[tuple[int, int]]) -> None:
+        """Append prepared rows and index them."""
+        first = len(self._prepared_data)
+        self._prepared_data.extend(prepared)
+        self._keys.extend(keys)
+        self._reindex(first)
+
+    def _reindex(self, first: int) -> None:
+        """Update the failure id -> row index from row first on."""
+        for row in range(first, len(self._keys)):
+            otkaz_id = self._keys[row][1]
+            if otkaz_id:
+                self._rows[otkaz_id] = row
+
+    def upsert_row(self, otkaz_id: int) -> None:
+        """Refresh, add or drop the row of a failure after it was saved."""
+        rows = self.fetch_rows(self.plane.id, otkaz_id=otkaz_id)
+        if not rows:
+            self.remove_row(otkaz_id)
+            return
+        otkaz_id, group_id, group_name, *columns = rows[0]
+        key = (group_id, otkaz_id)
+        position = self._rows.get(otkaz_id)
+        if position is not None and self._keys[position] == key:
+            self._prepared_data[position] = self._agregate_row(otkaz_id, *columns)
+            self.dataChanged.emit(self.index(position, 0), self.index(position, self.columnCount() - 1))
+            return
+
+        self.remove_row(otkaz_id)
+        if self._has_more and self._cursor is not None and key > self._cursor:
+            return  # arrives with a later page
+        position = bisect_left(self._keys, key)
+        prepared: list[list[Any]] = []
+        keys: list[tuple[int, int]] = []
+        if position == 0 or self._keys[position - 1][0] != group_id:
+            prepared.append(self._group_row(str(group_name)))
+            keys.append((group_id, 0))
+        prepared.append(self._agregate_row(otkaz_id, *columns))
+        keys.append(key)
+
+        self.beginInsertRows(QModelIndex(), position, position + len(prepared) - 1)
+        self._prepared_data[position:position] = prepared
+        self._keys[position:position] = keys
+        self._reindex(position)
+        if self._cursor is None or key > self._cursor:
+            self._cursor = key
+            self._last_group_id = group_id
+        self.endInsertRows()
+
+    def remove_row(self, otkaz_id: int) -> None:
+        """Drop the row of a failure, and its group header if the group became empty."""
+        position = self._rows.pop(otkaz_id, None)
+        if position is None:
+            return
+        first = position
+        group_id = self._keys[position][0]
+        if self._is_group(position - 1) and (position + 1 == len(self._keys) or self._is_group(position + 1)):
+            first = position - 1
+            if group_id == self._last_group_id:
+                self._last_group_id = None  # a later page reopens the header
+
+        self.beginRemoveRows(QModelIndex(), first, position)
+        del self._prepared_data[first:position + 1]
+        del self._keys[first:position + 1]
+        self._reindex(first)
+        self.endRemoveRows()
+
+    def _is_group(self, row: int) -> bool:
+        """Check if row is a group header."""
+        return self._keys[row][1] == 0
+
+    def _load_failed(self, error: DbTaskError) -> None:
+        """Stop loading state after failed background load."""
+        self._set_loading(False)
+        logger.error("Failed to load failures of aircraft %s:\n%s", self.plane.id, error.details)
+
+    def _set_loading(self, loading: bool) -> None:
+        """Update loading state."""
+        if loading != self.loading:
+            self.loading = loading
+            self.loading_changed.emit(loading)
+
+    def _group_row(self, group_name: str) -> list[Any]:
+        """Build a group header row."""
+        return [None] + [group_name] * len(self.HEADERS)
 
-    def _add_group_row(self, group_name: str) -> None:
-        """Add a group header row."""
-        row_idx = len(self._prepared_data)
-        self._prepared_data.append([group_name] * len(self.HEADERS))
-        self._group_rows.add(row_idx)
-        self._row_type.append("group")
-
-    def _add_agregate_row(self, item: Any) -> None:
-        """Add an aggregate data row."""
-        removed = "Снят" if item.removed else "На самолете"
-        row_data = [
-            item,
-            item.agregate.name,
-            item.agregate.system.name,
-            item.number,
-            removed,
-            item.description,
+    @staticmethod
+    def _agregate_row(
+        otkaz_id: int, agregate: str, system: str, number: Any, removed: bool, description: Any
+    ) -> list[Any]:
+        """Build an aggregate data row."""
+        return [
+            otkaz_id,
+            agregate,
+            system,
+            number,
+            "Снят" if removed else "На самолете",
+            description,
         ]
-        self._prepared_data.append(row_data)
-        self._row_type.append("agregate")
 
     def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
         """Return number of rows."""
@@ -101,7 +298,7 @@ class IspravnostTableModel(QAbstractTableModel):
         if not (0 <= row < len(self._prepared_data) and 0 <= col < len(self.HEADERS)):
             return None
 
-        is_group = row in self._group_rows
+        is_group = self._is_group(row)
 
         if role == Qt.ItemDataRole.DisplayRole:
             value = self._prepared_data[row][col + 1]
@@ -114,7 +311,10 @@ class IspravnostTableModel(QAbstractTableModel):
             return font
 
         if role == Qt.ItemDataRole.UserRole:
-            return self._prepared_data[row][0] if self._row_type[row] == "agregate" else None
+            return self._prepared_data[row][0]
+
+        if role == self.GROUP_ROLE:
+            return is_group
 
         if role == Qt.ItemDataRole.BackgroundRole:
             return QBrush(self.GROUP_BG_COLOR if is_group else self.ROW_BG_COLOR)
@@ -130,13 +330,34 @@ class IspravnostTableModel(QAbstractTableModel):
         return None
 
     def get_item(self, index: QModelIndex) -> Any:
-        """Get item at index."""
-        return self.data(index, role=Qt.ItemDataRole.UserRole)
+        """Fetch failure record at index."""
+        return self.fetch_item(self.data(index, role=Qt.ItemDataRole.UserRole))
+
+    @staticmethod
+    def fetch_item(item_id: int | None) -> OtkazAgregateBase | None:
+        """Fetch failure record by id taken from UserRole."""
+        if item_id is None:
+            return None
+        return OtkazAgregateBase.get_or_none(OtkazAgregateBase.id == item_id)
+
+    def row_of(self, otkaz_id: int) -> int | None:
+        """Get row of a failure, None if it is not loaded."""
+        return self._rows.get(otkaz_id)
+
+    def group_id(self, row: int) -> int | None:
+        """Get id of the group a row (header or failure) belongs to."""
+        if 0 <= row < len(self._keys):
+            return self._keys[row][0]
+        return None
+
+    def group_loaded(self, group_id: int) -> bool:
+        """Check if all failures of a group are loaded (pages come in group order)."""
+        return not self._has_more or (self._cursor is not None and self._cursor[0] > group_id)
 
     def get_row_type(self, row: int) -> str | None:
         """Get row type (group or agregate)."""
-        if 0 <= row < len(self._row_type):
-            return self._row_type[row]
+        if 0 <= row < len(self._keys):
+            return "group" if self._is_group(row) else "agregate"
         return None
 
     def headerData(
@@ -149,8 +370,79 @@ class IspravnostTableModel(QAbstractTableModel):
 
     @staticmethod
     def delete_item(item: Any) -> None:
-        """Delete item from database."""
-        item.delete_instance()
+        """Delete item from database in one retried transaction."""
+        type(item).run_in_transaction(item.delete_instance)
+
+
+class GroupFilterProxyModel(QSortFilterProxyModel):
+    """Shows the rows of one group of an IspravnostTableModel, or all rows.
+
+    Filtering reads the model's row -> group index, so switching groups
+    does not query the database; only if the chosen group is not fully
+    loaded yet are further pages fetched, up to its last row.
+    """
+
+    def __init__(self, parent: Any | None = None) -> None:
+        super().__init__(parent)
+        self._group_id: int | None = None
+
+    def setSourceModel(self, model: IspravnostTableModel) -> None:  # type: ignore[override]
+        """Set source model and keep loading pages while the filtered group is incomplete."""
+        super().setSourceModel(model)
+        model.page_loaded.connect(self._fetch_group)
+
+    def set_group(self, group_id: int | None) -> None:
+        """Show only rows of a group; None shows all."""
+        self._group_id = group_id
+        self.invalidateRowsFilter()
+        self._fetch_group()
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        """Accept rows of the selected group."""
+        return self._group_id is None or self.sourceModel().group_id(source_row) == self._group_id
+
+    def _fetch_group(self) -> None:
+        """Fetch the next page if the selected group may continue there."""
+        model = self.sourceModel()
+        if self._group_id is not None and not model.group_loaded(self._group_id) and model.canFetchMore():
+            model.fetchMore()
+
+
+class GroupHeaderDelegate(QStyledItemDelegate):
+    """Paints group header rows as one label across the table width.
+
+    Each header cell draws its slice of the row-wide label, clipped to the
+    cell, so the view keeps no span state to update on inserts and removals.
+    The view grid is off, as it would cut through headers; cells draw their
+    own grid lines instead.
+    """
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex) -> None:
+        """Paint a cell, or a slice of its group header, and its grid lines."""
+        view = self.parent()
+        is_group = bool(index.data(IspravnostTableModel.GROUP_ROLE))
+        if is_group:
+            row_option = QStyleOptionViewItem(option)
+            self.initStyleOption(row_option, index.siblingAtColumn(0))
+            row_option.state &= ~QStyle.StateFlag.State_HasFocus
+            row_option.rect = QRect(
+                view.columnViewportPosition(0), option.rect.y(), view.horizontalHeader().length(), option.rect.height()
+            )
+            painter.save()
+            painter.setClipRect(option.rect)
+            view.style().drawControl(QStyle.ControlElement.CE_ItemViewItem, row_option, painter, view)
+            painter.restore()
+        else:
+            super().paint(painter, option, index)
+
+        grid_color = view.style().styleHint(QStyle.StyleHint.SH_Table_GridLineColor, option, view)
+        painter.save()
+        painter.setPen(QColor.fromRgba(grid_color & 0xFFFFFFFF))
+        rect = option.rect
+        painter.drawLine(rect.bottomLeft(), rect.bottomRight())
+        if not is_group or index.column() == index.model().columnCount() - 1:
+            painter.drawLine(rect.topRight(), rect.bottomRight())
+        painter.restore()
 
 
 class IspravnostTable(UnTableView):
@@ -159,26 +451,41 @@ class IspravnostTable(UnTableView):
     def __init__(self, plane: PlaneBase, parent: Any | None = None) -> None:
         super().__init__(parent)
         self.table_model = IspravnostTableModel(plane)
-        self.setModel(self.table_model)
-
-    def set_span_for_groups(self) -> None:
-        """Set row spans for group rows."""
-        self.clear_all_span()
-        for row in range(self.table_model.rowCount()):
-            if self.table_model.get_row_type(row) == 'group':
-                self.setSpan(row, 0, 1, self.table_model.columnCount())
-
-    def clear_all_span(self) -> None:
-        """Clear all row spans."""
-        rows = self.table_model.rowCount()
-        cols = self.table_model.columnCount()
-        for row in range(rows):
-            for col in range(cols):
-                if self.rowSpan(row, col)> 1 or self.columnSpan(row,col)> 1:
-                    self.setSpan(row, col, 1, 1)
+        self.proxy = GroupFilterProxyModel(self)
+        self.proxy.setSourceModel(self.table_model)
+        self.setModel(self.proxy)
+        self.setShowGrid(False)
+        self.setItemDelegate(GroupHeaderDelegate(self))
+        self._pending_otkaz: int | None = None
+        self.table_model.page_loaded.connect(self._select_pending)
 
     def load_data(self) -> None:
-        """Load data from database."""
+        """Reload data from database."""
         self.table_model.load_data()
-        self.set_span_for_groups()
-        
+
+    def select_otkaz(self, otkaz_id: int) -> None:
+        """Select and scroll to a failure, fetching pages until it is loaded."""
+        self._pending_otkaz = otkaz_id
+        self._select_pending()
+
+    def _select_pending(self) -> None:
+        """Select the requested failure once its page arrives."""
+        if self._pending_otkaz is None:
+            return
+        model = self.table_model
+        row = model.row_of(self._pending_otkaz)
+        if row is not None:
+            self._pending_otkaz = None
+            index = self.proxy.mapFromSource(model.index(row, 0))
+            if index.isValid():
+                self.selectRow(index.row())
+                self.scrollTo(index)
+        elif not model.loading:
+            if model.canFetchMore():
+                model.fetchMore()
+            else:
+                self._pending_otkaz = None
+
+    def set_group_filter(self, group_id: int | None) -> None:
+        """Show only failures of a group; None shows all."""
+        self.proxy.set_group(group_id)
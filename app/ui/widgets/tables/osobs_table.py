@@ -1,6 +1,7 @@
 """Table view for aircraft features."""
 from typing import Any
 
+from app.collation import RUSSIAN
 from data.models.osob import OsobBase
 
 from .base_table import UnTableModel, UnTableView
@@ -9,27 +10,26 @@ from .base_table import UnTableModel, UnTableView
 class OsobModel(UnTableModel):
     """Table model for aircraft features."""
 
-    HEADERS: list[str] = [
-        "Тип самолета",
-        "Особенности",
-    ]
+    COLUMNS: dict[str, str] = {
+        "Тип самолета": "plane_type.name",
+        "Особенности": "name",
+    }
+    MODEL = OsobBase
+    ORDER_BY = (OsobBase.name.collate(RUSSIAN),)
 
     def __init__(self, parent: Any | None = None) -> None:
         super().__init__(parent)
 
     def load_data(self, filter_type: Any | None = None) -> None:
         """Load features with optional filter."""
-        self.beginResetModel()
-        self.clear_data()
-        self._headers = ["Тип самолета", "Особенности"]
-        if filter_type:
-            query = OsobBase.select().where(OsobBase.plane_type == filter_type)
-        else:
-            query = OsobBase.select()
+        self.load_async(filter_type=filter_type)
 
-        for data in query:
-            self._data.append([data, data.plane_type, data.name])
-        self.endResetModel()
+    def query(self, filter_type: Any | None = None) -> Any:
+        """Select feature rows with optional filter."""
+        query = super().query()
+        if filter_type:
+            query = query.where(OsobBase.plane_type == filter_type)
+        return query
 
 
 class OsobTable(UnTableView):
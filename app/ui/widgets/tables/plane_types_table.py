@@ -1,6 +1,7 @@
 """Table view for aircraft types."""
 from typing import Any
 
+from app.collation import RUSSIAN
 from data.models.aircraft import TypeBase
 
 from .base_table import UnTableModel, UnTableView
@@ -8,21 +9,18 @@ from .base_table import UnTableModel, UnTableView
 
 class PlanesTypesModel(UnTableModel):
     """Table model for aircraft types."""
-    HEADERS: list[str] = [
-        "Наименование",
-    ]
+    COLUMNS: dict[str, str] = {
+        "Наименование": "name",
+    }
+    MODEL = TypeBase
+    ORDER_BY = (TypeBase.name.collate(RUSSIAN),)
 
     def __init__(self, parent: Any | None = None) -> None:
         super().__init__(parent)
 
     def load_data(self) -> None:
         """Load aircraft types."""
-        self.beginResetModel()
-        self.clear_data()
-        query = TypeBase.select()
-        for plane_type in list(query):
-            self._data.append([plane_type, plane_type.name])
-        self.endResetModel()
+        self.load_async()
 
 
 class PlaneTypesTable(UnTableView):
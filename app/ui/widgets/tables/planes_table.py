@@ -1,6 +1,7 @@
 """Table view for aircraft."""
 from typing import Any
 
+from app.collation import NATURAL
 from data.models.aircraft import PlaneBase, PodrazdBase, TypeBase
 
 from .base_table import UnTableModel, UnTableView
@@ -9,11 +10,13 @@ from .base_table import UnTableModel, UnTableView
 class PlanesModel(UnTableModel):
     """Table model for aircraft."""
 
-    HEADERS: list[str] = [
-        "Тип самолета",
-        "Подразделение",
-        "Бортовой номер",
-    ]
+    COLUMNS: dict[str, str] = {
+        "Тип самолета": "plane_type.name",
+        "Подразделение": "podrazd.name",
+        "Бортовой номер": "bort_number",
+    }
+    MODEL = PlaneBase
+    ORDER_BY = (PlaneBase.bort_number.collate(NATURAL),)
 
     def __init__(self, parent: Any | None = None) -> None:
         self.filter: dict[str, Any] = {}
@@ -26,21 +29,20 @@ class PlanesModel(UnTableModel):
 
     def load_data(self) -> None:
         """Load aircraft with optional filters."""
-        self.beginResetModel()
-        self.clear_data()
-        query = PlaneBase.select()
+        self.load_async(filter_dict=dict(self.filter))
 
-        if isinstance(self.filter.get("plane_type"), TypeBase):
-            query = query.where(PlaneBase.plane_type == self.filter["plane_type"])
+    def query(self, filter_dict: dict[str, Any] | None = None) -> Any:
+        """Select aircraft rows with optional filters."""
+        filter_dict = filter_dict or {}
+        query = super().query()
 
-        if isinstance(self.filter.get("podrazd"), PodrazdBase):
-            query = query.where(PlaneBase.podrazd == self.filter["podrazd"])
+        if isinstance(filter_dict.get("plane_type"), TypeBase):
+            query = query.where(PlaneBase.plane_type == filter_dict["plane_type"])
 
-        for data in query:
-            self._data.append(
-                [data, data.plane_type.name, data.podrazd.name, data.bort_number]
-            )
-        self.endResetModel()
+        if isinstance(filter_dict.get("podrazd"), PodrazdBase):
+            query = query.where(PlaneBase.podrazd == filter_dict["podrazd"])
+
+        return query
 
 
 class PlanesTable(UnTableView):
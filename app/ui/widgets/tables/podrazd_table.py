@@ -1,6 +1,7 @@
 """Table view for divisions."""
 from typing import Any
 
+from app.collation import RUSSIAN
 from data.models.aircraft import PodrazdBase
 
 from .base_table import UnTableModel, UnTableView
@@ -8,21 +9,18 @@ from .base_table import UnTableModel, UnTableView
 
 class PodrazdModel(UnTableModel):
     """Table model for divisions."""
-    HEADERS: list[str] = [
-        "Наименование",
-    ]
+    COLUMNS: dict[str, str] = {
+        "Наименование": "name",
+    }
+    MODEL = PodrazdBase
+    ORDER_BY = (PodrazdBase.name.collate(RUSSIAN),)
 
     def __init__(self, parent: Any | None = None) -> None:
         super().__init__(parent)
 
     def load_data(self) -> None:
         """Load divisions."""
-        self.beginResetModel()
-        self.clear_data()
-        query = PodrazdBase.select()
-        for data in query:
-            self._data.append([data, data.name])
-        self.endResetModel()
+        self.load_async()
 
 
 class PodrazdTable(UnTableView):
@@ -1,6 +1,7 @@
 """Table view for aircraft systems."""
 from typing import Any
 
+from app.collation import RUSSIAN
 from data.models.aircraft import GroupBase, SystemBase, TypeBase
 
 from .base_table import UnTableModel, UnTableView
@@ -8,28 +9,30 @@ from .base_table import UnTableModel, UnTableView
 
 class SystemModel(UnTableModel):
     """Table model for aircraft systems."""
-    HEADERS: list[str] = [
-        "Система",
-        "Группа обслуживания",
-        "Тип самолета"
-    ]
+    COLUMNS: dict[str, str] = {
+        "Система": "name",
+        "Группа обслуживания": "group.name",
+        "Тип самолета": "plane_type.name",
+    }
+    MODEL = SystemBase
+    ORDER_BY = (SystemBase.name.collate(RUSSIAN),)
 
     def __init__(self, parent: Any | None = None) -> None:
         super().__init__(parent)
 
     def load_data(self, filter: dict | None = None) -> None:
         """Load systems with optional filter."""
-        self.beginResetModel()
-        self.clear_data()
-        query = SystemBase.select().join(GroupBase).join(TypeBase)
+        self.load_async(filter=filter)
+
+    def query(self, filter: dict | None = None) -> Any:
+        """Select system rows with optional filter."""
+        query = super().query()
         if filter is not None:
             if isinstance(filter.get('plane_type'), TypeBase):
                 query = query.where(SystemBase.plane_type == filter.get('plane_type'))
             if isinstance(filter.get('group'), GroupBase):
                 query = query.where(SystemBase.group == filter.get('group'))
-        for data in query:
-            self._data.append([data, data.name, data.group.name, data.plane_type.name])
-        self.endResetModel()
+        return query
 
 
 class SystemTable(UnTableView):
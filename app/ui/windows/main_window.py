@@ -1,24 +1,25 @@
 """Main window for IAS application."""
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from PyQt6.QtGui import QAction
 from PyQt6.QtWidgets import QHBoxLayout, QMainWindow, QVBoxLayout, QWidget
 
 from app.ui.dialogs.plane_ispravnost import IspravnostFrame
-from app.ui.dialogs.settings import (
-    SettingsAgregate,
-    SettingsGroup,
-    SettingsOsob,
-    SettingsPlanes,
-    SettingsPlaneType,
-    SettingsPodrazd,
-    SettingsSystem,
-)
+from app.ui.widgets.busy import BusyIndicator
 from app.ui.widgets.buttons import IASButton
+from app.ui.widgets.search_panel import SearchPanel
+from data.models.aircraft import PlaneBase
+
+if TYPE_CHECKING:
+    from app.ui.dialogs.query_stats import QueryStatsDialog
 
 
 class MainForm(QMainWindow):
-    """Main application window."""
+    """Main application window.
+
+    Dialogs are imported when their menu action fires, so startup only
+    loads what the first paint needs.
+    """
 
     def __init__(self, parent: Any | None = None) -> None:
         super().__init__(parent)
@@ -52,6 +53,13 @@ class MainForm(QMainWindow):
         settings_menu.addAction(agreg_action)
         settings_menu.addAction(moderniz_action)
 
+        debug_menu = self.menu.addMenu("&Отладка")
+        assert debug_menu is not None
+        query_stats_action = QAction("Статистика SQL-запросов", self)
+        query_stats_action.triggered.connect(self.query_stats_dialog)
+        debug_menu.addAction(query_stats_action)
+        self._query_stats: "QueryStatsDialog | None" = None
+
         self.setWindowTitle("Исправность")
         self.setGeometry(100, 100, 800, 600)
 
@@ -60,46 +68,81 @@ class MainForm(QMainWindow):
 
         self.frame = IspravnostFrame()
         main_layout = QHBoxLayout()
+        self.search_panel = SearchPanel()
+        self.search_panel.plane_selected.connect(self.open_search_result)
         main_layout.addWidget(self.frame, stretch=8)
+        main_layout.addWidget(self.search_panel, stretch=3)
         self.central_widget.setLayout(main_layout)
 
+        self.busy_indicator = BusyIndicator()
+        self.statusBar().addPermanentWidget(self.busy_indicator)  # type: ignore
+
+    def open_search_result(self, plane_id: int, otkaz_id: int | None) -> None:
+        """Open the serviceability card of a found aircraft, with the found failure selected."""
+        plane = PlaneBase.get_or_none(PlaneBase.id == plane_id)
+        if plane is not None:
+            self.frame.open_dialog(plane, otkaz_id)
+
     def moderniz_dialog(self) -> None:
         """Open modernizations dialog."""
+        from app.ui.dialogs.settings import SettingsOsob
+
         dialog = SettingsOsob(self)
         dialog.exec()
 
     def plane_type_dialog(self) -> None:
         """Open aircraft types dialog."""
+        from app.ui.dialogs.settings import SettingsPlaneType
+
         dialog = SettingsPlaneType(self)
         dialog.exec()
 
     def podr_dialog(self) -> None:
         """Open divisions dialog."""
+        from app.ui.dialogs.settings import SettingsPodrazd
+
         dialog = SettingsPodrazd(self)
         dialog.updated.connect(self.frame.update_podr)
         dialog.exec()
 
     def group_dialog(self) -> None:
         """Open maintenance groups dialog."""
+        from app.ui.dialogs.settings import SettingsGroup
+
         dialog = SettingsGroup(self)
         dialog.exec()
 
     def system_dialog(self) -> None:
         """Open aircraft systems dialog."""
+        from app.ui.dialogs.settings import SettingsSystem
+
         dialog = SettingsSystem(self)
         dialog.exec()
 
     def agregate_dialog(self) -> None:
         """Open aggregates dialog."""
+        from app.ui.dialogs.settings import SettingsAgregate
+
         dialog = SettingsAgregate(self)
         dialog.exec()
 
     def planes_dialog(self) -> None:
         """Open aircraft dialog."""
+        from app.ui.dialogs.settings import SettingsPlanes
+
         dialog = SettingsPlanes()
         dialog.updated.connect(self.frame.update_podr)
         dialog.exec()
 
+    def query_stats_dialog(self) -> None:
+        """Open SQL statistics dialog; it stays open next to the window."""
+        if self._query_stats is None:
+            from app.ui.dialogs.query_stats import QueryStatsDialog
+
+            self._query_stats = QueryStatsDialog(parent=self)
+        self._query_stats.show()
+        self._query_stats.raise_()
+
     def create_button_panel(self) -> QWidget:
         """Create button panel (currently unused)."""
         panel = QWidget()
@@ -0,0 +1,105 @@
+"""Benchmark fixtures: generated fleets of several sizes."""
+import os
+from pathlib import Path
+
+import pytest
+from peewee import fn
+
+from app.database import IASDatabase
+from app.services.catalog import invalidate_catalog
+from app.services.db_worker import get_executor
+from data.models import (
+    AgregateBase,
+    FailureEvent,
+    FailureSnapshot,
+    FailureSnapshotItem,
+    GroupBase,
+    OsobAgregateAddBase,
+    OsobAgregateRemoveBase,
+    OsobBase,
+    OsobPlaneBase,
+    OsobSystemAddBase,
+    OsobSystemRemoveBase,
+    OtkazAgregateBase,
+    PlaneBase,
+    PlaneEffectiveAgregate,
+    PodrazdBase,
+    SystemBase,
+    TypeBase,
+)
+from data.models.effective import create_effective_triggers
+from data.models.history import create_history_triggers
+from data.models.search import create_search_index
+from data.seed import SeedConfig, seed_database
+
+# Benchmarks run headless unless a platform is chosen explicitly
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# Fleet name -> SeedConfig scale (medium: 300 aircraft, 4500 agregates, 6000 failures)
+FLEETS: dict[str, float] = {"small": 0.25, "medium": 1.0, "large": 2.0}
+
+BASELINES = Path(__file__).resolve().parent / "baselines"
+DEFAULT_STORAGE = "file://./.benchmarks"
+
+MODELS = [
+    TypeBase,
+    PodrazdBase,
+    GroupBase,
+    SystemBase,
+    AgregateBase,
+    PlaneBase,
+    OsobBase,
+    OsobPlaneBase,
+    OsobSystemAddBase,
+    OsobSystemRemoveBase,
+    OsobAgregateAddBase,
+    OsobAgregateRemoveBase,
+    OtkazAgregateBase,
+    PlaneEffectiveAgregate,
+    FailureEvent,
+    FailureSnapshot,
+    FailureSnapshotItem,
+]
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Keep saved runs in benchmarks/baselines and report by fleet unless told otherwise."""
+    if getattr(config.option, "benchmark_storage", None) == DEFAULT_STORAGE:
+        config.option.benchmark_storage = BASELINES.as_uri()
+    if getattr(config.option, "benchmark_group_by", None) == "group":
+        config.option.benchmark_group_by = "param:fleet"
+
+
+@pytest.fixture(scope="session", params=list(FLEETS))
+def fleet(request: pytest.FixtureRequest) -> IASDatabase:
+    """In-memory database filled with a generated fleet of the parametrized size."""
+    database = IASDatabase(":memory:", pragmas={"foreign_keys": 1})
+    database.bind(MODELS, bind_refs=False, bind_backrefs=False)
+    database.create_tables(MODELS)
+    create_effective_triggers(database)
+    create_search_index(database)
+    create_history_triggers(database)
+    # In-memory database exists per connection: run worker tasks inline
+    get_executor().synchronous = True
+    seed_database(SeedConfig().scaled(FLEETS[request.param]), database)
+    invalidate_catalog()
+    yield database
+    database.close()
+
+
+@pytest.fixture
+def plane(fleet: IASDatabase) -> PlaneBase:
+    """Aircraft with the most failure records."""
+    return (
+        PlaneBase.select()
+        .join(OtkazAgregateBase)
+        .group_by(PlaneBase.id)
+        .order_by(fn.COUNT(OtkazAgregateBase.id).desc(), PlaneBase.id)
+        .get()
+    )
+
+
+@pytest.fixture
+def osob(fleet: IASDatabase) -> OsobBase:
+    """First feature of the fleet."""
+    return OsobBase.select().order_by(OsobBase.id).get()
@@ -0,0 +1,42 @@
+"""Benchmarks of opening and saving windows."""
+from app.ui.dialogs.osob_features import OsobFeatureDialog
+from app.ui.dialogs.plane_ispravnost import AddOtkazDialog, IspravnostFrame
+from data.models import OtkazAgregateBase, SystemBase
+
+
+def test_ispravnost_frame(benchmark, qapp, fleet) -> None:
+    """Build the fleet overview with a tile per aircraft."""
+    frame = benchmark(IspravnostFrame)
+    assert frame.fleet_model.rowCount() > 0
+
+
+def test_add_otkaz_dialog_new(benchmark, qapp, plane) -> None:
+    """Open the failure dialog for a new record."""
+    benchmark(AddOtkazDialog, plane)
+
+
+def test_add_otkaz_dialog_edit(benchmark, qapp, plane) -> None:
+    """Open the failure dialog for an existing record (cascading combo boxes)."""
+    item = OtkazAgregateBase.select().where(OtkazAgregateBase.plane == plane).first()
+    dialog = benchmark(AddOtkazDialog, plane, item)
+    assert dialog.agregate_combo.currentData() == item.agregate
+
+
+def test_osob_feature_dialog_open(benchmark, qapp, osob) -> None:
+    """Open the feature dialog: four catalog trees of the aircraft type."""
+    dialog = benchmark(OsobFeatureDialog, osob)
+    assert dialog.block_remove_model.rowCount() > 0
+
+
+def test_osob_feature_dialog_save(benchmark, qapp, osob) -> None:
+    """Save a feature after toggling a whole system."""
+    system = SystemBase.select().where(SystemBase.plane_type == osob.plane_type).order_by(SystemBase.id).first()
+    rounds = iter(range(1000))
+
+    def open_and_toggle() -> tuple[tuple, dict]:
+        dialog = OsobFeatureDialog(osob)
+        # Alternate so every round writes links
+        dialog.system_remove_model.set_checked(system.id, next(rounds) % 2 == 0)
+        return (dialog,), {}
+
+    benchmark.pedantic(lambda dialog: dialog.save_item(), setup=open_and_toggle, rounds=10)
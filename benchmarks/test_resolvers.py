@@ -0,0 +1,29 @@
+"""Benchmarks of the feature-aware catalog resolvers."""
+from data.models import PlaneBase, PlaneEffectiveAgregate
+from data.models.osob import get_effective_agregates, get_effective_systems, get_planes_with_agregate
+
+# Aircraft resolved per call, about one division
+PLANE_COUNT = 20
+
+
+def plane_ids() -> list[int]:
+    """Get ids of the first aircraft of the fleet."""
+    return [plane_id for plane_id, in PlaneBase.select(PlaneBase.id).order_by(PlaneBase.id).limit(PLANE_COUNT).tuples()]
+
+
+def test_effective_systems(benchmark, fleet) -> None:
+    """Resolve systems of a division's aircraft (UNION over feature links)."""
+    result = benchmark(get_effective_systems, plane_ids())
+    assert all(result.values())
+
+
+def test_effective_agregates(benchmark, fleet) -> None:
+    """Resolve agregates of a division's aircraft (trigger-maintained table)."""
+    result = benchmark(get_effective_agregates, plane_ids())
+    assert all(result.values())
+
+
+def test_planes_with_agregate(benchmark, fleet) -> None:
+    """Find aircraft carrying an agregate."""
+    agregate_id = PlaneEffectiveAgregate.select(PlaneEffectiveAgregate.agregate).scalar()
+    assert benchmark(get_planes_with_agregate, agregate_id)
@@ -0,0 +1,30 @@
+"""Benchmarks of the table models."""
+import pytest
+
+from app.ui.widgets.tables import (
+    AgregateModel,
+    GroupModel,
+    IspravnostTableModel,
+    OsobModel,
+    PlanesModel,
+    PlanesTypesModel,
+    PodrazdModel,
+    SystemModel,
+)
+
+SETTINGS_MODELS = [PlanesTypesModel, PodrazdModel, GroupModel, SystemModel, AgregateModel, PlanesModel, OsobModel]
+
+
+def test_ispravnost_load(benchmark, qapp, plane) -> None:
+    """Load the first page of an aircraft's failures."""
+    model = IspravnostTableModel(plane)
+    benchmark(model.load_data)
+    assert model.rowCount() > 0
+
+
+@pytest.mark.parametrize("model_class", SETTINGS_MODELS, ids=lambda model_class: model_class.__name__)
+def test_settings_model_load(benchmark, qapp, fleet, model_class) -> None:
+    """Load a settings table with all its rows."""
+    model = model_class()
+    benchmark(model.load_data)
+    assert model.rowCount() > 0
@@ -1,5 +1,7 @@
 """Legacy init_tables module - backward compatibility."""
-from app.database import get_database, run_migrations
+from typing import TYPE_CHECKING
+
+from app.database import run_migrations
 from data.models import (
     AgregateBase,
     GroupBase,
@@ -14,9 +16,11 @@ from data.models import (
     PodrazdBase,
     SystemBase,
     TypeBase,
+    db,
 )
 
-db = get_database()
+if TYPE_CHECKING:
+    from data.seed import SeedConfig
 
 
 def create_tables() -> None:
@@ -46,12 +50,11 @@ def drop_tables() -> None:
     )
 
 
-def fill_tables() -> None:
-    """Fill tables with example data.
-    Note: Example data functionality has been removed.
-    Implement your own data seeding logic here if needed.
-    """
-    pass
+def fill_tables(config: "SeedConfig | None" = None) -> dict[str, int]:
+    """Fill empty tables with generated example data (see data.seed)."""
+    from data.seed import seed_database
+
+    return seed_database(config)
 
 
 __all__ = ["create_tables", "drop_tables", "fill_tables", "db"]
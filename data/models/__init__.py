@@ -8,7 +8,9 @@ from .aircraft import (
     TypeBase,
 )
 from .base import BaseModel, db
+from .effective import PlaneEffectiveAgregate
 from .failures import OtkazAgregateBase
+from .history import FailureEvent, FailureSnapshot, FailureSnapshotItem
 from .osob import (
     OsobAgregateAddBase,
     OsobAgregateRemoveBase,
@@ -34,4 +36,8 @@ __all__ = [
     "OsobAgregateAddBase",
     "OsobAgregateRemoveBase",
     "OtkazAgregateBase",
+    "PlaneEffectiveAgregate",
+    "FailureEvent",
+    "FailureSnapshot",
+    "FailureSnapshotItem",
 ]
@@ -1,51 +1,49 @@
 """Aircraft-related models."""
-from peewee import CharField, ForeignKeyField, IntegerField
+from peewee import CharField, ForeignKeyField, IntegerField, fn
+
+from app.collation import NATURAL, RUSSIAN
 
 from .base import BaseModel
 
 
 class TypeBase(BaseModel):
     """Aircraft type model."""
-    name = CharField(unique=True)
+    name = CharField()
 
     class Meta:
         table_name = "type_base"
-        indexes = (("name", True),)
 
 
 class PodrazdBase(BaseModel):
     """Division/Unit model."""
-    name = CharField(unique=True)
+    name = CharField()
 
     class Meta:
         table_name = "podrazd_base"
-        indexes = (("name", True),)
 
 
 class GroupBase(BaseModel):
     """Maintenance group model."""
-    plane_type = ForeignKeyField(TypeBase, backref="groups", on_delete="CASCADE")
-    name = CharField(unique=True)
+    plane_type = ForeignKeyField(TypeBase, backref="groups", on_delete="CASCADE", index=False)
+    name = CharField()
 
     class Meta:
         table_name = "group_base"
-        indexes = (("name", True),)
 
 
 class SystemBase(BaseModel):
     """Aircraft system model."""
-    plane_type = ForeignKeyField(TypeBase, backref="systems", on_delete="CASCADE")
-    name = CharField(unique=True)
-    group = ForeignKeyField(GroupBase, backref="systems", on_delete="CASCADE")
+    plane_type = ForeignKeyField(TypeBase, backref="systems", on_delete="CASCADE", index=False)
+    name = CharField()
+    group = ForeignKeyField(GroupBase, backref="systems", on_delete="CASCADE", index=False)
 
     class Meta:
         table_name = "system_base"
-        indexes = (("name", True),)
 
 
 class AgregateBase(BaseModel):
     """Agregate/Unit model."""
-    system = ForeignKeyField(SystemBase, backref="agregates", on_delete="CASCADE")
+    system = ForeignKeyField(SystemBase, backref="agregates", on_delete="CASCADE", index=False)
     count_on_plane = IntegerField(default=1)
     name = CharField()
 
@@ -55,11 +53,28 @@ class AgregateBase(BaseModel):
 
 class PlaneBase(BaseModel):
     """Aircraft model."""
-    plane_type = ForeignKeyField(TypeBase, backref="planes", on_delete="CASCADE")
-    podrazd = ForeignKeyField(PodrazdBase, backref="planes", on_delete="CASCADE")
-    zav_num = CharField(unique=True)
+    plane_type = ForeignKeyField(TypeBase, backref="planes", on_delete="CASCADE", index=False)
+    podrazd = ForeignKeyField(PodrazdBase, backref="planes", on_delete="CASCADE", index=False)
+    zav_num = CharField()
     bort_number = CharField()
 
     class Meta:
         table_name = "plane_base"
-        indexes = (("zav_num", True),)
+
+
+TypeBase.add_index(TypeBase.name, unique=True, name="idx_type_base_name")
+TypeBase.add_index(TypeBase.name.collate(RUSSIAN), name="idx_type_base_name_ru")
+PodrazdBase.add_index(PodrazdBase.name, unique=True, name="idx_podrazd_base_name")
+PodrazdBase.add_index(PodrazdBase.name.collate(RUSSIAN), name="idx_podrazd_base_name_ru")
+GroupBase.add_index(GroupBase.name, unique=True, name="idx_group_base_name")
+GroupBase.add_index(GroupBase.plane_type, GroupBase.name.collate(RUSSIAN), name="idx_group_base_plane_type")
+SystemBase.add_index(SystemBase.name, unique=True, name="idx_system_base_name")
+SystemBase.add_index(SystemBase.group, SystemBase.name.collate(RUSSIAN), name="idx_system_base_group")
+SystemBase.add_index(SystemBase.plane_type, name="idx_system_base_plane_type")
+AgregateBase.add_index(AgregateBase.system, AgregateBase.name.collate(RUSSIAN), name="idx_agregate_base_system")
+AgregateBase.add_index(AgregateBase.name.collate(RUSSIAN), name="idx_agregate_base_name_ru")
+AgregateBase.add_index(fn.casefold(AgregateBase.name), name="idx_agregate_base_name_casefold")
+PlaneBase.add_index(PlaneBase.zav_num, unique=True, name="idx_plane_base_zav_num")
+PlaneBase.add_index(PlaneBase.podrazd, PlaneBase.bort_number.collate(NATURAL), name="idx_plane_base_podrazd")
+PlaneBase.add_index(PlaneBase.bort_number.collate(NATURAL), name="idx_plane_base_bort_number")
+PlaneBase.add_index(PlaneBase.plane_type, name="idx_plane_base_plane_type")
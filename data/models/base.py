@@ -1,12 +1,17 @@
 """Base model and database connection."""
 import datetime
+from collections.abc import Callable
+from typing import Any, TypeVar
 
 from peewee import DateTimeField, IntegerField, Model
 
 from app.database import get_database
 
+# Shared application database (the same instance everywhere)
 db = get_database()
 
+T = TypeVar("T")
+
 
 class BaseModel(Model):
     """Base model with auto-increment ID and created_at timestamp."""
@@ -15,3 +20,8 @@ class BaseModel(Model):
 
     class Meta:
         database = db
+
+    @classmethod
+    def run_in_transaction(cls, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run func in one transaction on the model's database, retrying on SQLITE_BUSY."""
+        return cls._meta.database.run_in_transaction(func, *args, **kwargs)
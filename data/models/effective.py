@@ -0,0 +1,173 @@
+"""Materialized effective configuration: which agregates each aircraft carries.
+
+The ``plane_effective_agregate`` table holds, for every aircraft, the
+agregates of its type not removed by any of its features (directly or
+through a removed system) plus the agregates added by its features
+(directly or through an added system). It is kept up to date by SQLite
+triggers on the source tables, so every write path (dialogs, bulk queries,
+cascades) keeps it consistent without application code.
+
+Migrations freeze their own copy of this SQL: a change here needs a new
+migration recreating the triggers.
+"""
+from typing import Any
+
+from peewee import CompositeKey, ForeignKeyField, Model
+
+from .aircraft import AgregateBase, PlaneBase
+from .base import db
+
+TABLE_NAME = "plane_effective_agregate"
+
+_EFFECTIVE_SELECT = (
+    "SELECT p.id, a.id FROM plane_base AS p "
+    "JOIN system_base AS s ON s.plane_type_id = p.plane_type_id "
+    "JOIN agregate_base AS a ON a.system_id = s.id "
+    "WHERE {plane} AND {agregate} AND NOT EXISTS ("
+    "SELECT 1 FROM osob_agregate_remove_base AS r "
+    "JOIN osob_plane_base AS op ON op.osob_id = r.osob_id "
+    "WHERE op.plane_id = p.id AND r.agregate_id = a.id) "
+    "AND NOT EXISTS ("
+    "SELECT 1 FROM osob_system_remove_base AS rs "
+    "JOIN osob_plane_base AS op ON op.osob_id = rs.osob_id "
+    "WHERE op.plane_id = p.id AND rs.system_id = s.id) "
+    "UNION "
+    "SELECT p.id, a.id FROM osob_plane_base AS op "
+    "JOIN plane_base AS p ON p.id = op.plane_id "
+    "JOIN osob_agregate_add_base AS aa ON aa.osob_id = op.osob_id "
+    "JOIN agregate_base AS a ON a.id = aa.agregate_id "
+    "WHERE {plane} AND {agregate} "
+    "UNION "
+    "SELECT p.id, a.id FROM osob_plane_base AS op "
+    "JOIN plane_base AS p ON p.id = op.plane_id "
+    "JOIN osob_system_add_base AS sa ON sa.osob_id = op.osob_id "
+    "JOIN agregate_base AS a ON a.system_id = sa.system_id "
+    "WHERE {plane} AND {agregate}"
+)
+
+
+def _refresh_statements(plane: str | None = None, agregate: str | None = None) -> list[str]:
+    """Build DELETE and INSERT statements recomputing the given (plane, agregate) slice.
+
+    ``plane`` and ``agregate`` are SQL expressions producing a set of ids,
+    e.g. ``"NEW.plane_id"`` or a subquery; None means all.
+    """
+    plane_cond = f"plane_id IN ({plane})" if plane else "1"
+    agregate_cond = f"agregate_id IN ({agregate})" if agregate else "1"
+    select = _EFFECTIVE_SELECT.format(
+        plane=f"p.id IN ({plane})" if plane else "1",
+        agregate=f"a.id IN ({agregate})" if agregate else "1",
+    )
+    return [
+        f"DELETE FROM {TABLE_NAME} WHERE {plane_cond} AND {agregate_cond}",
+        f"INSERT OR IGNORE INTO {TABLE_NAME} (plane_id, agregate_id) {select}",
+    ]
+
+
+def _refresh_sql(plane: str | None = None, agregate: str | None = None) -> str:
+    """Build trigger body recomputing the given (plane, agregate) slice."""
+    return " ".join(f"{statement};" for statement in _refresh_statements(plane, agregate))
+
+
+def _trigger(name: str, event: str, table: str, body: str) -> tuple[str, str]:
+    """Build (name, CREATE TRIGGER statement) pair."""
+    return name, f"CREATE TRIGGER IF NOT EXISTS {name} AFTER {event} ON {table} FOR EACH ROW BEGIN {body} END"
+
+
+_FEATURE_PLANES = "SELECT plane_id FROM osob_plane_base WHERE osob_id = {}.osob_id"
+
+_TRIGGER_LIST: list[tuple[str, str]] = [
+    # Aircraft: type catalog changes with the aircraft type
+    _trigger("pea_plane_ai", "INSERT", "plane_base", _refresh_sql(plane="NEW.id")),
+    _trigger("pea_plane_au", "UPDATE OF plane_type_id", "plane_base", _refresh_sql(plane="NEW.id")),
+    _trigger("pea_plane_ad", "DELETE", "plane_base", f"DELETE FROM {TABLE_NAME} WHERE plane_id = OLD.id;"),
+    # Feature assigned to / removed from aircraft
+    _trigger("pea_osob_plane_ai", "INSERT", "osob_plane_base", _refresh_sql(plane="NEW.plane_id")),
+    _trigger("pea_osob_plane_ad", "DELETE", "osob_plane_base", _refresh_sql(plane="OLD.plane_id")),
+    _trigger(
+        "pea_osob_plane_au", "UPDATE", "osob_plane_base",
+        _refresh_sql(plane="OLD.plane_id") + " " + _refresh_sql(plane="NEW.plane_id"),
+    ),
+    # Catalog changes
+    _trigger("pea_agregate_ai", "INSERT", "agregate_base", _refresh_sql(agregate="NEW.id")),
+    _trigger("pea_agregate_au", "UPDATE OF system_id", "agregate_base", _refresh_sql(agregate="NEW.id")),
+    _trigger("pea_agregate_ad", "DELETE", "agregate_base", f"DELETE FROM {TABLE_NAME} WHERE agregate_id = OLD.id;"),
+    _trigger(
+        "pea_system_au", "UPDATE OF plane_type_id", "system_base",
+        _refresh_sql(agregate="SELECT id FROM agregate_base WHERE system_id = NEW.id"),
+    ),
+]
+
+for _table in ("osob_agregate_add_base", "osob_agregate_remove_base"):
+    _short = "add" if _table.endswith("add_base") else "remove"
+    _TRIGGER_LIST += [
+        _trigger(
+            f"pea_{_short}_ai", "INSERT", _table,
+            _refresh_sql(plane=_FEATURE_PLANES.format("NEW"), agregate="NEW.agregate_id"),
+        ),
+        _trigger(
+            f"pea_{_short}_ad", "DELETE", _table,
+            _refresh_sql(plane=_FEATURE_PLANES.format("OLD"), agregate="OLD.agregate_id"),
+        ),
+        _trigger(
+            f"pea_{_short}_au", "UPDATE", _table,
+            _refresh_sql(plane=_FEATURE_PLANES.format("OLD"), agregate="OLD.agregate_id")
+            + " "
+            + _refresh_sql(plane=_FEATURE_PLANES.format("NEW"), agregate="NEW.agregate_id"),
+        ),
+    ]
+
+_SYSTEM_AGREGATES = "SELECT id FROM agregate_base WHERE system_id = {}.system_id"
+
+for _table in ("osob_system_add_base", "osob_system_remove_base"):
+    _short = "system_add" if _table.endswith("add_base") else "system_remove"
+    _TRIGGER_LIST += [
+        _trigger(
+            f"pea_{_short}_ai", "INSERT", _table,
+            _refresh_sql(plane=_FEATURE_PLANES.format("NEW"), agregate=_SYSTEM_AGREGATES.format("NEW")),
+        ),
+        _trigger(
+            f"pea_{_short}_ad", "DELETE", _table,
+            _refresh_sql(plane=_FEATURE_PLANES.format("OLD"), agregate=_SYSTEM_AGREGATES.format("OLD")),
+        ),
+        _trigger(
+            f"pea_{_short}_au", "UPDATE", _table,
+            _refresh_sql(plane=_FEATURE_PLANES.format("OLD"), agregate=_SYSTEM_AGREGATES.format("OLD"))
+            + " "
+            + _refresh_sql(plane=_FEATURE_PLANES.format("NEW"), agregate=_SYSTEM_AGREGATES.format("NEW")),
+        ),
+    ]
+
+TRIGGERS: dict[str, str] = dict(_TRIGGER_LIST)
+REBUILD_SQL: list[str] = _refresh_statements()
+
+
+class PlaneEffectiveAgregate(Model):
+    """Agregate carried by an aircraft after applying its features (trigger-maintained)."""
+    plane = ForeignKeyField(PlaneBase, backref="effective_agregates", on_delete="CASCADE", index=False)
+    agregate = ForeignKeyField(AgregateBase, backref="effective_planes", on_delete="CASCADE", index=False)
+
+    class Meta:
+        database = db
+        table_name = TABLE_NAME
+        primary_key = CompositeKey("plane", "agregate")
+        without_rowid = True
+
+
+PlaneEffectiveAgregate.add_index(
+    PlaneEffectiveAgregate.agregate, PlaneEffectiveAgregate.plane, name=f"idx_{TABLE_NAME}_agregate"
+)
+
+
+def create_effective_triggers(database: Any) -> None:
+    """Install maintenance triggers on database."""
+    for statement in TRIGGERS.values():
+        database.execute_sql(statement)
+
+
+def rebuild_effective_agregates(database: Any | None = None) -> None:
+    """Recompute the whole table from source tables."""
+    database = database or PlaneEffectiveAgregate._meta.database
+    with database.atomic():
+        for statement in REBUILD_SQL:
+            database.execute_sql(statement)
@@ -7,11 +7,15 @@ from .base import BaseModel
 
 class OtkazAgregateBase(BaseModel):
     """Failed agregate/unit model."""
-    agregate = ForeignKeyField(AgregateBase, backref="otkaz_agregates", on_delete="CASCADE")
-    plane = ForeignKeyField(PlaneBase, backref="otkaz_agregates", on_delete="CASCADE")
+    agregate = ForeignKeyField(AgregateBase, backref="otkaz_agregates", on_delete="CASCADE", index=False)
+    plane = ForeignKeyField(PlaneBase, backref="otkaz_agregates", on_delete="CASCADE", index=False)
     description = CharField(default="")
     number = CharField()
     removed = BooleanField(default=False)
 
     class Meta:
         table_name = "otkaz_agregate_base"
+
+
+OtkazAgregateBase.add_index(OtkazAgregateBase.plane, OtkazAgregateBase.removed, name="idx_otkaz_agregate_base_plane")
+OtkazAgregateBase.add_index(OtkazAgregateBase.agregate, name="idx_otkaz_agregate_base_agregate")
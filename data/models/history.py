@@ -0,0 +1,141 @@
+"""Failure history: append-only event log and periodic snapshots.
+
+Every change of ``otkaz_agregate_base`` appends a ``failure_event`` row
+holding the failure state after the change (for ``closed``, the last state):
+
+- ``opened``: a failure was recorded
+- ``changed``: its agregate, unit number, note or removed flag changed
+- ``removed``: its unit was removed from the aircraft
+- ``closed``: the failure was deleted (directly or with its aircraft)
+
+A failure moved to another aircraft is closed on the old one and opened on
+the new one, so each aircraft's history stays complete on its own. Events
+are written by SQLite triggers like ``plane_effective_agregate``, so every
+write path logs them; history rows keep plain ids and outlive the aircraft,
+agregates and failures they describe.
+
+``failure_snapshot`` copies the failure table as of its last event, so the
+state at a moment is the latest snapshot before it plus the events after
+that snapshot.
+
+Migrations freeze their own copy of this SQL: a change here needs a new
+migration recreating the triggers.
+"""
+from typing import Any
+
+from peewee import BooleanField, CharField, CompositeKey, ForeignKeyField, IntegerField, Model
+
+from .base import BaseModel, db
+
+OPENED = "opened"
+CHANGED = "changed"
+REMOVED = "removed"
+CLOSED = "closed"
+
+EVENT_TABLE = "failure_event"
+
+# Local time with milliseconds, comparable with created_at written by Python
+NOW_SQL = "strftime('%Y-%m-%d %H:%M:%f', 'now', 'localtime')"
+
+_STATE = "otkaz_id, plane_id, agregate_id, number, description, removed"
+
+
+class FailureEvent(BaseModel):
+    """Change of a failure record (trigger-written, never updated)."""
+    otkaz_id = IntegerField()
+    plane_id = IntegerField()
+    agregate_id = IntegerField()
+    kind = CharField()
+    number = CharField()
+    description = CharField(default="")
+    removed = BooleanField(default=False)
+
+    class Meta:
+        table_name = EVENT_TABLE
+
+
+class FailureSnapshot(BaseModel):
+    """Copy of all failures as of event ``last_event_id``."""
+    last_event_id = IntegerField()
+
+    class Meta:
+        table_name = "failure_snapshot"
+
+
+class FailureSnapshotItem(Model):
+    """Failure state stored in a snapshot."""
+    snapshot = ForeignKeyField(FailureSnapshot, backref="items", on_delete="CASCADE", index=False)
+    otkaz_id = IntegerField()
+    plane_id = IntegerField()
+    agregate_id = IntegerField()
+    number = CharField()
+    description = CharField(default="")
+    removed = BooleanField(default=False)
+
+    class Meta:
+        database = db
+        table_name = "failure_snapshot_item"
+        primary_key = CompositeKey("snapshot", "otkaz_id")
+        without_rowid = True
+
+
+FailureEvent.add_index(FailureEvent.plane_id, FailureEvent.created_at, name="idx_failure_event_plane")
+FailureEvent.add_index(FailureEvent.agregate_id, FailureEvent.created_at, name="idx_failure_event_agregate")
+FailureEvent.add_index(FailureEvent.otkaz_id, name="idx_failure_event_otkaz")
+FailureSnapshot.add_index(FailureSnapshot.created_at, name="idx_failure_snapshot_created")
+FailureSnapshotItem.add_index(
+    FailureSnapshotItem.snapshot, FailureSnapshotItem.plane_id, name="idx_failure_snapshot_item_plane"
+)
+
+
+def _log(kind: str, row: str) -> str:
+    """SQL appending an event with the state of row (NEW or OLD)."""
+    return (
+        f"INSERT INTO {EVENT_TABLE} (created_at, kind, {_STATE}) VALUES ({NOW_SQL}, {kind}, "
+        f"{row}.id, {row}.plane_id, {row}.agregate_id, {row}.number, {row}.description, {row}.removed);"
+    )
+
+
+def _trigger(name: str, event: str, when: str, body: str) -> tuple[str, str]:
+    condition = f" WHEN {when}" if when else ""
+    return name, (
+        f"CREATE TRIGGER IF NOT EXISTS {name} AFTER {event} ON otkaz_agregate_base "
+        f"FOR EACH ROW{condition} BEGIN {body} END"
+    )
+
+
+TRIGGERS: dict[str, str] = dict([
+    _trigger("history_otkaz_ai", "INSERT", "", _log(f"'{OPENED}'", "NEW")),
+    _trigger(
+        "history_otkaz_au", "UPDATE",
+        "OLD.plane_id = NEW.plane_id AND (OLD.agregate_id, OLD.number, OLD.description, OLD.removed) "
+        "IS NOT (NEW.agregate_id, NEW.number, NEW.description, NEW.removed)",
+        _log(f"CASE WHEN NEW.removed AND NOT OLD.removed THEN '{REMOVED}' ELSE '{CHANGED}' END", "NEW"),
+    ),
+    _trigger(
+        "history_otkaz_moved", "UPDATE OF plane_id", "OLD.plane_id <> NEW.plane_id",
+        _log(f"'{CLOSED}'", "OLD") + " " + _log(f"'{OPENED}'", "NEW"),
+    ),
+    _trigger("history_otkaz_ad", "DELETE", "", _log(f"'{CLOSED}'", "OLD")),
+])
+
+# Opens failures that have no history yet at their creation time (existing
+# data when the log starts, bulk loads with the triggers dropped)
+BACKFILL_SQL = (
+    f"INSERT INTO {EVENT_TABLE} (created_at, kind, {_STATE}) "
+    f"SELECT o.created_at, '{OPENED}', o.id, o.plane_id, o.agregate_id, o.number, o.description, o.removed "
+    f"FROM otkaz_agregate_base AS o WHERE NOT EXISTS (SELECT 1 FROM {EVENT_TABLE} AS e WHERE e.otkaz_id = o.id) "
+    "ORDER BY o.created_at, o.id"
+)
+
+
+def create_history_triggers(database: Any) -> None:
+    """Install event log triggers on database."""
+    for statement in TRIGGERS.values():
+        database.execute_sql(statement)
+
+
+def backfill_history(database: Any | None = None) -> None:
+    """Log an opening event for every failure without history."""
+    database = database or FailureEvent._meta.database
+    database.execute_sql(BACKFILL_SQL)
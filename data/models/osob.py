@@ -1,94 +1,142 @@
 """Aircraft features (osobennosti) models."""
+from collections.abc import Iterable
 from typing import Any
 
-from peewee import CharField, ForeignKeyField
+from peewee import SQL, CharField, ForeignKeyField, chunked, fn
 
 from .aircraft import AgregateBase, PlaneBase, SystemBase, TypeBase
 from .base import BaseModel
+from .effective import PlaneEffectiveAgregate
+
+
+# Ids per statement in bulk link writes, below SQLite's default variable limit
+LINK_BATCH_SIZE = 400
+
+
+def _plane_ids(planes: Iterable[PlaneBase | int]) -> list[int]:
+    """Normalize aircraft instances or ids to a list of ids."""
+    return [plane.id if isinstance(plane, PlaneBase) else int(plane) for plane in planes]
+
+
+def _resolve_effective(
+    model: type[BaseModel],
+    add_model: type[BaseModel],
+    remove_model: type[BaseModel],
+    link: str,
+    plane_ids: list[int],
+    filters: list[Any],
+) -> dict[int, list[Any]]:
+    """Resolve effective catalog rows for aircraft in a single UNION statement.
+
+    Rows of the aircraft type not removed by any of its features, plus rows
+    added by any of its features. ``model`` must have a ``plane_type``
+    field. Every returned instance carries a ``plane_id`` attribute.
+    """
+    if not plane_ids:
+        return {}
+
+    fields = model._meta.sorted_fields
+    link_to_model = getattr(remove_model, link) == model.id
+
+    removed = (
+        remove_model.select(SQL("1"))
+        .join(OsobPlaneBase, on=(OsobPlaneBase.osob == remove_model.osob))
+        .where((OsobPlaneBase.plane == PlaneBase.id) & link_to_model)
+    )
+    base = (
+        model.select(PlaneBase.id.alias("plane_id"), *fields)
+        .join(PlaneBase, on=(PlaneBase.plane_type == model.plane_type))
+        .where(PlaneBase.id.in_(plane_ids))
+        .where(~fn.EXISTS(removed))
+    )
+
+    added = (
+        model.select(OsobPlaneBase.plane.alias("plane_id"), *fields)
+        .join(add_model, on=(getattr(add_model, link) == model.id))
+        .join(OsobPlaneBase, on=(OsobPlaneBase.osob == add_model.osob))
+        .where(OsobPlaneBase.plane.in_(plane_ids))
+    )
+
+    for condition in filters:
+        base = base.where(condition)
+        added = added.where(condition)
+
+    result: dict[int, list[Any]] = {plane_id: [] for plane_id in plane_ids}
+    for row in (base | added).order_by(SQL("plane_id"), SQL("name")).objects():
+        result[row.plane_id].append(row)
+    return result
+
+
+def get_effective_systems(
+    planes: Iterable[PlaneBase | int], group: Any | None = None
+) -> dict[int, list[SystemBase]]:
+    """Get effective systems for many aircraft at once, keyed by aircraft id."""
+    filters = [SystemBase.group == group] if group else []
+    return _resolve_effective(
+        SystemBase, OsobSystemAddBase, OsobSystemRemoveBase, "system", _plane_ids(planes), filters
+    )
+
+
+def get_effective_agregates(
+    planes: Iterable[PlaneBase | int], system: Any | None = None, group: Any | None = None
+) -> dict[int, list[AgregateBase]]:
+    """Get effective agregates for many aircraft at once, keyed by aircraft id.
+
+    Reads the trigger-maintained ``plane_effective_agregate`` table.
+    """
+    plane_ids = _plane_ids(planes)
+    if not plane_ids:
+        return {}
+
+    query = (
+        AgregateBase.select(PlaneEffectiveAgregate.plane.alias("plane_id"), *AgregateBase._meta.sorted_fields)
+        .join(PlaneEffectiveAgregate, on=(PlaneEffectiveAgregate.agregate == AgregateBase.id))
+        .where(PlaneEffectiveAgregate.plane.in_(plane_ids))
+    )
+    if system:
+        query = query.where(AgregateBase.system == system)
+    if group:
+        query = query.join_from(AgregateBase, SystemBase).where(SystemBase.group == group)
 
+    result: dict[int, list[AgregateBase]] = {plane_id: [] for plane_id in plane_ids}
+    for row in query.order_by(PlaneEffectiveAgregate.plane, AgregateBase.name).objects():
+        result[row.plane_id].append(row)
+    return result
 
-def get_available_systems_for_plane(plane: PlaneBase, group: Any | None = None) -> list[SystemBase]:
-    """Get systems available for aircraft considering features."""
-    # Get features for this aircraft
-    aircraft_features = [
-        op.osob for op in OsobPlaneBase.select().where(OsobPlaneBase.plane == plane)
-    ]
-
-    # Get systems to remove and add from features
-    systems_to_remove = set()
-    systems_to_add = set()
-
-    for feature in aircraft_features:
-        systems_to_remove.update(
-            osr.system for osr in OsobSystemRemoveBase.select().where(OsobSystemRemoveBase.osob == feature)
-        )
-        systems_to_add.update(
-            osa.system for osa in OsobSystemAddBase.select().where(OsobSystemAddBase.osob == feature)
-        )
-
-    # Get base systems for this aircraft type
-    base_query = SystemBase.select()
-    base_query = base_query.where(SystemBase.plane_type == plane.plane_type)
-
-    if group:
-        base_query = base_query.where(SystemBase.group == group)
 
-    base_systems = set(base_query)
+def get_planes_with_agregate(agregate: Any) -> list[PlaneBase]:
+    """Get aircraft that carry the agregate after applying their features."""
+    return list(
+        PlaneBase.select()
+        .join(PlaneEffectiveAgregate, on=(PlaneEffectiveAgregate.plane == PlaneBase.id))
+        .where(PlaneEffectiveAgregate.agregate == agregate)
+        .order_by(PlaneBase.id)
+    )
 
-    # Apply modifications
-    available_systems = (base_systems - systems_to_remove) | systems_to_add
 
-    return list(available_systems)
+def get_available_systems_for_plane(plane: PlaneBase, group: Any | None = None) -> list[SystemBase]:
+    """Get systems available for aircraft considering features."""
+    return get_effective_systems([plane], group)[plane.id]
 
 
 def get_available_agregates_for_plane(plane: PlaneBase, system: SystemBase | None = None) -> list[AgregateBase]:
     """Get agregates available for aircraft considering features."""
-    # Get features for this aircraft
-    aircraft_features = [
-        op.osob for op in OsobPlaneBase.select().where(OsobPlaneBase.plane == plane)
-    ]
-
-    # Get agregates to remove and add from features
-    agregates_to_remove = set()
-    agregates_to_add = set()
-
-    for feature in aircraft_features:
-        agregates_to_remove.update(
-            oar.agregate for oar in OsobAgregateRemoveBase.select().where(OsobAgregateRemoveBase.osob == feature)
-        )
-        agregates_to_add.update(
-            oaa.agregate for oaa in OsobAgregateAddBase.select().where(OsobAgregateAddBase.osob == feature)
-        )
-
-    # Get base agregates for this aircraft type
-    base_query = AgregateBase.select().join(SystemBase, on=(AgregateBase.system == SystemBase.id))
-    base_query = base_query.where(SystemBase.plane_type == plane.plane_type)
-
-    if system:
-        base_query = base_query.where(AgregateBase.system == system)
-
-    base_agregates = set(base_query)
-
-    # Apply modifications
-    available_agregates = (base_agregates - agregates_to_remove) | agregates_to_add
-
-    return list(available_agregates)
+    return get_effective_agregates([plane], system)[plane.id]
 
 
 class OsobBase(BaseModel):
     """Feature model for aircraft types."""
-    plane_type = ForeignKeyField(TypeBase, backref="osobs", on_delete="CASCADE")
-    name = CharField(unique=True)
+    plane_type = ForeignKeyField(TypeBase, backref="osobs", on_delete="CASCADE", index=False)
+    name = CharField()
 
     class Meta:
         table_name = "osob_base"
-        indexes = (("name", True),)
 
 
 class OsobPlaneBase(BaseModel):
     """Link between feature and aircraft."""
-    osob = ForeignKeyField(OsobBase, backref="osobs", on_delete="CASCADE")
-    plane = ForeignKeyField(PlaneBase, on_delete="CASCADE")
+    osob = ForeignKeyField(OsobBase, backref="osobs", on_delete="CASCADE", index=False)
+    plane = ForeignKeyField(PlaneBase, on_delete="CASCADE", index=False)
 
     class Meta:
         table_name = "osob_plane_base"
@@ -96,8 +144,8 @@ class OsobPlaneBase(BaseModel):
 
 class OsobSystemAddBase(BaseModel):
     """Systems to add for specific feature."""
-    osob = ForeignKeyField(OsobBase, backref="systems_to_add", on_delete="CASCADE")
-    system = ForeignKeyField(SystemBase, on_delete="CASCADE")
+    osob = ForeignKeyField(OsobBase, backref="systems_to_add", on_delete="CASCADE", index=False)
+    system = ForeignKeyField(SystemBase, on_delete="CASCADE", index=False)
 
     class Meta:
         table_name = "osob_system_add_base"
@@ -105,8 +153,8 @@ class OsobSystemAddBase(BaseModel):
 
 class OsobSystemRemoveBase(BaseModel):
     """Systems to remove for specific feature."""
-    osob = ForeignKeyField(OsobBase, backref="systems_to_remove", on_delete="CASCADE")
-    system = ForeignKeyField(SystemBase, on_delete="CASCADE")
+    osob = ForeignKeyField(OsobBase, backref="systems_to_remove", on_delete="CASCADE", index=False)
+    system = ForeignKeyField(SystemBase, on_delete="CASCADE", index=False)
 
     class Meta:
         table_name = "osob_system_remove_base"
@@ -114,8 +162,8 @@ class OsobSystemRemoveBase(BaseModel):
 
 class OsobAgregateAddBase(BaseModel):
     """Aggregates to add for specific feature."""
-    osob = ForeignKeyField(OsobBase, backref="agregates_to_add", on_delete="CASCADE")
-    agregate = ForeignKeyField(AgregateBase, on_delete="CASCADE")
+    osob = ForeignKeyField(OsobBase, backref="agregates_to_add", on_delete="CASCADE", index=False)
+    agregate = ForeignKeyField(AgregateBase, on_delete="CASCADE", index=False)
 
     class Meta:
         table_name = "osob_agregate_add_base"
@@ -123,8 +171,57 @@ class OsobAgregateAddBase(BaseModel):
 
 class OsobAgregateRemoveBase(BaseModel):
     """Aggregates to remove for specific feature."""
-    osob = ForeignKeyField(OsobBase, backref="agregates_to_remove", on_delete="CASCADE")
-    agregate = ForeignKeyField(AgregateBase, on_delete="CASCADE")
+    osob = ForeignKeyField(OsobBase, backref="agregates_to_remove", on_delete="CASCADE", index=False)
+    agregate = ForeignKeyField(AgregateBase, on_delete="CASCADE", index=False)
 
     class Meta:
         table_name = "osob_agregate_remove_base"
+
+
+# Feature link model -> field of the linked catalog item
+OSOB_LINK_FIELDS: dict[type[BaseModel], str] = {
+    OsobSystemRemoveBase: "system",
+    OsobSystemAddBase: "system",
+    OsobAgregateRemoveBase: "agregate",
+    OsobAgregateAddBase: "agregate",
+}
+
+
+def get_osob_link_ids(osob: Any, link_model: type[BaseModel]) -> set[int]:
+    """Get ids of catalog items linked to a feature."""
+    target = getattr(link_model, OSOB_LINK_FIELDS[link_model])
+    return {item_id for (item_id,) in link_model.select(target).where(link_model.osob == osob).tuples()}
+
+
+def save_osob_links(osob: Any, link_model: type[BaseModel], ids: Iterable[int]) -> tuple[set[int], set[int]]:
+    """Make feature links match ids, writing only the difference; returns (added, removed) ids.
+
+    Call inside a transaction: the diff and the writes must see the same state.
+    """
+    target = getattr(link_model, OSOB_LINK_FIELDS[link_model])
+    osob_id = osob.id if hasattr(osob, "id") else osob
+    wanted = set(ids)
+    stored = get_osob_link_ids(osob_id, link_model)
+    added, removed = wanted - stored, stored - wanted
+
+    for batch in chunked(sorted(removed), LINK_BATCH_SIZE):
+        link_model.delete().where((link_model.osob == osob_id) & target.in_(batch)).execute()
+    for batch in chunked(sorted(added), LINK_BATCH_SIZE):
+        rows = [(osob_id, item_id) for item_id in batch]
+        link_model.insert_many(rows, fields=[link_model.osob, target]).execute()
+    return added, removed
+
+
+OsobBase.add_index(OsobBase.name, unique=True, name="idx_osob_base_name")
+OsobBase.add_index(OsobBase.plane_type, name="idx_osob_base_plane_type")
+OsobPlaneBase.add_index(OsobPlaneBase.plane, OsobPlaneBase.osob, name="idx_osob_plane_base_plane")
+OsobPlaneBase.add_index(OsobPlaneBase.osob, OsobPlaneBase.plane, name="idx_osob_plane_base_osob")
+for _link, _target in (
+    (OsobSystemAddBase, "system"),
+    (OsobSystemRemoveBase, "system"),
+    (OsobAgregateAddBase, "agregate"),
+    (OsobAgregateRemoveBase, "agregate"),
+):
+    _table = _link._meta.table_name
+    _link.add_index(_link.osob, getattr(_link, _target), name=f"idx_{_table}_osob")
+    _link.add_index(getattr(_link, _target), _link.osob, name=f"idx_{_table}_{_target}")
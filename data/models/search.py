@@ -0,0 +1,101 @@
+"""Full-text search index over failures and aircraft.
+
+``search_index`` is an FTS5 table with a row per failure (rowid = failure
+id: agregate and system names, unit number, bort number, note) and a row
+per aircraft (rowid = -aircraft id: bort number only). ``plane_id`` is
+stored unindexed so a hit leads straight to the aircraft. Like
+``plane_effective_agregate`` it is kept up to date by SQLite triggers on
+the source tables.
+
+The unicode61 tokenizer folds case of Cyrillic letters as well as Latin
+ones; prefix indexes keep as-you-type prefix queries of up to three
+characters from scanning the term list.
+
+Migrations freeze their own copy of this SQL: a change here needs a new
+migration recreating the table and triggers.
+"""
+from typing import Any
+
+TABLE_NAME = "search_index"
+
+CREATE_SQL = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {TABLE_NAME} USING fts5("
+    "agregate, system, number, bort, description, plane_id UNINDEXED, "
+    "tokenize = 'unicode61 remove_diacritics 2', prefix = '1 2 3')"
+)
+
+_COLUMNS = "rowid, agregate, system, number, bort, description, plane_id"
+
+_FAILURE_SELECT = (
+    "SELECT o.id, a.name, s.name, o.number, p.bort_number, o.description, o.plane_id "
+    "FROM otkaz_agregate_base AS o "
+    "JOIN agregate_base AS a ON a.id = o.agregate_id "
+    "JOIN system_base AS s ON s.id = a.system_id "
+    "JOIN plane_base AS p ON p.id = o.plane_id "
+    "WHERE {}"
+)
+
+_PLANE_SELECT = "SELECT -p.id, '', '', '', p.bort_number, '', p.id FROM plane_base AS p WHERE {}"
+
+
+def _refresh_failures(condition: str) -> str:
+    """SQL replacing index rows of failures matching a condition on ``o``."""
+    return (
+        f"DELETE FROM {TABLE_NAME} WHERE rowid IN (SELECT o.id FROM otkaz_agregate_base AS o WHERE {condition}); "
+        f"INSERT INTO {TABLE_NAME} ({_COLUMNS}) {_FAILURE_SELECT.format(condition)};"
+    )
+
+
+def _refresh_plane(plane: str) -> str:
+    """SQL replacing the index row of an aircraft."""
+    return (
+        f"DELETE FROM {TABLE_NAME} WHERE rowid = -{plane}; "
+        f"INSERT INTO {TABLE_NAME} ({_COLUMNS}) {_PLANE_SELECT.format(f'p.id = {plane}')};"
+    )
+
+
+def _trigger(name: str, event: str, table: str, body: str) -> tuple[str, str]:
+    return name, f"CREATE TRIGGER IF NOT EXISTS {name} AFTER {event} ON {table} FOR EACH ROW BEGIN {body} END"
+
+
+TRIGGERS: dict[str, str] = dict([
+    # Failures
+    _trigger("search_otkaz_ai", "INSERT", "otkaz_agregate_base", _refresh_failures("o.id = NEW.id")),
+    _trigger("search_otkaz_au", "UPDATE", "otkaz_agregate_base", _refresh_failures("o.id = NEW.id")),
+    _trigger("search_otkaz_ad", "DELETE", "otkaz_agregate_base", f"DELETE FROM {TABLE_NAME} WHERE rowid = OLD.id;"),
+    # Names copied into failure rows
+    _trigger(
+        "search_agregate_au", "UPDATE OF name, system_id", "agregate_base",
+        _refresh_failures("o.agregate_id = NEW.id"),
+    ),
+    _trigger(
+        "search_system_au", "UPDATE OF name", "system_base",
+        _refresh_failures("o.agregate_id IN (SELECT id FROM agregate_base WHERE system_id = NEW.id)"),
+    ),
+    # Aircraft; their failures go with them through the cascade
+    _trigger("search_plane_ai", "INSERT", "plane_base", _refresh_plane("NEW.id")),
+    _trigger(
+        "search_plane_au", "UPDATE OF bort_number", "plane_base",
+        _refresh_plane("NEW.id") + " " + _refresh_failures("o.plane_id = NEW.id"),
+    ),
+    _trigger("search_plane_ad", "DELETE", "plane_base", f"DELETE FROM {TABLE_NAME} WHERE rowid = -OLD.id;"),
+])
+
+REBUILD_SQL: list[str] = [
+    f"DELETE FROM {TABLE_NAME}",
+    f"INSERT INTO {TABLE_NAME} ({_COLUMNS}) {_FAILURE_SELECT.format('1')}",
+    f"INSERT INTO {TABLE_NAME} ({_COLUMNS}) {_PLANE_SELECT.format('1')}",
+    f"INSERT INTO {TABLE_NAME} ({TABLE_NAME}) VALUES ('optimize')",
+]
+
+
+def create_search_index(database: Any) -> None:
+    database.execute_sql(CREATE_SQL)
+    for statement in TRIGGERS.values():
+        database.execute_sql(statement)
+
+
+def rebuild_search_index(database: Any) -> None:
+    with database.atomic():
+        for statement in REBUILD_SQL:
+            database.execute_sql(statement)
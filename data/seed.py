@@ -0,0 +1,230 @@
+"""Deterministic synthetic data set of fleet-scale size for profiling.
+
+``seed_database`` fills an empty database with aircraft types, divisions,
+the group → system → agregate catalog, aircraft, features with their
+links and failure records. Everything is drawn from ``random.Random(seed)``
+and ids are assigned here, so the same config always gives the same rows.
+Rows are bulk inserted in one transaction; the trigger-maintained
+effective configuration and search index are rebuilt once at the end
+instead of per row, and each failure gets one opening history event.
+"""
+import datetime
+import random
+from dataclasses import dataclass, replace
+from typing import Any
+
+from peewee import Model, chunked
+
+from data.models import (
+    AgregateBase,
+    GroupBase,
+    OsobAgregateAddBase,
+    OsobAgregateRemoveBase,
+    OsobBase,
+    OsobPlaneBase,
+    OsobSystemAddBase,
+    OsobSystemRemoveBase,
+    OtkazAgregateBase,
+    PlaneBase,
+    PlaneEffectiveAgregate,
+    PodrazdBase,
+    SystemBase,
+    TypeBase,
+)
+from data.models import effective, history, search
+
+# Bound variables per INSERT stay below SQLite's historical limit of 999
+MAX_VARIABLES = 999
+
+BASE_TIME = datetime.datetime(2024, 1, 1, 8, 0)
+
+TYPE_NAMES = ["Су-27", "МиГ-29", "Су-30", "Ми-8", "Ан-26", "Л-39", "Ил-76", "Ка-27"]
+GROUP_NAMES = ["СД", "АО", "РЭО", "АиРЭО", "ЭСП", "БИУС", "ГСМ", "ПДС"]
+SYSTEM_NAMES = [
+    "Гидросистема", "Топливная система", "Система управления", "Шасси", "Противопожарная система",
+    "Кислородная система", "Система кондиционирования", "Электросистема", "Радиосвязь", "Навигация",
+    "Прицельная система", "Силовая установка", "Система катапультирования", "Приборное оборудование",
+]
+AGREGATE_NAMES = [
+    "Насос", "Клапан", "Датчик", "Блок", "Привод", "Фильтр", "Регулятор", "Генератор", "Преобразователь",
+    "Агрегат", "Гидроаккумулятор", "Коммутатор", "Указатель", "Вычислитель", "Антенна",
+]
+DESCRIPTIONS = ["", "", "Отказ при проверке", "Течь", "Нет сигнала", "Отправлен в ремонт", "Ожидает замены"]
+
+
+@dataclass
+class SeedConfig:
+    """Size of the generated data set."""
+
+    seed: int = 1
+    types: int = 3
+    divisions: int = 6
+    groups_per_type: int = 6
+    systems_per_group: int = 10
+    agregates_per_system: int = 25
+    planes: int = 300
+    features_per_type: int = 8
+    feature_links: int = 6
+    features_per_plane: int = 2
+    failures_per_plane: int = 20
+
+    def scaled(self, scale: float) -> "SeedConfig":
+        """Get config with the catalog, fleet and failures scaled by a factor."""
+        return replace(
+            self,
+            agregates_per_system=max(1, round(self.agregates_per_system * scale)),
+            planes=max(1, round(self.planes * scale)),
+            failures_per_plane=max(0, round(self.failures_per_plane * scale)),
+        )
+
+
+def _name(names: list[str], index: int) -> str:
+    """Get the name at index, numbered once the list is used up."""
+    name = names[index % len(names)]
+    return name if index < len(names) else f"{name} {index // len(names) + 1}"
+
+
+def _created(rng: random.Random) -> datetime.datetime:
+    """Get a creation time within the first year after BASE_TIME."""
+    return BASE_TIME + datetime.timedelta(minutes=rng.randrange(365 * 24 * 60))
+
+
+def _insert(model: type[Model], fields: list[Any], rows: list[tuple]) -> int:
+    """Bulk insert rows in statements of at most MAX_VARIABLES values."""
+    for batch in chunked(rows, max(1, MAX_VARIABLES // len(fields))):
+        model.insert_many(batch, fields=fields).execute()
+    return len(rows)
+
+
+def generate(config: SeedConfig) -> dict[type[Model], tuple[list[Any], list[tuple]]]:
+    """Generate rows of every table as model -> (fields, rows), ids included."""
+    rng = random.Random(config.seed)
+    tables: dict[type[Model], tuple[list[Any], list[tuple]]] = {}
+
+    types = [(type_id, _name(TYPE_NAMES, type_id - 1), _created(rng)) for type_id in range(1, config.types + 1)]
+    tables[TypeBase] = ([TypeBase.id, TypeBase.name, TypeBase.created_at], types)
+
+    divisions = [(podrazd_id, f"{podrazd_id} АЭ", _created(rng)) for podrazd_id in range(1, config.divisions + 1)]
+    tables[PodrazdBase] = ([PodrazdBase.id, PodrazdBase.name, PodrazdBase.created_at], divisions)
+
+    groups, systems, agregates = [], [], []
+    type_systems: dict[int, list[int]] = {}
+    type_agregates: dict[int, list[int]] = {}
+    system_agregates: dict[int, list[int]] = {}
+    for type_id, type_name, _ in types:
+        for group_index in range(config.groups_per_type):
+            group_id = len(groups) + 1
+            groups.append((group_id, type_id, f"{_name(GROUP_NAMES, group_index)} {type_name}", _created(rng)))
+            for _ in range(config.systems_per_group):
+                system_id = len(systems) + 1
+                system_name = f"{rng.choice(SYSTEM_NAMES)} {system_id}"
+                systems.append((system_id, type_id, group_id, system_name, _created(rng)))
+                type_systems.setdefault(type_id, []).append(system_id)
+                for agregate_index in range(config.agregates_per_system):
+                    agregate_id = len(agregates) + 1
+                    agregate_name = f"{rng.choice(AGREGATE_NAMES)} {rng.randrange(1, 100)}-{agregate_index + 1}"
+                    count_on_plane = rng.choice((1, 1, 1, 2, 4))
+                    agregates.append((agregate_id, system_id, count_on_plane, agregate_name, _created(rng)))
+                    type_agregates.setdefault(type_id, []).append(agregate_id)
+                    system_agregates.setdefault(system_id, []).append(agregate_id)
+    tables[GroupBase] = ([GroupBase.id, GroupBase.plane_type, GroupBase.name, GroupBase.created_at], groups)
+    tables[SystemBase] = (
+        [SystemBase.id, SystemBase.plane_type, SystemBase.group, SystemBase.name, SystemBase.created_at], systems
+    )
+    tables[AgregateBase] = (
+        [AgregateBase.id, AgregateBase.system, AgregateBase.count_on_plane, AgregateBase.name, AgregateBase.created_at],
+        agregates,
+    )
+
+    osobs = []
+    type_osobs: dict[int, list[int]] = {}
+    links: dict[type[Model], list[tuple]] = {
+        OsobSystemAddBase: [], OsobSystemRemoveBase: [], OsobAgregateAddBase: [], OsobAgregateRemoveBase: []
+    }
+    for type_id, type_name, _ in types:
+        for osob_index in range(config.features_per_type):
+            osob_id = len(osobs) + 1
+            osobs.append((osob_id, type_id, f"Доработка {type_name} №{osob_index + 1}", _created(rng)))
+            type_osobs.setdefault(type_id, []).append(osob_id)
+            # A feature drops agregates (sometimes a whole system) and brings others back
+            system_ids = type_systems.get(type_id, [])
+            if system_ids and rng.random() < 0.5:
+                link_model = OsobSystemAddBase if rng.random() < 0.2 else OsobSystemRemoveBase
+                links[link_model].append((len(links[link_model]) + 1, osob_id, rng.choice(system_ids), _created(rng)))
+            candidates = type_agregates.get(type_id, [])
+            picked = rng.sample(candidates, min(len(candidates), config.feature_links))
+            for position, agregate_id in enumerate(picked):
+                link_model = OsobAgregateRemoveBase if position % 2 else OsobAgregateAddBase
+                links[link_model].append((len(links[link_model]) + 1, osob_id, agregate_id, _created(rng)))
+    tables[OsobBase] = ([OsobBase.id, OsobBase.plane_type, OsobBase.name, OsobBase.created_at], osobs)
+    for link_model, rows in links.items():
+        target = link_model.system if link_model in (OsobSystemAddBase, OsobSystemRemoveBase) else link_model.agregate
+        tables[link_model] = ([link_model.id, link_model.osob, target, link_model.created_at], rows)
+
+    planes, plane_osobs, failures = [], [], []
+    for plane_id in range(1, config.planes + 1):
+        type_id = types[(plane_id - 1) % len(types)][0]
+        podrazd_id = divisions[rng.randrange(len(divisions))][0]
+        zav_num = f"{rng.randrange(10**4, 10**5)}{plane_id:06d}"
+        planes.append((plane_id, type_id, podrazd_id, zav_num, f"{plane_id:02d}", _created(rng)))
+        available = type_osobs.get(type_id, [])
+        for osob_id in rng.sample(available, min(len(available), config.features_per_plane)):
+            plane_osobs.append((len(plane_osobs) + 1, osob_id, plane_id, _created(rng)))
+        candidates = type_agregates.get(type_id, [])
+        for _ in range(config.failures_per_plane if candidates else 0):
+            failures.append((
+                len(failures) + 1,
+                rng.choice(candidates),
+                plane_id,
+                rng.choice(DESCRIPTIONS),
+                f"{rng.randrange(10**5, 10**6)}",
+                rng.random() < 0.3,
+                _created(rng),
+            ))
+    tables[PlaneBase] = (
+        [PlaneBase.id, PlaneBase.plane_type, PlaneBase.podrazd, PlaneBase.zav_num, PlaneBase.bort_number,
+         PlaneBase.created_at],
+        planes,
+    )
+    tables[OsobPlaneBase] = (
+        [OsobPlaneBase.id, OsobPlaneBase.osob, OsobPlaneBase.plane, OsobPlaneBase.created_at], plane_osobs
+    )
+    tables[OtkazAgregateBase] = (
+        [OtkazAgregateBase.id, OtkazAgregateBase.agregate, OtkazAgregateBase.plane, OtkazAgregateBase.description,
+         OtkazAgregateBase.number, OtkazAgregateBase.removed, OtkazAgregateBase.created_at],
+        failures,
+    )
+    return tables
+
+
+def seed_database(config: SeedConfig | None = None, database: Any | None = None) -> dict[str, int]:
+    """Fill an empty database with generated data; return row counts by table.
+
+    Raises ValueError if the database already has aircraft types.
+    """
+    config = config or SeedConfig()
+    database = database or TypeBase._meta.database
+    if TypeBase.select().exists():
+        raise ValueError("database is not empty")
+
+    tables = generate(config)
+    counts: dict[str, int] = {}
+
+    def fill() -> None:
+        for derived in (effective, search, history):
+            for name in derived.TRIGGERS:
+                database.execute_sql(f"DROP TRIGGER IF EXISTS {name}")
+        for model, (fields, rows) in tables.items():
+            counts[model._meta.table_name] = _insert(model, fields, rows)
+        for derived in (effective, search):
+            for statement in derived.REBUILD_SQL:
+                database.execute_sql(statement)
+            for statement in derived.TRIGGERS.values():
+                database.execute_sql(statement)
+        history.backfill_history(database)
+        history.create_history_triggers(database)
+        counts[PlaneEffectiveAgregate._meta.table_name] = PlaneEffectiveAgregate.select().count()
+        counts[history.EVENT_TABLE] = history.FailureEvent.select().count()
+
+    database.run_in_transaction(fill)
+    return counts
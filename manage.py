@@ -6,15 +6,21 @@ Usage:
     python manage.py migrate          - Run pending migrations
     python manage.py migrate create   - Create a new migration
     python manage.py migrate rollback - Rollback last migration
+    python manage.py status           - Show migration status
+    python manage.py check            - Show effective connection settings
+    python manage.py seed [--seed N] [--scale X]
+                                      - Fill an empty database with generated data
 """
+import argparse
 import sys
+import time
 from pathlib import Path
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 
-from app.database import get_router, get_database
-from app.config import MIGRATIONS_DIR
+from app.database import check_connection, connection_mismatches, get_router, set_schema_version
+from app.database import run_migrations as apply_migrations
 
 
 def show_help():
@@ -24,8 +30,7 @@ def show_help():
 
 def run_migrations():
     """Run all pending migrations."""
-    router = get_router()
-    router.run()
+    apply_migrations(force=True)
     print("Migrations completed successfully!")
 
 
@@ -45,6 +50,8 @@ def rollback_migration():
     """Rollback the last migration."""
     router = get_router()
     router.rollback()
+    # Unknown version: the next start checks migrations with the router
+    set_schema_version(0)
     print("Rollback completed!")
 
 
@@ -60,6 +67,44 @@ def show_status():
     print("-" * 50)
 
 
+def show_connection():
+    """Show effective connection PRAGMAs."""
+    effective = check_connection()
+    mismatches = connection_mismatches(effective)
+    print("\nConnection settings:")
+    print("-" * 50)
+    for name, value in effective.items():
+        marker = "⚠️ " if name in mismatches else "✅"
+        configured = f" (configured: {mismatches[name][0]})" if name in mismatches else ""
+        print(f"  {marker} {name} = {value}{configured}")
+    print("-" * 50)
+
+
+def seed(args: list[str]):
+    """Migrate and fill an empty database with generated data."""
+    parser = argparse.ArgumentParser(prog="manage.py seed")
+    parser.add_argument("--seed", type=int, default=1, help="random seed")
+    parser.add_argument("--scale", type=float, default=1.0, help="size factor for agregates, aircraft and failures")
+    options = parser.parse_args(args)
+
+    from data.seed import SeedConfig, seed_database
+
+    apply_migrations()
+    started = time.perf_counter()
+    try:
+        counts = seed_database(SeedConfig(seed=options.seed).scaled(options.scale))
+    except ValueError as e:
+        print(f"Error: {e}")
+        return
+    elapsed = time.perf_counter() - started
+    print("\nSeeded tables:")
+    print("-" * 50)
+    for table, count in counts.items():
+        print(f"  {table:<30} {count:>10}")
+    print("-" * 50)
+    print(f"  {sum(counts.values())} rows in {elapsed:.1f} s")
+
+
 def main():
     """Main entry point."""
     if len(sys.argv) < 2:
@@ -86,6 +131,12 @@ def main():
     
     elif command == "status":
         show_status()
+
+    elif command == "check":
+        show_connection()
+
+    elif command == "seed":
+        seed(sys.argv[2:])
     
     elif command == "help" or command == "--help" or command == "-h":
         show_help()
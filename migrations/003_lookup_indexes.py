@@ -0,0 +1,51 @@
+"""
+Foreign-key and lookup indexes for hot queries.
+
+- otkaz_agregate_base(plane_id, removed): per-aircraft failure lists and the
+  grouped fleet status query (covering)
+- otkaz_agregate_base(agregate_id): FK cascades from agregate_base
+- agregate_base(system_id, name), system_base(group_id, name),
+  system_base(plane_type_id), group_base(plane_type_id, name): catalog
+  cascades and combo boxes
+- plane_base(podrazd_id), plane_base(plane_type_id): fleet by division and
+  type catalog joins
+- osob_plane_base(plane_id, osob_id) / (osob_id, plane_id) and
+  osob_*_base(osob_id, <target>) / (<target>, osob_id): feature resolvers
+"""
+from peewee import *
+from playhouse.migrate import *
+
+INDEXES = [
+    ("idx_otkaz_agregate_base_plane", "otkaz_agregate_base", "plane_id, removed"),
+    ("idx_otkaz_agregate_base_agregate", "otkaz_agregate_base", "agregate_id"),
+    ("idx_agregate_base_system", "agregate_base", "system_id, name"),
+    ("idx_system_base_group", "system_base", "group_id, name"),
+    ("idx_system_base_plane_type", "system_base", "plane_type_id"),
+    ("idx_group_base_plane_type", "group_base", "plane_type_id, name"),
+    ("idx_plane_base_podrazd", "plane_base", "podrazd_id"),
+    ("idx_plane_base_plane_type", "plane_base", "plane_type_id"),
+    ("idx_osob_base_plane_type", "osob_base", "plane_type_id"),
+    ("idx_osob_plane_base_plane", "osob_plane_base", "plane_id, osob_id"),
+    ("idx_osob_plane_base_osob", "osob_plane_base", "osob_id, plane_id"),
+    ("idx_osob_system_add_base_osob", "osob_system_add_base", "osob_id, system_id"),
+    ("idx_osob_system_add_base_system", "osob_system_add_base", "system_id, osob_id"),
+    ("idx_osob_system_remove_base_osob", "osob_system_remove_base", "osob_id, system_id"),
+    ("idx_osob_system_remove_base_system", "osob_system_remove_base", "system_id, osob_id"),
+    ("idx_osob_agregate_add_base_osob", "osob_agregate_add_base", "osob_id, agregate_id"),
+    ("idx_osob_agregate_add_base_agregate", "osob_agregate_add_base", "agregate_id, osob_id"),
+    ("idx_osob_agregate_remove_base_osob", "osob_agregate_remove_base", "osob_id, agregate_id"),
+    ("idx_osob_agregate_remove_base_agregate", "osob_agregate_remove_base", "agregate_id, osob_id"),
+]
+
+
+def migrate(migrator: SqliteMigrator, database: SqliteDatabase, fake: bool):
+    """Create lookup indexes and refresh planner statistics."""
+    for name, table, columns in INDEXES:
+        migrator.sql(f"CREATE INDEX IF NOT EXISTS {name} ON {table}({columns})")
+    migrator.sql("ANALYZE")
+
+
+def rollback(migrator: SqliteMigrator, database: SqliteDatabase, fake: bool):
+    """Drop lookup indexes."""
+    for name, _table, _columns in INDEXES:
+        migrator.sql(f"DROP INDEX IF EXISTS {name}")
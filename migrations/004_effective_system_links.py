@@ -0,0 +1,610 @@
+"""
+Include feature system links in the effective configuration.
+
+A feature removing (adding) a system now removes (adds) all agregates of that
+system, with triggers on osob_system_add_base / osob_system_remove_base.
+Triggers from 002 are recreated with the new SQL and the table is rebuilt.
+The SQL is frozen here.
+"""
+import runpy
+from pathlib import Path
+
+from peewee import *
+from playhouse.migrate import *
+
+from app.config import MIGRATIONS_DIR
+
+PREVIOUS_MIGRATION = "002_plane_effective_agregate.py"
+
+TRIGGERS = {
+    "pea_plane_ai": (
+        "CREATE TRIGGER IF NOT EXISTS pea_plane_ai AFTER INSERT ON plane_base FOR EACH "
+        "ROW BEGIN DELETE FROM plane_effective_agregate WHERE plane_id IN (NEW.id) AND 1;"
+        " INSERT OR IGNORE INTO plane_effective_agregate (plane_id, agregate_id) SELECT "
+        "p.id, a.id FROM plane_base AS p JOIN system_base AS s ON s.plane_type_id = "
+        "p.plane_type_id JOIN agregate_base AS a ON a.system_id = s.id WHERE p.id IN "
+        "(NEW.id) AND 1 AND NOT EXISTS (SELECT 1 FROM osob_agregate_remove_base AS r JOIN"
+        " osob_plane_base AS op ON op.osob_id = r.osob_id WHERE op.plane_id = p.id AND "
+        "r.agregate_id = a.id) AND NOT EXISTS (SELECT 1 FROM osob_system_remove_base AS "
+        "rs JOIN osob_plane_base AS op ON op.osob_id = rs.osob_id WHERE op.plane_id = "
+        "p.id AND rs.system_id = s.id) UNION SELECT p.id, a.id FROM osob_plane_base AS op"
+        " JOIN plane_base AS p ON p.id = op.plane_id JOIN osob_agregate_add_base AS aa ON"
+        " aa.osob_id = op.osob_id JOIN agregate_base AS a ON a.id = aa.agregate_id WHERE "
+        "p.id IN (NEW.id) AND 1 UNION SELECT p.id, a.id FROM osob_plane_base AS op JOIN "
+        "plane_base AS p ON p.id = op.plane_id JOIN osob_system_add_base AS sa ON "
+        "sa.osob_id = op.osob_id JOIN agregate_base AS a ON a.system_id = sa.system_id "
+        "WHERE p.id IN (NEW.id) AND 1; END"
+    ),
+    "pea_plane_au": (
+        "CREATE TRIGGER IF NOT EXISTS pea_plane_au AFTER UPDATE OF plane_type_id ON "
+        "plane_base FOR EACH ROW BEGIN DELETE FROM plane_effective_agregate WHERE "
+        "plane_id IN (NEW.id) AND 1; INSERT OR IGNORE INTO plane_effective_agregate "
+        "(plane_id, agregate_id) SELECT p.id, a.id FROM plane_base AS p JOIN system_base "
+        "AS s ON s.plane_type_id = p.plane_type_id JOIN agregate_base AS a ON a.system_id"
+        " = s.id WHERE p.id IN (NEW.id) AND 1 AND NOT EXISTS (SELECT 1 FROM "
+        "osob_agregate_remove_base AS r JOIN osob_plane_base AS op ON op.osob_id = "
+        "r.osob_id WHERE op.plane_id = p.id AND r.agregate_id = a.id) AND NOT EXISTS "
+        "(SELECT 1 FROM osob_system_remove_base AS rs JOIN osob_plane_base AS op ON "
+        "op.osob_id = rs.osob_id WHERE op.plane_id = p.id AND rs.system_id = s.id) UNION "
+        "SELECT p.id, a.id FROM osob_plane_base AS op JOIN plane_base AS p ON p.id = "
+        "op.plane_id JOIN osob_agregate_add_base AS aa ON aa.osob_id = op.osob_id JOIN "
+        "agregate_base AS a ON a.id = aa.agregate_id WHERE p.id IN (NEW.id) AND 1 UNION "
+        "SELECT p.id, a.id FROM osob_plane_base AS op JOIN plane_base AS p ON p.id = "
+        "op.plane_id JOIN osob_system_add_base AS sa ON sa.osob_id = op.osob_id JOIN "
+        "agregate_base AS a ON a.system_id = sa.system_id WHERE p.id IN (NEW.id) AND 1; "
+        "END"
+    ),
+    "pea_plane_ad": (
+        "CREATE TRIGGER IF NOT EXISTS pea_plane_ad AFTER DELETE ON plane_base FOR EACH "
+        "ROW BEGIN DELETE FROM plane_effective_agregate WHERE plane_id = OLD.id; END"
+    ),
+    "pea_osob_plane_ai": (
+        "CREATE TRIGGER IF NOT EXISTS pea_osob_plane_ai AFTER INSERT ON osob_plane_base "
+        "FOR EACH ROW BEGIN DELETE FROM plane_effective_agregate WHERE plane_id IN "
+        "(NEW.plane_id) AND 1; INSERT OR IGNORE INTO plane_effective_agregate (plane_id, "
+        "agregate_id) SELECT p.id, a.id FROM plane_base AS p JOIN system_base AS s ON "
+        "s.plane_type_id = p.plane_type_id JOIN agregate_base AS a ON a.system_id = s.id "
+        "WHERE p.id IN (NEW.plane_id) AND 1 AND NOT EXISTS (SELECT 1 FROM "
+        "osob_agregate_remove_base AS r JOIN osob_plane_base AS op ON op.osob_id = "
+        "r.osob_id WHERE op.plane_id = p.id AND r.agregate_id = a.id) AND NOT EXISTS "
+        "(SELECT 1 FROM osob_system_remove_base AS rs JOIN osob_plane_base AS op ON "
+        "op.osob_id = rs.osob_id WHERE op.plane_id = p.id AND rs.system_id = s.id) UNION "
+        "SELECT p.id, a.id FROM osob_plane_base AS op JOIN plane_base AS p ON p.id = "
+        "op.plane_id JOIN osob_agregate_add_base AS aa ON aa.osob_id = op.osob_id JOIN "
+        "agregate_base AS a ON a.id = aa.agregate_id WHERE p.id IN (NEW.plane_id) AND 1 "
+        "UNION SELECT p.id, a.id FROM osob_plane_base AS op JOIN plane_base AS p ON p.id "
+        "= op.plane_id JOIN osob_system_add_base AS sa ON sa.osob_id = op.osob_id JOIN "
+        "agregate_base AS a ON a.system_id = sa.system_id WHERE p.id IN (NEW.plane_id) "
+        "AND 1; END"
+    ),
+    "pea_osob_plane_ad": (
+        "CREATE TRIGGER IF NOT EXISTS pea_osob_plane_ad AFTER DELETE ON osob_plane_base "
+        "FOR EACH ROW BEGIN DELETE FROM plane_effective_agregate WHERE plane_id IN "
+        "(OLD.plane_id) AND 1; INSERT OR IGNORE INTO plane_effective_agregate (plane_id, "
+        "agregate_id) SELECT p.id, a.id FROM plane_base AS p JOIN system_base AS s ON "
+        "s.plane_type_id = p.plane_type_id JOIN agregate_base AS a ON a.system_id = s.id "
+        "WHERE p.id IN (OLD.plane_id) AND 1 AND NOT EXISTS (SELECT 1 FROM "
+        "osob_agregate_remove_base AS r JOIN osob_plane_base AS op ON op.osob_id = "
+        "r.osob_id WHERE op.plane_id = p.id AND r.agregate_id = a.id) AND NOT EXISTS "
+        "(SELECT 1 FROM osob_system_remove_base AS rs JOIN osob_plane_base AS op ON "
+        "op.osob_id = rs.osob_id WHERE op.plane_id = p.id AND rs.system_id = s.id) UNION "
+        "SELECT p.id, a.id FROM osob_plane_base AS op JOIN plane_base AS p ON p.id = "
+        "op.plane_id JOIN osob_agregate_add_base AS aa ON aa.osob_id = op.osob_id JOIN "
+        "agregate_base AS a ON a.id = aa.agregate_id WHERE p.id IN (OLD.plane_id) AND 1 "
+        "UNION SELECT p.id, a.id FROM osob_plane_base AS op JOIN plane_base AS p ON p.id "
+        "= op.plane_id JOIN osob_system_add_base AS sa ON sa.osob_id = op.osob_id JOIN "
+        "agregate_base AS a ON a.system_id = sa.system_id WHERE p.id IN (OLD.plane_id) "
+        "AND 1; END"
+    ),
+    "pea_osob_plane_au": (
+        "CREATE TRIGGER IF NOT EXISTS pea_osob_plane_au AFTER UPDATE ON osob_plane_base "
+        "FOR EACH ROW BEGIN DELETE FROM plane_effective_agregate WHERE plane_id IN "
+        "(OLD.plane_id) AND 1; INSERT OR IGNORE INTO plane_effective_agregate (plane_id, "
+        "agregate_id) SELECT p.id, a.id FROM plane_base AS p JOIN system_base AS s ON "
+        "s.plane_type_id = p.plane_type_id JOIN agregate_base AS a ON a.system_id = s.id "
+        "WHERE p.id IN (OLD.plane_id) AND 1 AND NOT EXISTS (SELECT 1 FROM "
+        "osob_agregate_remove_base AS r JOIN osob_plane_base AS op ON op.osob_id = "
+        "r.osob_id WHERE op.plane_id = p.id AND r.agregate_id = a.id) AND NOT EXISTS "
+        "(SELECT 1 FROM osob_system_remove_base AS rs JOIN osob_plane_base AS op ON "
+        "op.osob_id = rs.osob_id WHERE op.plane_id = p.id AND rs.system_id = s.id) UNION "
+        "SELECT p.id, a.id FROM osob_plane_base AS op JOIN plane_base AS p ON p.id = "
+        "op.plane_id JOIN osob_agregate_add_base AS aa ON aa.osob_id = op.osob_id JOIN "
+        "agregate_base AS a ON a.id = aa.agregate_id WHERE p.id IN (OLD.plane_id) AND 1 "
+        "UNION SELECT p.id, a.id FROM osob_plane_base AS op JOIN plane_base AS p ON p.id "
+        "= op.plane_id JOIN osob_system_add_base AS sa ON sa.osob_id = op.osob_id JOIN "
+        "agregate_base AS a ON a.system_id = sa.system_id WHERE p.id IN (OLD.plane_id) "
+        "AND 1; DELETE FROM plane_effective_agregate WHERE plane_id IN (NEW.plane_id) AND"
+        " 1; INSERT OR IGNORE INTO plane_effective_agregate (plane_id, agregate_id) "
+        "SELECT p.id, a.id FROM plane_base AS p JOIN system_base AS s ON s.plane_type_id "
+        "= p.plane_type_id JOIN agregate_base AS a ON a.system_id = s.id WHERE p.id IN "
+        "(NEW.plane_id) AND 1 AND NOT EXISTS (SELECT 1 FROM osob_agregate_remove_base AS "
+        "r JOIN osob_plane_base AS op ON op.osob_id = r.osob_id WHERE op.plane_id = p.id "
+        "AND r.agregate_id = a.id) AND NOT EXISTS (SELECT 1 FROM osob_system_remove_base "
+        "AS rs JOIN osob_plane_base AS op ON op.osob_id = rs.osob_id WHERE op.plane_id = "
+        "p.id AND rs.system_id = s.id) UNION SELECT p.id, a.id FROM osob_plane_base AS op"
+        " JOIN plane_base AS p ON p.id = op.plane_id JOIN osob_agregate_add_base AS aa ON"
+        " aa.osob_id = op.osob_id JOIN agregate_base AS a ON a.id = aa.agregate_id WHERE "
+        "p.id IN (NEW.plane_id) AND 1 UNION SELECT p.id, a.id FROM osob_plane_base AS op "
+        "JOIN plane_base AS p ON p.id = op.plane_id JOIN osob_system_add_base AS sa ON "
+        "sa.osob_id = op.osob_id JOIN agregate_base AS a ON a.system_id = sa.system_id "
+        "WHERE p.id IN (NEW.plane_id) AND 1; END"
+    ),
+    "pea_agregate_ai": (
+        "CREATE TRIGGER IF NOT EXISTS pea_agregate_ai AFTER INSERT ON agregate_base FOR "
+        "EACH ROW BEGIN DELETE FROM plane_effective_agregate WHERE 1 AND agregate_id IN "
+        "(NEW.id); INSERT OR IGNORE INTO plane_effective_agregate (plane_id, agregate_id)"
+        " SELECT p.id, a.id FROM plane_base AS p JOIN system_base AS s ON s.plane_type_id"
+        " = p.plane_type_id JOIN agregate_base AS a ON a.system_id = s.id WHERE 1 AND "
+        "a.id IN (NEW.id) AND NOT EXISTS (SELECT 1 FROM osob_agregate_remove_base AS r "
+        "JOIN osob_plane_base AS op ON op.osob_id = r.osob_id WHERE op.plane_id = p.id "
+        "AND r.agregate_id = a.id) AND NOT EXISTS (SELECT 1 FROM osob_system_remove_base "
+        "AS rs JOIN osob_plane_base AS op ON op.osob_id = rs.osob_id WHERE op.plane_id = "
+        "p.id AND rs.system_id = s.id) UNION SELECT p.id, a.id FROM osob_plane_base AS op"
+        " JOIN plane_base AS p ON p.id = op.plane_id JOIN osob_agregate_add_base AS aa ON"
+        " aa.osob_id = op.osob_id JOIN agregate_base AS a ON a.id = aa.agregate_id WHERE "
+        "1 AND a.id IN (NEW.id) UNION SELECT p.id, a.id FROM osob_plane_base AS op JOIN "
+        "plane_base AS p ON p.id = op.plane_id JOIN osob_system_add_base AS sa ON "
+        "sa.osob_id = op.osob_id JOIN agregate_base AS a ON a.system_id = sa.system_id "
+        "WHERE 1 AND a.id IN (NEW.id); END"
+    ),
+    "pea_agregate_au": (
+        "CREATE TRIGGER IF NOT EXISTS pea_agregate_au AFTER UPDATE OF system_id ON "
+        "agregate_base FOR EACH ROW BEGIN DELETE FROM plane_effective_agregate WHERE 1 "
+        "AND agregate_id IN (NEW.id); INSERT OR IGNORE INTO plane_effective_agregate "
+        "(plane_id, agregate_id) SELECT p.id, a.id FROM plane_base AS p JOIN system_base "
+        "AS s ON s.plane_type_id = p.plane_type_id JOIN agregate_base AS a ON a.system_id"
+        " = s.id WHERE 1 AND a.id IN (NEW.id) AND NOT EXISTS (SELECT 1 FROM "
+        "osob_agregate_remove_base AS r JOIN osob_plane_base AS op ON op.osob_id = "
+        "r.osob_id WHERE op.plane_id = p.id AND r.agregate_id = a.id) AND NOT EXISTS "
+        "(SELECT 1 FROM osob_system_remove_base AS rs JOIN osob_plane_base AS op ON "
+        "op.osob_id = rs.osob_id WHERE op.plane_id = p.id AND rs.system_id = s.id) UNION "
+        "SELECT p.id, a.id FROM osob_plane_base AS op JOIN plane_base AS p ON p.id = "
+        "op.plane_id JOIN osob_agregate_add_base AS aa ON aa.osob_id = op.osob_id JOIN "
+        "agregate_base AS a ON a.id = aa.agregate_id WHERE 1 AND a.id IN (NEW.id) UNION "
+        "SELECT p.id, a.id FROM osob_plane_base AS op JOIN plane_base AS p ON p.id = "
+        "op.plane_id JOIN osob_system_add_base AS sa ON sa.osob_id = op.osob_id JOIN "
+        "agregate_base AS a ON a.system_id = sa.system_id WHERE 1 AND a.id IN (NEW.id); "
+        "END"
+    ),
+    "pea_agregate_ad": (
+        "CREATE TRIGGER IF NOT EXISTS pea_agregate_ad AFTER DELETE ON agregate_base FOR "
+        "EACH ROW BEGIN DELETE FROM plane_effective_agregate WHERE agregate_id = OLD.id; "
+        "END"
+    ),
+    "pea_system_au": (
+        "CREATE TRIGGER IF NOT EXISTS pea_system_au AFTER UPDATE OF plane_type_id ON "
+        "system_base FOR EACH ROW BEGIN DELETE FROM plane_effective_agregate WHERE 1 AND "
+        "agregate_id IN (SELECT id FROM agregate_base WHERE system_id = NEW.id); INSERT "
+        "OR IGNORE INTO plane_effective_agregate (plane_id, agregate_id) SELECT p.id, "
+        "a.id FROM plane_base AS p JOIN system_base AS s ON s.plane_type_id = "
+        "p.plane_type_id JOIN agregate_base AS a ON a.system_id = s.id WHERE 1 AND a.id "
+        "IN (SELECT id FROM agregate_base WHERE system_id = NEW.id) AND NOT EXISTS "
+        "(SELECT 1 FROM osob_agregate_remove_base AS r JOIN osob_plane_base AS op ON "
+        "op.osob_id = r.osob_id WHERE op.plane_id = p.id AND r.agregate_id = a.id) AND "
+        "NOT EXISTS (SELECT 1 FROM osob_system_remove_base AS rs JOIN osob_plane_base AS "
+        "op ON op.osob_id = rs.osob_id WHERE op.plane_id = p.id AND rs.system_id = s.id) "
+        "UNION SELECT p.id, a.id FROM osob_plane_base AS op JOIN plane_base AS p ON p.id "
+        "= op.plane_id JOIN osob_agregate_add_base AS aa ON aa.osob_id = op.osob_id JOIN "
+        "agregate_base AS a ON a.id = aa.agregate_id WHERE 1 AND a.id IN (SELECT id FROM "
+        "agregate_base WHERE system_id = NEW.id) UNION SELECT p.id, a.id FROM "
+        "osob_plane_base AS op JOIN plane_base AS p ON p.id = op.plane_id JOIN "
+        "osob_system_add_base AS sa ON sa.osob_id = op.osob_id JOIN agregate_base AS a ON"
+        " a.system_id = sa.system_id WHERE 1 AND a.id IN (SELECT id FROM agregate_base "
+        "WHERE system_id = NEW.id); END"
+    ),
+    "pea_add_ai": (
+        "CREATE TRIGGER IF NOT EXISTS pea_add_ai AFTER INSERT ON osob_agregate_add_base "
+        "FOR EACH ROW BEGIN DELETE FROM plane_effective_agregate WHERE plane_id IN "
+        "(SELECT plane_id FROM osob_plane_base WHERE osob_id = NEW.osob_id) AND "
+        "agregate_id IN (NEW.agregate_id); INSERT OR IGNORE INTO plane_effective_agregate"
+        " (plane_id, agregate_id) SELECT p.id, a.id FROM plane_base AS p JOIN system_base"
+        " AS s ON s.plane_type_id = p.plane_type_id JOIN agregate_base AS a ON "
+        "a.system_id = s.id WHERE p.id IN (SELECT plane_id FROM osob_plane_base WHERE "
+        "osob_id = NEW.osob_id) AND a.id IN (NEW.agregate_id) AND NOT EXISTS (SELECT 1 "
+        "FROM osob_agregate_remove_base AS r JOIN osob_plane_base AS op ON op.osob_id = "
+        "r.osob_id WHERE op.plane_id = p.id AND r.agregate_id = a.id) AND NOT EXISTS "
+        "(SELECT 1 FROM osob_system_remove_base AS rs JOIN osob_plane_base AS op ON "
+        "op.osob_id = rs.osob_id WHERE op.plane_id = p.id AND rs.system_id = s.id) UNION "
+        "SELECT p.id, a.id FROM osob_plane_base AS op JOIN plane_base AS p ON p.id = "
+        "op.plane_id JOIN osob_agregate_add_base AS aa ON aa.osob_id = op.osob_id JOIN "
+        "agregate_base AS a ON a.id = aa.agregate_id WHERE p.id IN (SELECT plane_id FROM "
+        "osob_plane_base WHERE osob_id = NEW.osob_id) AND a.id IN (NEW.agregate_id) UNION"
+        " SELECT p.id, a.id FROM osob_plane_base AS op JOIN plane_base AS p ON p.id = "
+        "op.plane_id JOIN osob_system_add_base AS sa ON sa.osob_id = op.osob_id JOIN "
+        "agregate_base AS a ON a.system_id = sa.system_id WHERE p.id IN (SELECT plane_id "
+        "FROM osob_plane_base WHERE osob_id = NEW.osob_id) AND a.id IN (NEW.agregate_id);"
+        " END"
+    ),
+    "pea_add_ad": (
+        "CREATE TRIGGER IF NOT EXISTS pea_add_ad AFTER DELETE ON osob_agregate_add_base "
+        "FOR EACH ROW BEGIN DELETE FROM plane_effective_agregate WHERE plane_id IN "
+        "(SELECT plane_id FROM osob_plane_base WHERE osob_id = OLD.osob_id) AND "
+        "agregate_id IN (OLD.agregate_id); INSERT OR IGNORE INTO plane_effective_agregate"
+        " (plane_id, agregate_id) SELECT p.id, a.id FROM plane_base AS p JOIN system_base"
+        " AS s ON s.plane_type_id = p.plane_type_id JOIN agregate_base AS a ON "
+        "a.system_id = s.id WHERE p.id IN (SELECT plane_id FROM osob_plane_base WHERE "
+        "osob_id = OLD.osob_id) AND a.id IN (OLD.agregate_id) AND NOT EXISTS (SELECT 1 "
+        "FROM osob_agregate_remove_base AS r JOIN osob_plane_base AS op ON op.osob_id = "
+        "r.osob_id WHERE op.plane_id = p.id AND r.agregate_id = a.id) AND NOT EXISTS "
+        "(SELECT 1 FROM osob_system_remove_base AS rs JOIN osob_plane_base AS op ON "
+        "op.osob_id = rs.osob_id WHERE op.plane_id = p.id AND rs.system_id = s.id) UNION "
+        "SELECT p.id, a.id FROM osob_plane_base AS op JOIN plane_base AS p ON p.id = "
+        "op.plane_id JOIN osob_agregate_add_base AS aa ON aa.osob_id = op.osob_id JOIN "
+        "agregate_base AS a ON a.id = aa.agregate_id WHERE p.id IN (SELECT plane_id FROM "
+        "osob_plane_base WHERE osob_id = OLD.osob_id) AND a.id IN (OLD.agregate_id) UNION"
+        " SELECT p.id, a.id FROM osob_plane_base AS op JOIN plane_base AS p ON p.id = "
+        "op.plane_id JOIN osob_system_add_base AS sa ON sa.osob_id = op.osob_id JOIN "
+        "agregate_base AS a ON a.system_id = sa.system_id WHERE p.id IN (SELECT plane_id "
+        "FROM osob_plane_base WHERE osob_id = OLD.osob_id) AND a.id IN (OLD.agregate_id);"
+        " END"
+    ),
+    "pea_add_au": (
+        "CREATE TRIGGER IF NOT EXISTS pea_add_au AFTER UPDATE ON osob_agregate_add_base "
+        "FOR EACH ROW BEGIN DELETE FROM plane_effective_agregate WHERE plane_id IN "
+        "(SELECT plane_id FROM osob_plane_base WHERE osob_id = OLD.osob_id) AND "
+        "agregate_id IN (OLD.agregate_id); INSERT OR IGNORE INTO plane_effective_agregate"
+        " (plane_id, agregate_id) SELECT p.id, a.id FROM plane_base AS p JOIN system_base"
+        " AS s ON s.plane_type_id = p.plane_type_id JOIN agregate_base AS a ON "
+        "a.system_id = s.id WHERE p.id IN (SELECT plane_id FROM osob_plane_base WHERE "
+        "osob_id = OLD.osob_id) AND a.id IN (OLD.agregate_id) AND NOT EXISTS (SELECT 1 "
+        "FROM osob_agregate_remove_base AS r JOIN osob_plane_base AS op ON op.osob_id = "
+        "r.osob_id WHERE op.plane_id = p.id AND r.agregate_id = a.id) AND NOT EXISTS "
+        "(SELECT 1 FROM osob_system_remove_base AS rs JOIN osob_plane_base AS op ON "
+        "op.osob_id = rs.osob_id WHERE op.plane_id = p.id AND rs.system_id = s.id) UNION "
+        "SELECT p.id, a.id FROM osob_plane_base AS op JOIN plane_base AS p ON p.id = "
+        "op.plane_id JOIN osob_agregate_add_base AS aa ON aa.osob_id = op.osob_id JOIN "
+        "agregate_base AS a ON a.id = aa.agregate_id WHERE p.id IN (SELECT plane_id FROM "
+        "osob_plane_base WHERE osob_id = OLD.osob_id) AND a.id IN (OLD.agregate_id) UNION"
+        " SELECT p.id, a.id FROM osob_plane_base AS op JOIN plane_base AS p ON p.id = "
+        "op.plane_id JOIN osob_system_add_base AS sa ON sa.osob_id = op.osob_id JOIN "
+        "agregate_base AS a ON a.system_id = sa.system_id WHERE p.id IN (SELECT plane_id "
+        "FROM osob_plane_base WHERE osob_id = OLD.osob_id) AND a.id IN (OLD.agregate_id);"
+        " DELETE FROM plane_effective_agregate WHERE plane_id IN (SELECT plane_id FROM "
+        "osob_plane_base WHERE osob_id = NEW.osob_id) AND agregate_id IN "
+        "(NEW.agregate_id); INSERT OR IGNORE INTO plane_effective_agregate (plane_id, "
+        "agregate_id) SELECT p.id, a.id FROM plane_base AS p JOIN system_base AS s ON "
+        "s.plane_type_id = p.plane_type_id JOIN agregate_base AS a ON a.system_id = s.id "
+        "WHERE p.id IN (SELECT plane_id FROM osob_plane_base WHERE osob_id = NEW.osob_id)"
+        " AND a.id IN (NEW.agregate_id) AND NOT EXISTS (SELECT 1 FROM "
+        "osob_agregate_remove_base AS r JOIN osob_plane_base AS op ON op.osob_id = "
+        "r.osob_id WHERE op.plane_id = p.id AND r.agregate_id = a.id) AND NOT EXISTS "
+        "(SELECT 1 FROM osob_system_remove_base AS rs JOIN osob_plane_base AS op ON "
+        "op.osob_id = rs.osob_id WHERE op.plane_id = p.id AND rs.system_id = s.id) UNION "
+        "SELECT p.id, a.id FROM osob_plane_base AS op JOIN plane_base AS p ON p.id = "
+        "op.plane_id JOIN osob_agregate_add_base AS aa ON aa.osob_id = op.osob_id JOIN "
+        "agregate_base AS a ON a.id = aa.agregate_id WHERE p.id IN (SELECT plane_id FROM "
+        "osob_plane_base WHERE osob_id = NEW.osob_id) AND a.id IN (NEW.agregate_id) UNION"
+        " SELECT p.id, a.id FROM osob_plane_base AS op JOIN plane_base AS p ON p.id = "
+        "op.plane_id JOIN osob_system_add_base AS sa ON sa.osob_id = op.osob_id JOIN "
+        "agregate_base AS a ON a.system_id = sa.system_id WHERE p.id IN (SELECT plane_id "
+        "FROM osob_plane_base WHERE osob_id = NEW.osob_id) AND a.id IN (NEW.agregate_id);"
+        " END"
+    ),
+    "pea_remove_ai": (
+        "CREATE TRIGGER IF NOT EXISTS pea_remove_ai AFTER INSERT ON "
+        "osob_agregate_remove_base FOR EACH ROW BEGIN DELETE FROM "
+        "plane_effective_agregate WHERE plane_id IN (SELECT plane_id FROM osob_plane_base"
+        " WHERE osob_id = NEW.osob_id) AND agregate_id IN (NEW.agregate_id); INSERT OR "
+        "IGNORE INTO plane_effective_agregate (plane_id, agregate_id) SELECT p.id, a.id "
+        "FROM plane_base AS p JOIN system_base AS s ON s.plane_type_id = p.plane_type_id "
+        "JOIN agregate_base AS a ON a.system_id = s.id WHERE p.id IN (SELECT plane_id "
+        "FROM osob_plane_base WHERE osob_id = NEW.osob_id) AND a.id IN (NEW.agregate_id) "
+        "AND NOT EXISTS (SELECT 1 FROM osob_agregate_remove_base AS r JOIN "
+        "osob_plane_base AS op ON op.osob_id = r.osob_id WHERE op.plane_id = p.id AND "
+        "r.agregate_id = a.id) AND NOT EXISTS (SELECT 1 FROM osob_system_remove_base AS "
+        "rs JOIN osob_plane_base AS op ON op.osob_id = rs.osob_id WHERE op.plane_id = "
+        "p.id AND rs.system_id = s.id) UNION SELECT p.id, a.id FROM osob_plane_base AS op"
+        " JOIN plane_base AS p ON p.id = op.plane_id JOIN osob_agregate_add_base AS aa ON"
+        " aa.osob_id = op.osob_id JOIN agregate_base AS a ON a.id = aa.agregate_id WHERE "
+        "p.id IN (SELECT plane_id FROM osob_plane_base WHERE osob_id = NEW.osob_id) AND "
+        "a.id IN (NEW.agregate_id) UNION SELECT p.id, a.id FROM osob_plane_base AS op "
+        "JOIN plane_base AS p ON p.id = op.plane_id JOIN osob_system_add_base AS sa ON "
+        "sa.osob_id = op.osob_id JOIN agregate_base AS a ON a.system_id = sa.system_id "
+        "WHERE p.id IN (SELECT plane_id FROM osob_plane_base WHERE osob_id = NEW.osob_id)"
+        " AND a.id IN (NEW.agregate_id); END"
+    ),
+    "pea_remove_ad": (
+        "CREATE TRIGGER IF NOT EXISTS pea_remove_ad AFTER DELETE ON "
+        "osob_agregate_remove_base FOR EACH ROW BEGIN DELETE FROM "
+        "plane_effective_agregate WHERE plane_id IN (SELECT plane_id FROM osob_plane_base"
+        " WHERE osob_id = OLD.osob_id) AND agregate_id IN (OLD.agregate_id); INSERT OR "
+        "IGNORE INTO plane_effective_agregate (plane_id, agregate_id) SELECT p.id, a.id "
+        "FROM plane_base AS p JOIN system_base AS s ON s.plane_type_id = p.plane_type_id "
+        "JOIN agregate_base AS a ON a.system_id = s.id WHERE p.id IN (SELECT plane_id "
+        "FROM osob_plane_base WHERE osob_id = OLD.osob_id) AND a.id IN (OLD.agregate_id) "
+        "AND NOT EXISTS (SELECT 1 FROM osob_agregate_remove_base AS r JOIN "
+        "osob_plane_base AS op ON op.osob_id = r.osob_id WHERE op.plane_id = p.id AND "
+        "r.agregate_id = a.id) AND NOT EXISTS (SELECT 1 FROM osob_system_remove_base AS "
+        "rs JOIN osob_plane_base AS op ON op.osob_id = rs.osob_id WHERE op.plane_id = "
+        "p.id AND rs.system_id = s.id) UNION SELECT p.id, a.id FROM osob_plane_base AS op"
+        " JOIN plane_base AS p ON p.id = op.plane_id JOIN osob_agregate_add_base AS aa ON"
+        " aa.osob_id = op.osob_id JOIN agregate_base AS a ON a.id = aa.agregate_id WHERE "
+        "p.id IN (SELECT plane_id FROM osob_plane_base WHERE osob_id = OLD.osob_id) AND "
+        "a.id IN (OLD.agregate_id) UNION SELECT p.id, a.id FROM osob_plane_base AS op "
+        "JOIN plane_base AS p ON p.id = op.plane_id JOIN osob_system_add_base AS sa ON "
+        "sa.osob_id = op.osob_id JOIN agregate_base AS a ON a.system_id = sa.system_id "
+        "WHERE p.id IN (SELECT plane_id FROM osob_plane_base WHERE osob_id = OLD.osob_id)"
+        " AND a.id IN (OLD.agregate_id); END"
+    ),
+    "pea_remove_au": (
+        "CREATE TRIGGER IF NOT EXISTS pea_remove_au AFTER UPDATE ON "
+        "osob_agregate_remove_base FOR EACH ROW BEGIN DELETE FROM "
+        "plane_effective_agregate WHERE plane_id IN (SELECT plane_id FROM osob_plane_base"
+        " WHERE osob_id = OLD.osob_id) AND agregate_id IN (OLD.agregate_id); INSERT OR "
+        "IGNORE INTO plane_effective_agregate (plane_id, agregate_id) SELECT p.id, a.id "
+        "FROM plane_base AS p JOIN system_base AS s ON s.plane_type_id = p.plane_type_id "
+        "JOIN agregate_base AS a ON a.system_id = s.id WHERE p.id IN (SELECT plane_id "
+        "FROM osob_plane_base WHERE osob_id = OLD.osob_id) AND a.id IN (OLD.agregate_id) "
+        "AND NOT EXISTS (SELECT 1 FROM osob_agregate_remove_base AS r JOIN "
+        "osob_plane_base AS op ON op.osob_id = r.osob_id WHERE op.plane_id = p.id AND "
+        "r.agregate_id = a.id) AND NOT EXISTS (SELECT 1 FROM osob_system_remove_base AS "
+        "rs JOIN osob_plane_base AS op ON op.osob_id = rs.osob_id WHERE op.plane_id = "
+        "p.id AND rs.system_id = s.id) UNION SELECT p.id, a.id FROM osob_plane_base AS op"
+        " JOIN plane_base AS p ON p.id = op.plane_id JOIN osob_agregate_add_base AS aa ON"
+        " aa.osob_id = op.osob_id JOIN agregate_base AS a ON a.id = aa.agregate_id WHERE "
+        "p.id IN (SELECT plane_id FROM osob_plane_base WHERE osob_id = OLD.osob_id) AND "
+        "a.id IN (OLD.agregate_id) UNION SELECT p.id, a.id FROM osob_plane_base AS op "
+        "JOIN plane_base AS p ON p.id = op.plane_id JOIN osob_system_add_base AS sa ON "
+        "sa.osob_id = op.osob_id JOIN agregate_base AS a ON a.system_id = sa.system_id "
+        "WHERE p.id IN (SELECT plane_id FROM osob_plane_base WHERE osob_id = OLD.osob_id)"
+        " AND a.id IN (OLD.agregate_id); DELETE FROM plane_effective_agregate WHERE "
+        "plane_id IN (SELECT plane_id FROM osob_plane_base WHERE osob_id = NEW.osob_id) "
+        "AND agregate_id IN (NEW.agregate_id); INSERT OR IGNORE INTO "
+        "plane_effective_agregate (plane_id, agregate_id) SELECT p.id, a.id FROM "
+        "plane_base AS p JOIN system_base AS s ON s.plane_type_id = p.plane_type_id JOIN "
+        "agregate_base AS a ON a.system_id = s.id WHERE p.id IN (SELECT plane_id FROM "
+        "osob_plane_base WHERE osob_id = NEW.osob_id) AND a.id IN (NEW.agregate_id) AND "
+        "NOT EXISTS (SELECT 1 FROM osob_agregate_remove_base AS r JOIN osob_plane_base AS"
+        " op ON op.osob_id = r.osob_id WHERE op.plane_id = p.id AND r.agregate_id = a.id)"
+        " AND NOT EXISTS (SELECT 1 FROM osob_system_remove_base AS rs JOIN "
+        "osob_plane_base AS op ON op.osob_id = rs.osob_id WHERE op.plane_id = p.id AND "
+        "rs.system_id = s.id) UNION SELECT p.id, a.id FROM osob_plane_base AS op JOIN "
+        "plane_base AS p ON p.id = op.plane_id JOIN osob_agregate_add_base AS aa ON "
+        "aa.osob_id = op.osob_id JOIN agregate_base AS a ON a.id = aa.agregate_id WHERE "
+        "p.id IN (SELECT plane_id FROM osob_plane_base WHERE osob_id = NEW.osob_id) AND "
+        "a.id IN (NEW.agregate_id) UNION SELECT p.id, a.id FROM osob_plane_base AS op "
+        "JOIN plane_base AS p ON p.id = op.plane_id JOIN osob_system_add_base AS sa ON "
+        "sa.osob_id = op.osob_id JOIN agregate_base AS a ON a.system_id = sa.system_id "
+        "WHERE p.id IN (SELECT plane_id FROM osob_plane_base WHERE osob_id = NEW.osob_id)"
+        " AND a.id IN (NEW.agregate_id); END"
+    ),
+    "pea_system_add_ai": (
+        "CREATE TRIGGER IF NOT EXISTS pea_system_add_ai AFTER INSERT ON "
+        "osob_system_add_base FOR EACH ROW BEGIN DELETE FROM plane_effective_agregate "
+        "WHERE plane_id IN (SELECT plane_id FROM osob_plane_base WHERE osob_id = "
+        "NEW.osob_id) AND agregate_id IN (SELECT id FROM agregate_base WHERE system_id = "
+        "NEW.system_id); INSERT OR IGNORE INTO plane_effective_agregate (plane_id, "
+        "agregate_id) SELECT p.id, a.id FROM plane_base AS p JOIN system_base AS s ON "
+        "s.plane_type_id = p.plane_type_id JOIN agregate_base AS a ON a.system_id = s.id "
+        "WHERE p.id IN (SELECT plane_id FROM osob_plane_base WHERE osob_id = NEW.osob_id)"
+        " AND a.id IN (SELECT id FROM agregate_base WHERE system_id = NEW.system_id) AND "
+        "NOT EXISTS (SELECT 1 FROM osob_agregate_remove_base AS r JOIN osob_plane_base AS"
+        " op ON op.osob_id = r.osob_id WHERE op.plane_id = p.id AND r.agregate_id = a.id)"
+        " AND NOT EXISTS (SELECT 1 FROM osob_system_remove_base AS rs JOIN "
+        "osob_plane_base AS op ON op.osob_id = rs.osob_id WHERE op.plane_id = p.id AND "
+        "rs.system_id = s.id) UNION SELECT p.id, a.id FROM osob_plane_base AS op JOIN "
+        "plane_base AS p ON p.id = op.plane_id JOIN osob_agregate_add_base AS aa ON "
+        "aa.osob_id = op.osob_id JOIN agregate_base AS a ON a.id = aa.agregate_id WHERE "
+        "p.id IN (SELECT plane_id FROM osob_plane_base WHERE osob_id = NEW.osob_id) AND "
+        "a.id IN (SELECT id FROM agregate_base WHERE system_id = NEW.system_id) UNION "
+        "SELECT p.id, a.id FROM osob_plane_base AS op JOIN plane_base AS p ON p.id = "
+        "op.plane_id JOIN osob_system_add_base AS sa ON sa.osob_id = op.osob_id JOIN "
+        "agregate_base AS a ON a.system_id = sa.system_id WHERE p.id IN (SELECT plane_id "
+        "FROM osob_plane_base WHERE osob_id = NEW.osob_id) AND a.id IN (SELECT id FROM "
+        "agregate_base WHERE system_id = NEW.system_id); END"
+    ),
+    "pea_system_add_ad": (
+        "CREATE TRIGGER IF NOT EXISTS pea_system_add_ad AFTER DELETE ON "
+        "osob_system_add_base FOR EACH ROW BEGIN DELETE FROM plane_effective_agregate "
+        "WHERE plane_id IN (SELECT plane_id FROM osob_plane_base WHERE osob_id = "
+        "OLD.osob_id) AND agregate_id IN (SELECT id FROM agregate_base WHERE system_id = "
+        "OLD.system_id); INSERT OR IGNORE INTO plane_effective_agregate (plane_id, "
+        "agregate_id) SELECT p.id, a.id FROM plane_base AS p JOIN system_base AS s ON "
+        "s.plane_type_id = p.plane_type_id JOIN agregate_base AS a ON a.system_id = s.id "
+        "WHERE p.id IN (SELECT plane_id FROM osob_plane_base WHERE osob_id = OLD.osob_id)"
+        " AND a.id IN (SELECT id FROM agregate_base WHERE system_id = OLD.system_id) AND "
+        "NOT EXISTS (SELECT 1 FROM osob_agregate_remove_base AS r JOIN osob_plane_base AS"
+        " op ON op.osob_id = r.osob_id WHERE op.plane_id = p.id AND r.agregate_id = a.id)"
+        " AND NOT EXISTS (SELECT 1 FROM osob_system_remove_base AS rs JOIN "
+        "osob_plane_base AS op ON op.osob_id = rs.osob_id WHERE op.plane_id = p.id AND "
+        "rs.system_id = s.id) UNION SELECT p.id, a.id FROM osob_plane_base AS op JOIN "
+        "plane_base AS p ON p.id = op.plane_id JOIN osob_agregate_add_base AS aa ON "
+        "aa.osob_id = op.osob_id JOIN agregate_base AS a ON a.id = aa.agregate_id WHERE "
+        "p.id IN (SELECT plane_id FROM osob_plane_base WHERE osob_id = OLD.osob_id) AND "
+        "a.id IN (SELECT id FROM agregate_base WHERE system_id = OLD.system_id) UNION "
+        "SELECT p.id, a.id FROM osob_plane_base AS op JOIN plane_base AS p ON p.id = "
+        "op.plane_id JOIN osob_system_add_base AS sa ON sa.osob_id = op.osob_id JOIN "
+        "agregate_base AS a ON a.system_id = sa.system_id WHERE p.id IN (SELECT plane_id "
+        "FROM osob_plane_base WHERE osob_id = OLD.osob_id) AND a.id IN (SELECT id FROM "
+        "agregate_base WHERE system_id = OLD.system_id); END"
+    ),
+    "pea_system_add_au": (
+        "CREATE TRIGGER IF NOT EXISTS pea_system_add_au AFTER UPDATE ON "
+        "osob_system_add_base FOR EACH ROW BEGIN DELETE FROM plane_effective_agregate "
+        "WHERE plane_id IN (SELECT plane_id FROM osob_plane_base WHERE osob_id = "
+        "OLD.osob_id) AND agregate_id IN (SELECT id FROM agregate_base WHERE system_id = "
+        "OLD.system_id); INSERT OR IGNORE INTO plane_effective_agregate (plane_id, "
+        "agregate_id) SELECT p.id, a.id FROM plane_base AS p JOIN system_base AS s ON "
+        "s.plane_type_id = p.plane_type_id JOIN agregate_base AS a ON a.system_id = s.id "
+        "WHERE p.id IN (SELECT plane_id FROM osob_plane_base WHERE osob_id = OLD.osob_id)"
+        " AND a.id IN (SELECT id FROM agregate_base WHERE system_id = OLD.system_id) AND "
+        "NOT EXISTS (SELECT 1 FROM osob_agregate_remove_base AS r JOIN osob_plane_base AS"
+        " op ON op.osob_id = r.osob_id WHERE op.plane_id = p.id AND r.agregate_id = a.id)"
+        " AND NOT EXISTS (SELECT 1 FROM osob_system_remove_base AS rs JOIN "
+        "osob_plane_base AS op ON op.osob_id = rs.osob_id WHERE op.plane_id = p.id AND "
+        "rs.system_id = s.id) UNION SELECT p.id, a.id FROM osob_plane_base AS op JOIN "
+        "plane_base AS p ON p.id = op.plane_id JOIN osob_agregate_add_base AS aa ON "
+        "aa.osob_id = op.osob_id JOIN agregate_base AS a ON a.id = aa.agregate_id WHERE "
+        "p.id IN (SELECT plane_id FROM osob_plane_base WHERE osob_id = OLD.osob_id) AND "
+        "a.id IN (SELECT id FROM agregate_base WHERE system_id = OLD.system_id) UNION "
+        "SELECT p.id, a.id FROM osob_plane_base AS op JOIN plane_base AS p ON p.id = "
+        "op.plane_id JOIN osob_system_add_base AS sa ON sa.osob_id = op.osob_id JOIN "
+        "agregate_base AS a ON a.system_id = sa.system_id WHERE p.id IN (SELECT plane_id "
+        "FROM osob_plane_base WHERE osob_id = OLD.osob_id) AND a.id IN (SELECT id FROM "
+        "agregate_base WHERE system_id = OLD.system_id); DELETE FROM "
+        "plane_effective_agregate WHERE plane_id IN (SELECT plane_id FROM osob_plane_base"
+        " WHERE osob_id = NEW.osob_id) AND agregate_id IN (SELECT id FROM agregate_base "
+        "WHERE system_id = NEW.system_id); INSERT OR IGNORE INTO plane_effective_agregate"
+        " (plane_id, agregate_id) SELECT p.id, a.id FROM plane_base AS p JOIN system_base"
+        " AS s ON s.plane_type_id = p.plane_type_id JOIN agregate_base AS a ON "
+        "a.system_id = s.id WHERE p.id IN (SELECT plane_id FROM osob_plane_base WHERE "
+        "osob_id = NEW.osob_id) AND a.id IN (SELECT id FROM agregate_base WHERE system_id"
+        " = NEW.system_id) AND NOT EXISTS (SELECT 1 FROM osob_agregate_remove_base AS r "
+        "JOIN osob_plane_base AS op ON op.osob_id = r.osob_id WHERE op.plane_id = p.id "
+        "AND r.agregate_id = a.id) AND NOT EXISTS (SELECT 1 FROM osob_system_remove_base "
+        "AS rs JOIN osob_plane_base AS op ON op.osob_id = rs.osob_id WHERE op.plane_id = "
+        "p.id AND rs.system_id = s.id) UNION SELECT p.id, a.id FROM osob_plane_base AS op"
+        " JOIN plane_base AS p ON p.id = op.plane_id JOIN osob_agregate_add_base AS aa ON"
+        " aa.osob_id = op.osob_id JOIN agregate_base AS a ON a.id = aa.agregate_id WHERE "
+        "p.id IN (SELECT plane_id FROM osob_plane_base WHERE osob_id = NEW.osob_id) AND "
+        "a.id IN (SELECT id FROM agregate_base WHERE system_id = NEW.system_id) UNION "
+        "SELECT p.id, a.id FROM osob_plane_base AS op JOIN plane_base AS p ON p.id = "
+        "op.plane_id JOIN osob_system_add_base AS sa ON sa.osob_id = op.osob_id JOIN "
+        "agregate_base AS a ON a.system_id = sa.system_id WHERE p.id IN (SELECT plane_id "
+        "FROM osob_plane_base WHERE osob_id = NEW.osob_id) AND a.id IN (SELECT id FROM "
+        "agregate_base WHERE system_id = NEW.system_id); END"
+    ),
+    "pea_system_remove_ai": (
+        "CREATE TRIGGER IF NOT EXISTS pea_system_remove_ai AFTER INSERT ON "
+        "osob_system_remove_base FOR EACH ROW BEGIN DELETE FROM plane_effective_agregate "
+        "WHERE plane_id IN (SELECT plane_id FROM osob_plane_base WHERE osob_id = "
+        "NEW.osob_id) AND agregate_id IN (SELECT id FROM agregate_base WHERE system_id = "
+        "NEW.system_id); INSERT OR IGNORE INTO plane_effective_agregate (plane_id, "
+        "agregate_id) SELECT p.id, a.id FROM plane_base AS p JOIN system_base AS s ON "
+        "s.plane_type_id = p.plane_type_id JOIN agregate_base AS a ON a.system_id = s.id "
+        "WHERE p.id IN (SELECT plane_id FROM osob_plane_base WHERE osob_id = NEW.osob_id)"
+        " AND a.id IN (SELECT id FROM agregate_base WHERE system_id = NEW.system_id) AND "
+        "NOT EXISTS (SELECT 1 FROM osob_agregate_remove_base AS r JOIN osob_plane_base AS"
+        " op ON op.osob_id = r.osob_id WHERE op.plane_id = p.id AND r.agregate_id = a.id)"
+        " AND NOT EXISTS (SELECT 1 FROM osob_system_remove_base AS rs JOIN "
+        "osob_plane_base AS op ON op.osob_id = rs.osob_id WHERE op.plane_id = p.id AND "
+        "rs.system_id = s.id) UNION SELECT p.id, a.id FROM osob_plane_base AS op JOIN "
+        "plane_base AS p ON p.id = op.plane_id JOIN osob_agregate_add_base AS aa ON "
+        "aa.osob_id = op.osob_id JOIN agregate_base AS a ON a.id = aa.agregate_id WHERE "
+        "p.id IN (SELECT plane_id FROM osob_plane_base WHERE osob_id = NEW.osob_id) AND "
+        "a.id IN (SELECT id FROM agregate_base WHERE system_id = NEW.system_id) UNION "
+        "SELECT p.id, a.id FROM osob_plane_base AS op JOIN plane_base AS p ON p.id = "
+        "op.plane_id JOIN osob_system_add_base AS sa ON sa.osob_id = op.osob_id JOIN "
+        "agregate_base AS a ON a.system_id = sa.system_id WHERE p.id IN (SELECT plane_id "
+        "FROM osob_plane_base WHERE osob_id = NEW.osob_id) AND a.id IN (SELECT id FROM "
+        "agregate_base WHERE system_id = NEW.system_id); END"
+    ),
+    "pea_system_remove_ad": (
+        "CREATE TRIGGER IF NOT EXISTS pea_system_remove_ad AFTER DELETE ON "
+        "osob_system_remove_base FOR EACH ROW BEGIN DELETE FROM plane_effective_agregate "
+        "WHERE plane_id IN (SELECT plane_id FROM osob_plane_base WHERE osob_id = "
+        "OLD.osob_id) AND agregate_id IN (SELECT id FROM agregate_base WHERE system_id = "
+        "OLD.system_id); INSERT OR IGNORE INTO plane_effective_agregate (plane_id, "
+        "agregate_id) SELECT p.id, a.id FROM plane_base AS p JOIN system_base AS s ON "
+        "s.plane_type_id = p.plane_type_id JOIN agregate_base AS a ON a.system_id = s.id "
+        "WHERE p.id IN (SELECT plane_id FROM osob_plane_base WHERE osob_id = OLD.osob_id)"
+        " AND a.id IN (SELECT id FROM agregate_base WHERE system_id = OLD.system_id) AND "
+        "NOT EXISTS (SELECT 1 FROM osob_agregate_remove_base AS r JOIN osob_plane_base AS"
+        " op ON op.osob_id = r.osob_id WHERE op.plane_id = p.id AND r.agregate_id = a.id)"
+        " AND NOT EXISTS (SELECT 1 FROM osob_system_remove_base AS rs JOIN "
+        "osob_plane_base AS op ON op.osob_id = rs.osob_id WHERE op.plane_id = p.id AND "
+        "rs.system_id = s.id) UNION SELECT p.id, a.id FROM osob_plane_base AS op JOIN "
+        "plane_base AS p ON p.id = op.plane_id JOIN osob_agregate_add_base AS aa ON "
+        "aa.osob_id = op.osob_id JOIN agregate_base AS a ON a.id = aa.agregate_id WHERE "
+        "p.id IN (SELECT plane_id FROM osob_plane_base WHERE osob_id = OLD.osob_id) AND "
+        "a.id IN (SELECT id FROM agregate_base WHERE system_id = OLD.system_id) UNION "
+        "SELECT p.id, a.id FROM osob_plane_base AS op JOIN plane_base AS p ON p.id = "
+        "op.plane_id JOIN osob_system_add_base AS sa ON sa.osob_id = op.osob_id JOIN "
+        "agregate_base AS a ON a.system_id = sa.system_id WHERE p.id IN (SELECT plane_id "
+        "FROM osob_plane_base WHERE osob_id = OLD.osob_id) AND a.id IN (SELECT id FROM "
+        "agregate_base WHERE system_id = OLD.system_id); END"
+    ),
+    "pea_system_remove_au": (
+        "CREATE TRIGGER IF NOT EXISTS pea_system_remove_au AFTER UPDATE ON "
+        "osob_system_remove_base FOR EACH ROW BEGIN DELETE FROM plane_effective_agregate "
+        "WHERE plane_id IN (SELECT plane_id FROM osob_plane_base WHERE osob_id = "
+        "OLD.osob_id) AND agregate_id IN (SELECT id FROM agregate_base WHERE system_id = "
+        "OLD.system_id); INSERT OR IGNORE INTO plane_effective_agregate (plane_id, "
+        "agregate_id) SELECT p.id, a.id FROM plane_base AS p JOIN system_base AS s ON "
+        "s.plane_type_id = p.plane_type_id JOIN agregate_base AS a ON a.system_id = s.id "
+        "WHERE p.id IN (SELECT plane_id FROM osob_plane_base WHERE osob_id = OLD.osob_id)"
+        " AND a.id IN (SELECT id FROM agregate_base WHERE system_id = OLD.system_id) AND "
+        "NOT EXISTS (SELECT 1 FROM osob_agregate_remove_base AS r JOIN osob_plane_base AS"
+        " op ON op.osob_id = r.osob_id WHERE op.plane_id = p.id AND r.agregate_id = a.id)"
+        " AND NOT EXISTS (SELECT 1 FROM osob_system_remove_base AS rs JOIN "
+        "osob_plane_base AS op ON op.osob_id = rs.osob_id WHERE op.plane_id = p.id AND "
+        "rs.system_id = s.id) UNION SELECT p.id, a.id FROM osob_plane_base AS op JOIN "
+        "plane_base AS p ON p.id = op.plane_id JOIN osob_agregate_add_base AS aa ON "
+        "aa.osob_id = op.osob_id JOIN agregate_base AS a ON a.id = aa.agregate_id WHERE "
+        "p.id IN (SELECT plane_id FROM osob_plane_base WHERE osob_id = OLD.osob_id) AND "
+        "a.id IN (SELECT id FROM agregate_base WHERE system_id = OLD.system_id) UNION "
+        "SELECT p.id, a.id FROM osob_plane_base AS op JOIN plane_base AS p ON p.id = "
+        "op.plane_id JOIN osob_system_add_base AS sa ON sa.osob_id = op.osob_id JOIN "
+        "agregate_base AS a ON a.system_id = sa.system_id WHERE p.id IN (SELECT plane_id "
+        "FROM osob_plane_base WHERE osob_id = OLD.osob_id) AND a.id IN (SELECT id FROM "
+        "agregate_base WHERE system_id = OLD.system_id); DELETE FROM "
+        "plane_effective_agregate WHERE plane_id IN (SELECT plane_id FROM osob_plane_base"
+        " WHERE osob_id = NEW.osob_id) AND agregate_id IN (SELECT id FROM agregate_base "
+        "WHERE system_id = NEW.system_id); INSERT OR IGNORE INTO plane_effective_agregate"
+        " (plane_id, agregate_id) SELECT p.id, a.id FROM plane_base AS p JOIN system_base"
+        " AS s ON s.plane_type_id = p.plane_type_id JOIN agregate_base AS a ON "
+        "a.system_id = s.id WHERE p.id IN (SELECT plane_id FROM osob_plane_base WHERE "
+        "osob_id = NEW.osob_id) AND a.id IN (SELECT id FROM agregate_base WHERE system_id"
+        " = NEW.system_id) AND NOT EXISTS (SELECT 1 FROM osob_agregate_remove_base AS r "
+        "JOIN osob_plane_base AS op ON op.osob_id = r.osob_id WHERE op.plane_id = p.id "
+        "AND r.agregate_id = a.id) AND NOT EXISTS (SELECT 1 FROM osob_system_remove_base "
+        "AS rs JOIN osob_plane_base AS op ON op.osob_id = rs.osob_id WHERE op.plane_id = "
+        "p.id AND rs.system_id = s.id) UNION SELECT p.id, a.id FROM osob_plane_base AS op"
+        " JOIN plane_base AS p ON p.id = op.plane_id JOIN osob_agregate_add_base AS aa ON"
+        " aa.osob_id = op.osob_id JOIN agregate_base AS a ON a.id = aa.agregate_id WHERE "
+        "p.id IN (SELECT plane_id FROM osob_plane_base WHERE osob_id = NEW.osob_id) AND "
+        "a.id IN (SELECT id FROM agregate_base WHERE system_id = NEW.system_id) UNION "
+        "SELECT p.id, a.id FROM osob_plane_base AS op JOIN plane_base AS p ON p.id = "
+        "op.plane_id JOIN osob_system_add_base AS sa ON sa.osob_id = op.osob_id JOIN "
+        "agregate_base AS a ON a.system_id = sa.system_id WHERE p.id IN (SELECT plane_id "
+        "FROM osob_plane_base WHERE osob_id = NEW.osob_id) AND a.id IN (SELECT id FROM "
+        "agregate_base WHERE system_id = NEW.system_id); END"
+    ),
+}
+
+REBUILD_SQL = [
+    (
+        "DELETE FROM plane_effective_agregate WHERE 1 AND 1"
+    ),
+    (
+        "INSERT OR IGNORE INTO plane_effective_agregate (plane_id, agregate_id) SELECT "
+        "p.id, a.id FROM plane_base AS p JOIN system_base AS s ON s.plane_type_id = "
+        "p.plane_type_id JOIN agregate_base AS a ON a.system_id = s.id WHERE 1 AND 1 AND "
+        "NOT EXISTS (SELECT 1 FROM osob_agregate_remove_base AS r JOIN osob_plane_base AS"
+        " op ON op.osob_id = r.osob_id WHERE op.plane_id = p.id AND r.agregate_id = a.id)"
+        " AND NOT EXISTS (SELECT 1 FROM osob_system_remove_base AS rs JOIN "
+        "osob_plane_base AS op ON op.osob_id = rs.osob_id WHERE op.plane_id = p.id AND "
+        "rs.system_id = s.id) UNION SELECT p.id, a.id FROM osob_plane_base AS op JOIN "
+        "plane_base AS p ON p.id = op.plane_id JOIN osob_agregate_add_base AS aa ON "
+        "aa.osob_id = op.osob_id JOIN agregate_base AS a ON a.id = aa.agregate_id WHERE 1"
+        " AND 1 UNION SELECT p.id, a.id FROM osob_plane_base AS op JOIN plane_base AS p "
+        "ON p.id = op.plane_id JOIN osob_system_add_base AS sa ON sa.osob_id = op.osob_id"
+        " JOIN agregate_base AS a ON a.system_id = sa.system_id WHERE 1 AND 1"
+    ),
+]
+
+
+def _previous() -> dict:
+    """Load frozen SQL of the migration whose triggers this one replaces."""
+    return runpy.run_path(str(Path(MIGRATIONS_DIR) / PREVIOUS_MIGRATION))
+
+
+def migrate(migrator: SqliteMigrator, database: SqliteDatabase, fake: bool):
+    """Recreate maintenance triggers and rebuild plane_effective_agregate."""
+    for name in _previous()["TRIGGERS"]:
+        migrator.sql(f"DROP TRIGGER IF EXISTS {name}")
+    for statement in TRIGGERS.values():
+        migrator.sql(statement)
+    for statement in REBUILD_SQL:
+        migrator.sql(statement)
+
+
+def rollback(migrator: SqliteMigrator, database: SqliteDatabase, fake: bool):
+    """Restore triggers of migration 002 and rebuild with its rules."""
+    previous = _previous()
+    for name in TRIGGERS:
+        migrator.sql(f"DROP TRIGGER IF EXISTS {name}")
+    for statement in previous["TRIGGERS"].values():
+        migrator.sql(statement)
+    for statement in previous["REBUILD_SQL"]:
+        migrator.sql(statement)
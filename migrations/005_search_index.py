@@ -0,0 +1,123 @@
+"""
+Full-text search index over failures and aircraft with its maintenance triggers.
+
+The SQL is frozen here; later changes go into new migrations.
+"""
+from peewee import *
+from playhouse.migrate import *
+
+CREATE_SQL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS search_index USING fts5(agregate, system, "
+    "number, bort, description, plane_id UNINDEXED, tokenize = 'unicode61 "
+    "remove_diacritics 2', prefix = '1 2 3')"
+)
+
+TRIGGERS = {
+    "search_otkaz_ai": (
+        "CREATE TRIGGER IF NOT EXISTS search_otkaz_ai AFTER INSERT ON otkaz_agregate_base "
+        "FOR EACH ROW BEGIN DELETE FROM search_index WHERE rowid IN (SELECT o.id FROM "
+        "otkaz_agregate_base AS o WHERE o.id = NEW.id); INSERT INTO search_index (rowid, "
+        "agregate, system, number, bort, description, plane_id) SELECT o.id, a.name, "
+        "s.name, o.number, p.bort_number, o.description, o.plane_id FROM "
+        "otkaz_agregate_base AS o JOIN agregate_base AS a ON a.id = o.agregate_id JOIN "
+        "system_base AS s ON s.id = a.system_id JOIN plane_base AS p ON p.id = o.plane_id "
+        "WHERE o.id = NEW.id; END"
+    ),
+    "search_otkaz_au": (
+        "CREATE TRIGGER IF NOT EXISTS search_otkaz_au AFTER UPDATE ON otkaz_agregate_base "
+        "FOR EACH ROW BEGIN DELETE FROM search_index WHERE rowid IN (SELECT o.id FROM "
+        "otkaz_agregate_base AS o WHERE o.id = NEW.id); INSERT INTO search_index (rowid, "
+        "agregate, system, number, bort, description, plane_id) SELECT o.id, a.name, "
+        "s.name, o.number, p.bort_number, o.description, o.plane_id FROM "
+        "otkaz_agregate_base AS o JOIN agregate_base AS a ON a.id = o.agregate_id JOIN "
+        "system_base AS s ON s.id = a.system_id JOIN plane_base AS p ON p.id = o.plane_id "
+        "WHERE o.id = NEW.id; END"
+    ),
+    "search_otkaz_ad": (
+        "CREATE TRIGGER IF NOT EXISTS search_otkaz_ad AFTER DELETE ON otkaz_agregate_base "
+        "FOR EACH ROW BEGIN DELETE FROM search_index WHERE rowid = OLD.id; END"
+    ),
+    "search_agregate_au": (
+        "CREATE TRIGGER IF NOT EXISTS search_agregate_au AFTER UPDATE OF name, system_id "
+        "ON agregate_base FOR EACH ROW BEGIN DELETE FROM search_index WHERE rowid IN "
+        "(SELECT o.id FROM otkaz_agregate_base AS o WHERE o.agregate_id = NEW.id); INSERT "
+        "INTO search_index (rowid, agregate, system, number, bort, description, plane_id) "
+        "SELECT o.id, a.name, s.name, o.number, p.bort_number, o.description, o.plane_id "
+        "FROM otkaz_agregate_base AS o JOIN agregate_base AS a ON a.id = o.agregate_id "
+        "JOIN system_base AS s ON s.id = a.system_id JOIN plane_base AS p ON p.id = "
+        "o.plane_id WHERE o.agregate_id = NEW.id; END"
+    ),
+    "search_system_au": (
+        "CREATE TRIGGER IF NOT EXISTS search_system_au AFTER UPDATE OF name ON "
+        "system_base FOR EACH ROW BEGIN DELETE FROM search_index WHERE rowid IN (SELECT "
+        "o.id FROM otkaz_agregate_base AS o WHERE o.agregate_id IN (SELECT id FROM "
+        "agregate_base WHERE system_id = NEW.id)); INSERT INTO search_index (rowid, "
+        "agregate, system, number, bort, description, plane_id) SELECT o.id, a.name, "
+        "s.name, o.number, p.bort_number, o.description, o.plane_id FROM "
+        "otkaz_agregate_base AS o JOIN agregate_base AS a ON a.id = o.agregate_id JOIN "
+        "system_base AS s ON s.id = a.system_id JOIN plane_base AS p ON p.id = o.plane_id "
+        "WHERE o.agregate_id IN (SELECT id FROM agregate_base WHERE system_id = NEW.id); "
+        "END"
+    ),
+    "search_plane_ai": (
+        "CREATE TRIGGER IF NOT EXISTS search_plane_ai AFTER INSERT ON plane_base FOR EACH "
+        "ROW BEGIN DELETE FROM search_index WHERE rowid = -NEW.id; INSERT INTO "
+        "search_index (rowid, agregate, system, number, bort, description, plane_id) "
+        "SELECT -p.id, '', '', '', p.bort_number, '', p.id FROM plane_base AS p WHERE "
+        "p.id = NEW.id; END"
+    ),
+    "search_plane_au": (
+        "CREATE TRIGGER IF NOT EXISTS search_plane_au AFTER UPDATE OF bort_number ON "
+        "plane_base FOR EACH ROW BEGIN DELETE FROM search_index WHERE rowid = -NEW.id; "
+        "INSERT INTO search_index (rowid, agregate, system, number, bort, description, "
+        "plane_id) SELECT -p.id, '', '', '', p.bort_number, '', p.id FROM plane_base AS p "
+        "WHERE p.id = NEW.id; DELETE FROM search_index WHERE rowid IN (SELECT o.id FROM "
+        "otkaz_agregate_base AS o WHERE o.plane_id = NEW.id); INSERT INTO search_index "
+        "(rowid, agregate, system, number, bort, description, plane_id) SELECT o.id, "
+        "a.name, s.name, o.number, p.bort_number, o.description, o.plane_id FROM "
+        "otkaz_agregate_base AS o JOIN agregate_base AS a ON a.id = o.agregate_id JOIN "
+        "system_base AS s ON s.id = a.system_id JOIN plane_base AS p ON p.id = o.plane_id "
+        "WHERE o.plane_id = NEW.id; END"
+    ),
+    "search_plane_ad": (
+        "CREATE TRIGGER IF NOT EXISTS search_plane_ad AFTER DELETE ON plane_base FOR EACH "
+        "ROW BEGIN DELETE FROM search_index WHERE rowid = -OLD.id; END"
+    ),
+}
+
+REBUILD_SQL = [
+    (
+        "DELETE FROM search_index"
+    ),
+    (
+        "INSERT INTO search_index (rowid, agregate, system, number, bort, description, "
+        "plane_id) SELECT o.id, a.name, s.name, o.number, p.bort_number, o.description, "
+        "o.plane_id FROM otkaz_agregate_base AS o JOIN agregate_base AS a ON a.id = "
+        "o.agregate_id JOIN system_base AS s ON s.id = a.system_id JOIN plane_base AS p "
+        "ON p.id = o.plane_id WHERE 1"
+    ),
+    (
+        "INSERT INTO search_index (rowid, agregate, system, number, bort, description, "
+        "plane_id) SELECT -p.id, '', '', '', p.bort_number, '', p.id FROM plane_base AS p "
+        "WHERE 1"
+    ),
+    (
+        "INSERT INTO search_index (search_index) VALUES ('optimize')"
+    ),
+]
+
+
+def migrate(migrator: SqliteMigrator, database: SqliteDatabase, fake: bool):
+    """Create search_index, its triggers and fill it."""
+    migrator.sql(CREATE_SQL)
+    for statement in TRIGGERS.values():
+        migrator.sql(statement)
+    for statement in REBUILD_SQL:
+        migrator.sql(statement)
+
+
+def rollback(migrator: SqliteMigrator, database: SqliteDatabase, fake: bool):
+    """Drop search_index and its triggers."""
+    for name in TRIGGERS:
+        migrator.sql(f"DROP TRIGGER IF EXISTS {name}")
+    migrator.sql("DROP TABLE IF EXISTS search_index")
@@ -0,0 +1,52 @@
+"""
+Indexes ordering names with the Russian collation and bort numbers naturally.
+
+The RU and NATSORT collations and the casefold function are registered on
+every connection by IASDatabase (app.collation).
+
+- type_base(name), podrazd_base(name), agregate_base(name): lists ordered
+  by name
+- group_base(plane_type_id, name), system_base(group_id, name),
+  agregate_base(system_id, name): replace the binary-ordered indexes of 003
+- agregate_base(casefold(name)): case-insensitive name prefix filter
+- plane_base(podrazd_id, bort_number) replaces (podrazd_id) of 003,
+  plane_base(bort_number): aircraft ordered by bort number
+"""
+from peewee import *
+from playhouse.migrate import *
+
+INDEXES = [
+    ("idx_type_base_name_ru", "type_base", "name COLLATE RU"),
+    ("idx_podrazd_base_name_ru", "podrazd_base", "name COLLATE RU"),
+    ("idx_group_base_plane_type", "group_base", "plane_type_id, name COLLATE RU"),
+    ("idx_system_base_group", "system_base", "group_id, name COLLATE RU"),
+    ("idx_agregate_base_system", "agregate_base", "system_id, name COLLATE RU"),
+    ("idx_agregate_base_name_ru", "agregate_base", "name COLLATE RU"),
+    ("idx_agregate_base_name_casefold", "agregate_base", "casefold(name)"),
+    ("idx_plane_base_podrazd", "plane_base", "podrazd_id, bort_number COLLATE NATSORT"),
+    ("idx_plane_base_bort_number", "plane_base", "bort_number COLLATE NATSORT"),
+]
+
+# Indexes of 003 replaced above
+PREVIOUS_INDEXES = [
+    ("idx_group_base_plane_type", "group_base", "plane_type_id, name"),
+    ("idx_system_base_group", "system_base", "group_id, name"),
+    ("idx_agregate_base_system", "agregate_base", "system_id, name"),
+    ("idx_plane_base_podrazd", "plane_base", "podrazd_id"),
+]
+
+
+def migrate(migrator: SqliteMigrator, database: SqliteDatabase, fake: bool):
+    """Create collated indexes and refresh planner statistics."""
+    for name, table, columns in INDEXES:
+        migrator.sql(f"DROP INDEX IF EXISTS {name}")
+        migrator.sql(f"CREATE INDEX {name} ON {table}({columns})")
+    migrator.sql("ANALYZE")
+
+
+def rollback(migrator: SqliteMigrator, database: SqliteDatabase, fake: bool):
+    """Drop collated indexes and restore the indexes of 003."""
+    for name, _table, _columns in INDEXES:
+        migrator.sql(f"DROP INDEX IF EXISTS {name}")
+    for name, table, columns in PREVIOUS_INDEXES:
+        migrator.sql(f"CREATE INDEX IF NOT EXISTS {name} ON {table}({columns})")
@@ -0,0 +1,111 @@
+"""
+Failure event log and snapshots with the triggers writing the log.
+
+Failures existing before the log get an opening event at their creation time.
+The SQL is frozen here; later changes go into new migrations.
+"""
+from peewee import *
+from playhouse.migrate import *
+
+TRIGGERS = {
+    "history_otkaz_ai": (
+        "CREATE TRIGGER IF NOT EXISTS history_otkaz_ai AFTER INSERT ON "
+        "otkaz_agregate_base FOR EACH ROW BEGIN INSERT INTO failure_event (created_at, "
+        "kind, otkaz_id, plane_id, agregate_id, number, description, removed) VALUES "
+        "(strftime('%Y-%m-%d %H:%M:%f', 'now', 'localtime'), 'opened', NEW.id, "
+        "NEW.plane_id, NEW.agregate_id, NEW.number, NEW.description, NEW.removed); END"
+    ),
+    "history_otkaz_au": (
+        "CREATE TRIGGER IF NOT EXISTS history_otkaz_au AFTER UPDATE ON "
+        "otkaz_agregate_base FOR EACH ROW WHEN OLD.plane_id = NEW.plane_id AND "
+        "(OLD.agregate_id, OLD.number, OLD.description, OLD.removed) IS NOT "
+        "(NEW.agregate_id, NEW.number, NEW.description, NEW.removed) BEGIN INSERT INTO "
+        "failure_event (created_at, kind, otkaz_id, plane_id, agregate_id, number, "
+        "description, removed) VALUES (strftime('%Y-%m-%d %H:%M:%f', 'now', 'localtime'), "
+        "CASE WHEN NEW.removed AND NOT OLD.removed THEN 'removed' ELSE 'changed' END, "
+        "NEW.id, NEW.plane_id, NEW.agregate_id, NEW.number, NEW.description, "
+        "NEW.removed); END"
+    ),
+    "history_otkaz_moved": (
+        "CREATE TRIGGER IF NOT EXISTS history_otkaz_moved AFTER UPDATE OF plane_id ON "
+        "otkaz_agregate_base FOR EACH ROW WHEN OLD.plane_id <> NEW.plane_id BEGIN INSERT "
+        "INTO failure_event (created_at, kind, otkaz_id, plane_id, agregate_id, number, "
+        "description, removed) VALUES (strftime('%Y-%m-%d %H:%M:%f', 'now', 'localtime'), "
+        "'closed', OLD.id, OLD.plane_id, OLD.agregate_id, OLD.number, OLD.description, "
+        "OLD.removed); INSERT INTO failure_event (created_at, kind, otkaz_id, plane_id, "
+        "agregate_id, number, description, removed) VALUES (strftime('%Y-%m-%d %H:%M:%f', "
+        "'now', 'localtime'), 'opened', NEW.id, NEW.plane_id, NEW.agregate_id, "
+        "NEW.number, NEW.description, NEW.removed); END"
+    ),
+    "history_otkaz_ad": (
+        "CREATE TRIGGER IF NOT EXISTS history_otkaz_ad AFTER DELETE ON "
+        "otkaz_agregate_base FOR EACH ROW BEGIN INSERT INTO failure_event (created_at, "
+        "kind, otkaz_id, plane_id, agregate_id, number, description, removed) VALUES "
+        "(strftime('%Y-%m-%d %H:%M:%f', 'now', 'localtime'), 'closed', OLD.id, "
+        "OLD.plane_id, OLD.agregate_id, OLD.number, OLD.description, OLD.removed); END"
+    ),
+}
+
+BACKFILL_SQL = (
+    "INSERT INTO failure_event (created_at, kind, otkaz_id, plane_id, agregate_id, "
+    "number, description, removed) SELECT o.created_at, 'opened', o.id, o.plane_id, "
+    "o.agregate_id, o.number, o.description, o.removed FROM otkaz_agregate_base AS o "
+    "WHERE NOT EXISTS (SELECT 1 FROM failure_event AS e WHERE e.otkaz_id = o.id) "
+    "ORDER BY o.created_at, o.id"
+)
+
+INDEXES = [
+    ("idx_failure_event_plane", "failure_event", "plane_id, created_at"),
+    ("idx_failure_event_agregate", "failure_event", "agregate_id, created_at"),
+    ("idx_failure_event_otkaz", "failure_event", "otkaz_id"),
+    ("idx_failure_snapshot_created", "failure_snapshot", "created_at"),
+    ("idx_failure_snapshot_item_plane", "failure_snapshot_item", "snapshot_id, plane_id"),
+]
+
+
+def migrate(migrator: SqliteMigrator, database: SqliteDatabase, fake: bool):
+    """Create the failure history tables, log existing failures and install the triggers."""
+    migrator.sql(
+        "CREATE TABLE failure_event ("
+        "id INTEGER NOT NULL PRIMARY KEY,"
+        "created_at DATETIME NOT NULL,"
+        "otkaz_id INTEGER NOT NULL,"
+        "plane_id INTEGER NOT NULL,"
+        "agregate_id INTEGER NOT NULL,"
+        "kind VARCHAR(255) NOT NULL,"
+        "number VARCHAR(255) NOT NULL,"
+        "description VARCHAR(255) NOT NULL,"
+        "removed INTEGER NOT NULL)"
+    )
+    migrator.sql(
+        "CREATE TABLE failure_snapshot ("
+        "id INTEGER NOT NULL PRIMARY KEY,"
+        "created_at DATETIME NOT NULL,"
+        "last_event_id INTEGER NOT NULL)"
+    )
+    migrator.sql(
+        "CREATE TABLE failure_snapshot_item ("
+        "snapshot_id INTEGER NOT NULL,"
+        "otkaz_id INTEGER NOT NULL,"
+        "plane_id INTEGER NOT NULL,"
+        "agregate_id INTEGER NOT NULL,"
+        "number VARCHAR(255) NOT NULL,"
+        "description VARCHAR(255) NOT NULL,"
+        "removed INTEGER NOT NULL,"
+        "PRIMARY KEY (snapshot_id, otkaz_id),"
+        "FOREIGN KEY (snapshot_id) REFERENCES failure_snapshot(id) ON DELETE CASCADE"
+        ") WITHOUT ROWID"
+    )
+    for name, table, columns in INDEXES:
+        migrator.sql(f"CREATE INDEX {name} ON {table}({columns})")
+    migrator.sql(BACKFILL_SQL)
+    for statement in TRIGGERS.values():
+        migrator.sql(statement)
+
+
+def rollback(migrator: SqliteMigrator, database: SqliteDatabase, fake: bool):
+    """Drop the failure history triggers and tables."""
+    for name in TRIGGERS:
+        migrator.sql(f"DROP TRIGGER IF EXISTS {name}")
+    for table in ("failure_snapshot_item", "failure_snapshot", "failure_event"):
+        migrator.sql(f"DROP TABLE IF EXISTS {table}")
@@ -1,8 +1,11 @@
 """Pytest configuration and fixtures."""
+from contextlib import contextmanager
+
 import pytest
-from peewee import SqliteDatabase
 
-from app.database import get_database
+from app.database import IASDatabase, get_database, record_queries
+from app.services.catalog import invalidate_catalog
+from app.services.db_worker import get_executor
 from data.models import (
     TypeBase,
     PodrazdBase,
@@ -17,10 +20,17 @@ from data.models import (
     OsobAgregateAddBase,
     OsobAgregateRemoveBase,
     OtkazAgregateBase,
+    PlaneEffectiveAgregate,
+    FailureEvent,
+    FailureSnapshot,
+    FailureSnapshotItem,
 )
+from data.models.effective import create_effective_triggers
+from data.models.history import create_history_triggers
+from data.models.search import create_search_index
 
 
-TEST_DATABASE = SqliteDatabase(":memory:", pragmas={"foreign_keys": 1})
+TEST_DATABASE = IASDatabase(":memory:", pragmas={"foreign_keys": 1})
 
 
 @pytest.fixture(scope="session")
@@ -41,6 +51,10 @@ def test_db():
             OsobAgregateAddBase,
             OsobAgregateRemoveBase,
             OtkazAgregateBase,
+            PlaneEffectiveAgregate,
+            FailureEvent,
+            FailureSnapshot,
+            FailureSnapshotItem,
         ],
         bind_refs=False,
         bind_backrefs=False,
@@ -60,9 +74,18 @@ def test_db():
             OsobAgregateAddBase,
             OsobAgregateRemoveBase,
             OtkazAgregateBase,
+            PlaneEffectiveAgregate,
+            FailureEvent,
+            FailureSnapshot,
+            FailureSnapshotItem,
         ],
         safe=True,
     )
+    create_effective_triggers(TEST_DATABASE)
+    create_search_index(TEST_DATABASE)
+    create_history_triggers(TEST_DATABASE)
+    # In-memory database exists per connection: run worker tasks inline
+    get_executor().synchronous = True
     yield TEST_DATABASE
     TEST_DATABASE.drop_tables(
         [
@@ -79,6 +102,10 @@ def test_db():
             OsobAgregateAddBase,
             OsobAgregateRemoveBase,
             OtkazAgregateBase,
+            PlaneEffectiveAgregate,
+            FailureEvent,
+            FailureSnapshot,
+            FailureSnapshotItem,
         ],
         safe=True,
     )
@@ -89,6 +116,7 @@ def clean_database(test_db):
     """Clean database before each test."""
     # Clear all tables before each test
     tables = [
+        PlaneEffectiveAgregate,
         OtkazAgregateBase,
         OsobAgregateRemoveBase,
         OsobAgregateAddBase,
@@ -102,7 +130,23 @@ def clean_database(test_db):
         GroupBase,
         PodrazdBase,
         TypeBase,
+        FailureSnapshotItem,
+        FailureSnapshot,
+        FailureEvent,
     ]
     for table in tables:
         table.delete().execute()
+    invalidate_catalog()
     yield test_db
+
+
+@pytest.fixture
+def assert_max_queries(test_db):
+    """Context manager failing the test if its block runs more than n statements."""
+    @contextmanager
+    def check(limit: int):
+        with record_queries(test_db) as recorder:
+            yield recorder
+        assert recorder.count <= limit, f"expected at most {limit} statements, got:\n{recorder.report()}"
+
+    return check
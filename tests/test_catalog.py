@@ -0,0 +1,58 @@
+"""Tests for the catalog cache used by combo boxes."""
+from app.database import record_queries
+from app.services.catalog import get_catalog, invalidate_catalog
+from app.ui.widgets.combo_box import AgregateComboBox, GroupComboBox, SystemComboBox
+from data.models import AgregateBase, GroupBase, SystemBase, TypeBase
+
+
+class TestCatalogTree:
+    """Tests for CatalogTree."""
+
+    def setup_method(self) -> None:
+        """Create a small catalog."""
+        self.plane_type = TypeBase.create(name="Catalog Type")
+        self.empty_type = TypeBase.create(name="Empty Type")
+        self.group = GroupBase.create(name="Catalog Group", plane_type=self.plane_type)
+        self.system = SystemBase.create(name="Catalog System", group=self.group, plane_type=self.plane_type)
+        self.agregates = [AgregateBase.create(name=f"A{i}", system=self.system) for i in range(3)]
+
+    def test_loaded_with_one_query(self, test_db, assert_max_queries) -> None:
+        """Test the whole tree is loaded by a single select."""
+        with record_queries(test_db) as recorder:
+            get_catalog()
+        assert recorder.count == 1
+        with assert_max_queries(0):
+            get_catalog()
+
+    def test_children(self) -> None:
+        """Test items are indexed by parent."""
+        catalog = get_catalog()
+        assert catalog.items(TypeBase) == [self.plane_type, self.empty_type]
+        assert catalog.children(GroupBase, self.plane_type) == [self.group]
+        assert catalog.children(GroupBase, self.empty_type) == []
+        assert catalog.children(AgregateBase, self.system.id) == self.agregates
+        assert catalog.get(SystemBase, self.system.id).group_id == self.group.id
+
+    def test_invalidated(self) -> None:
+        """Test a version bump reloads the tree."""
+        assert len(get_catalog().children(AgregateBase, self.system)) == 3
+        AgregateBase.create(name="A3", system=self.system)
+        assert len(get_catalog().children(AgregateBase, self.system)) == 3
+        invalidate_catalog()
+        assert len(get_catalog().children(AgregateBase, self.system)) == 4
+
+    def test_cascading_combos_use_cache(self, assert_max_queries, qtbot) -> None:
+        """Test filtering cascading combo boxes does not touch the database."""
+        group_combo, system_combo, agregate_combo = GroupComboBox(), SystemComboBox(), AgregateComboBox()
+        for combo in (group_combo, system_combo, agregate_combo):
+            qtbot.addWidget(combo)
+
+        def cascade():
+            group_combo.set_filter(self.plane_type)
+            system_combo.set_filter(group_combo.currentData())
+            agregate_combo.set_filter(system_combo.currentData())
+
+        with assert_max_queries(0):
+            cascade()
+        assert agregate_combo.count() == 4
+        assert agregate_combo.currentData() == self.agregates[0]
@@ -0,0 +1,111 @@
+"""Tests for the checkable catalog tree and the feature dialog using it."""
+from PyQt6.QtCore import Qt
+
+from app.ui.dialogs.osob_features import OsobFeatureDialog
+from app.ui.widgets.check_tree import CatalogCheckModel, CatalogCheckTree
+from data.models import (
+    AgregateBase,
+    GroupBase,
+    OsobAgregateRemoveBase,
+    OsobBase,
+    OsobSystemRemoveBase,
+    SystemBase,
+    TypeBase,
+)
+
+
+class TestCatalogCheckModel:
+    """Tests for CatalogCheckModel."""
+
+    def setup_method(self) -> None:
+        """Create a catalog with one empty system."""
+        self.plane_type = TypeBase.create(name="Tree Type")
+        self.group = GroupBase.create(name="Tree Group", plane_type=self.plane_type)
+        self.system = SystemBase.create(name="Гидросистема", group=self.group, plane_type=self.plane_type)
+        self.empty = SystemBase.create(name="Empty System", group=self.group, plane_type=self.plane_type)
+        self.agregates = [AgregateBase.create(name=f"Насос {i}", system=self.system) for i in range(3)]
+
+    def test_structure(self, qtmodeltester) -> None:
+        """Test tree shape, stored checks and empty branch pruning."""
+        model = CatalogCheckModel(AgregateBase)
+        model.load(self.plane_type, [self.agregates[0].id])
+        qtmodeltester.check(model)
+
+        group_index = model.index(0, 0)
+        assert model.rowCount() == 1
+        assert model.rowCount(group_index) == 1
+        assert model.rowCount(model.index(0, 0, group_index)) == 3
+        assert model.checked_ids() == {self.agregates[0].id}
+        assert group_index.data(Qt.ItemDataRole.CheckStateRole) == Qt.CheckState.PartiallyChecked
+
+    def test_parent_checks_leaves(self) -> None:
+        """Test checking a parent checks all its leaves as one batch."""
+        model = CatalogCheckModel(AgregateBase)
+        model.load(self.plane_type)
+        toggled = []
+        changed = []
+        model.checked_changed.connect(lambda leaf_ids, checked: toggled.append(sorted(leaf_ids)))
+        model.dataChanged.connect(lambda top, bottom, roles: changed.append((top.row(), bottom.row())))
+
+        model.setData(model.index(0, 0), Qt.CheckState.Checked.value, Qt.ItemDataRole.CheckStateRole)
+
+        assert model.checked_ids() == {agregate.id for agregate in self.agregates}
+        assert toggled == [sorted(agregate.id for agregate in self.agregates)]
+        assert changed == [(0, 2), (0, 0), (0, 0)]
+        assert model.check_state(SystemBase, self.system.id) == Qt.CheckState.Checked
+
+    def test_filter(self, qtbot) -> None:
+        """Test filter is case-insensitive for Cyrillic and keeps parents of matches."""
+        model = CatalogCheckModel(SystemBase)
+        model.load(self.plane_type)
+        tree = CatalogCheckTree(model)
+        qtbot.addWidget(tree)
+
+        tree.set_filter_text("ГИДРО")
+
+        group_index = tree.proxy.index(0, 0)
+        assert tree.proxy.rowCount(group_index) == 1
+        assert tree.proxy.index(0, 0, group_index).data() == "Гидросистема"
+
+
+class TestOsobFeatureDialog:
+    """Tests for OsobFeatureDialog trees."""
+
+    def test_system_toggle_cascades(self, qtbot) -> None:
+        """Test system check selects its blocks and the save stores both."""
+        plane_type = TypeBase.create(name="Dialog Type")
+        group = GroupBase.create(name="Dialog Group", plane_type=plane_type)
+        system = SystemBase.create(name="Dialog System", group=group, plane_type=plane_type)
+        agregates = [AgregateBase.create(name=f"D{i}", system=system) for i in range(2)]
+        osob = OsobBase.create(name="Dialog Osob", plane_type=plane_type)
+
+        dialog = OsobFeatureDialog(osob)
+        qtbot.addWidget(dialog)
+        dialog.system_remove_model.set_checked(system.id, True)
+        assert dialog.block_remove_model.checked_ids() == {agregate.id for agregate in agregates}
+
+        dialog.block_remove_model.set_checked(agregates[0].id, False)
+        assert not dialog.system_remove_model.is_checked(system.id)
+        assert dialog.block_remove_model.checked_ids() == {agregates[1].id}
+
+        dialog.save_item()
+        assert not OsobSystemRemoveBase.select().exists()
+        assert [link.agregate_id for link in OsobAgregateRemoveBase.select()] == [agregates[1].id]
+
+    def test_large_system_toggle_batched(self, qtbot) -> None:
+        """Test selecting a 200-unit system notifies each side once."""
+        plane_type = TypeBase.create(name="Large Type")
+        group = GroupBase.create(name="Large Group", plane_type=plane_type)
+        system = SystemBase.create(name="Large System", group=group, plane_type=plane_type)
+        AgregateBase.insert_many([{"name": f"L{i}", "system": system.id} for i in range(200)]).execute()
+        osob = OsobBase.create(name="Large Osob", plane_type=plane_type)
+
+        dialog = OsobFeatureDialog(osob)
+        qtbot.addWidget(dialog)
+        batches = []
+        dialog.block_add_model.checked_changed.connect(lambda block_ids, checked: batches.append(len(block_ids)))
+
+        dialog.system_add_model.set_checked(system.id, True)
+
+        assert batches == [200]
+        assert len(dialog.block_add_model.checked_ids()) == 200
@@ -0,0 +1,173 @@
+"""
+Tests for database connection layer.
+"""
+import pytest
+from peewee import OperationalError
+
+from app.collation import NATURAL, RUSSIAN, prefix_range
+from app.config import DATABASE_PRAGMAS
+from app.database import (
+    IASDatabase,
+    check_connection,
+    connection_mismatches,
+    explain_query_plan,
+    get_database,
+    is_busy_error,
+    normalize_sql,
+    record_queries,
+)
+from data.models import AgregateBase, GroupBase, PlaneBase, PodrazdBase, SystemBase, TypeBase
+
+
+class TestConnection:
+    """Tests for connection tuning."""
+
+    def test_shared_instance(self):
+        """Test get_database returns one shared instance."""
+        assert get_database() is get_database()
+
+    def test_pragmas_applied(self, tmp_path):
+        """Test configured PRAGMAs are effective on a file database."""
+        database = IASDatabase(str(tmp_path / "test.db"), pragmas=list(DATABASE_PRAGMAS.items()))
+        effective = check_connection(database)
+        database.close()
+
+        assert effective.keys() == DATABASE_PRAGMAS.keys()
+        assert connection_mismatches(effective) == {}
+
+    def test_mismatch_reported(self):
+        """Test differing PRAGMA is reported."""
+        effective = dict(DATABASE_PRAGMAS, journal_mode="truncate")
+
+        assert connection_mismatches(effective) == {
+            "journal_mode": (DATABASE_PRAGMAS["journal_mode"], "truncate")
+        }
+
+    def test_network_safe_defaults(self):
+        """Test WAL and mmap are opt-in (unsafe on network shares)."""
+        assert DATABASE_PRAGMAS["journal_mode"] == "delete"
+        assert DATABASE_PRAGMAS["mmap_size"] == 0
+
+
+class TestBusyRetry:
+    """Tests for SQLITE_BUSY retry."""
+
+    def test_is_busy_error(self):
+        """Test busy errors are recognized."""
+        assert is_busy_error(OperationalError("database is locked"))
+        assert not is_busy_error(OperationalError("no such table: foo"))
+
+    def test_retries_busy_statement(self, monkeypatch):
+        """Test statement is retried until it succeeds."""
+        database = IASDatabase(":memory:", busy_retries=3, busy_backoff=0)
+        calls = []
+        original = database.cursor
+
+        def flaky_cursor(*args, **kwargs):
+            calls.append(1)
+            if len(calls) < 3:
+                raise OperationalError("database is locked")
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(database, "cursor", flaky_cursor)
+
+        assert database.execute_sql("SELECT 1").fetchone() == (1,)
+        assert len(calls) == 3
+
+    def test_gives_up_after_retries(self, monkeypatch):
+        """Test busy error is raised once retries are exhausted."""
+        database = IASDatabase(":memory:", busy_retries=2, busy_backoff=0)
+
+        def locked_cursor(*args, **kwargs):
+            raise OperationalError("database is locked")
+
+        monkeypatch.setattr(database, "cursor", locked_cursor)
+
+        with pytest.raises(OperationalError):
+            database.execute_sql("SELECT 1")
+
+    def test_transaction_retried(self):
+        """Test model writes through run_in_transaction retry the whole transaction."""
+        calls = []
+
+        def write():
+            calls.append(1)
+            TypeBase.create(name=f"Type {len(calls)}")
+            if len(calls) < 2:
+                raise OperationalError("database is locked")
+
+        database = TypeBase._meta.database
+        retries, backoff = database.busy_retries, database.busy_backoff
+        database.busy_retries, database.busy_backoff = 2, 0
+        try:
+            TypeBase.run_in_transaction(write)
+        finally:
+            database.busy_retries, database.busy_backoff = retries, backoff
+
+        assert len(calls) == 2
+        assert [t.name for t in TypeBase.select()] == ["Type 2"]
+
+
+class TestQueryRecorder:
+    """Tests for statement recording."""
+
+    def test_normalize_sql(self):
+        """Test literals and IN lists are reduced to placeholders."""
+        sql = "SELECT \"id\" FROM \"t\" WHERE (\"id\" IN (?, ?, ?)) AND \"name\" = 'it''s' LIMIT 10"
+        assert normalize_sql(sql) == "SELECT \"id\" FROM \"t\" WHERE (\"id\" IN (...)) AND \"name\" = ? LIMIT ?"
+
+    def test_lazy_foreign_keys_flagged(self, test_db):
+        """Test per-row lazy loads are grouped and flagged as repeated."""
+        plane_type = TypeBase.create(name="Recorder Type")
+        for i in range(3):
+            GroupBase.create(name=f"Recorder Group {i}", plane_type=plane_type)
+
+        with record_queries(test_db) as recorder:
+            names = [group.plane_type.name for group in GroupBase.select()]
+
+        assert names == ["Recorder Type"] * 3
+        assert recorder.count == 4
+        repeated = recorder.repeated()
+        assert len(repeated) == 1
+        assert repeated[0].count == 3
+        assert repeated[0].max_identical == 3
+        assert '"type_base"' in repeated[0].sql
+        assert not test_db.recorders
+
+
+class TestCollation:
+    """Tests for text functions and collations registered on the connection."""
+
+    def test_russian_order(self, test_db):
+        """Test names sort alphabetically regardless of case, ё with е."""
+        for name in ("ёлка", "Яблоко", "Ель", "абрикос", "ежевика", "Ёж"):
+            TypeBase.create(name=name)
+        query = TypeBase.select(TypeBase.name).order_by(TypeBase.name.collate(RUSSIAN))
+        assert [name for name, in query.tuples()] == ["абрикос", "Ёж", "ежевика", "ёлка", "Ель", "Яблоко"]
+        sql, params = query.sql()
+        assert explain_query_plan(test_db, sql, params) == ["SCAN t1 USING COVERING INDEX idx_type_base_name_ru"]
+
+    def test_natural_order(self, test_db):
+        """Test bort numbers sort by their numeric parts."""
+        plane_type = TypeBase.create(name="Ан-26")
+        podrazd = PodrazdBase.create(name="Отряд")
+        for bort in ("10", "2", "RA-100", "1", "RA-20"):
+            PlaneBase.create(plane_type=plane_type, podrazd=podrazd, bort_number=bort, zav_num=f"z{bort}")
+        query = PlaneBase.select(PlaneBase.bort_number).order_by(PlaneBase.bort_number.collate(NATURAL))
+        assert [bort for bort, in query.tuples()] == ["1", "2", "10", "RA-20", "RA-100"]
+
+    def test_casefold_prefix(self, test_db, qtbot):
+        """Test the agregate name prefix filter ignores Cyrillic case and uses the casefold index."""
+        from app.ui.widgets.tables import AgregateModel
+
+        plane_type = TypeBase.create(name="Ан-26")
+        group = GroupBase.create(name="Планер", plane_type=plane_type)
+        system = SystemBase.create(name="Топливная", group=group, plane_type=plane_type)
+        for name in ("насосная станция", "Насос", "НАСТИЛ", "Клапан"):
+            AgregateBase.create(name=name, system=system)
+
+        model = AgregateModel()
+        assert [row[1] for row in model.fetch_rows(name_prefix="НАС")] == ["Насос", "насосная станция", "НАСТИЛ"]
+        sql, params = model.query(name_prefix="нас").sql()
+        assert any("idx_agregate_base_name_casefold" in line for line in explain_query_plan(test_db, sql, params))
+        assert prefix_range("Нас") == ("нас", "нат")
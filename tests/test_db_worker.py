@@ -0,0 +1,156 @@
+"""
+Tests for background database executor.
+"""
+import threading
+
+import pytest
+from PyQt6.QtCore import QPoint
+
+from app.database import IASDatabase
+from app.services.db_worker import DbExecutor, DbTaskError
+from app.ui.widgets.tables import GroupModel, IspravnostTable
+from app.ui.widgets.tables import base_table, ispravnost_table
+from data.models import (
+    AgregateBase,
+    GroupBase,
+    OtkazAgregateBase,
+    PlaneBase,
+    PodrazdBase,
+    SystemBase,
+    TypeBase,
+)
+
+FILE_MODELS = [TypeBase, PodrazdBase, GroupBase, SystemBase, AgregateBase, PlaneBase, OtkazAgregateBase]
+
+
+def wait_idle(qtbot, executor):
+    """Wait until executor reports it is no longer busy."""
+    if executor.is_busy():
+        qtbot.waitSignal(executor.busy_changed, check_params_cb=lambda busy: not busy).wait()
+
+
+@pytest.fixture
+def executor(qtbot):
+    """Threaded executor, shut down before it is destroyed."""
+    executor = DbExecutor()
+    yield executor
+    executor.shutdown()
+    executor.deleteLater()
+
+
+@pytest.fixture
+def threaded_db(tmp_path, executor, monkeypatch):
+    """File database shared by GUI and worker threads, table models using the threaded executor."""
+    database = IASDatabase(str(tmp_path / "worker.db"), pragmas={"foreign_keys": 1})
+    monkeypatch.setattr(base_table, "get_executor", lambda: executor)
+    monkeypatch.setattr(ispravnost_table, "get_executor", lambda: executor)
+    with database.bind_ctx(FILE_MODELS):
+        database.create_tables(FILE_MODELS)
+        yield database
+        executor.shutdown()
+    database.close()
+
+
+class TestDbExecutor:
+    """Tests for DbExecutor."""
+
+    def test_runs_off_gui_thread(self, qtbot, executor):
+        """Test task runs in worker thread and result arrives in GUI thread."""
+        results = []
+
+        with qtbot.waitSignal(executor.busy_changed, check_params_cb=lambda busy: not busy):
+            executor.submit(
+                threading.get_ident,
+                on_result=lambda ident: results.append((ident, threading.get_ident())),
+            )
+
+        worker_ident, callback_ident = results[0]
+        assert worker_ident != threading.get_ident()
+        assert callback_ident == threading.get_ident()
+        assert not executor.is_busy()
+
+    def test_superseded_task_dropped(self, qtbot, executor):
+        """Test only the latest task for a key delivers its result."""
+        gate = threading.Event()
+        results = []
+
+        with qtbot.waitSignal(executor.busy_changed, check_params_cb=lambda busy: not busy):
+            executor.submit(gate.wait, 5, key="blocker")
+            executor.submit(lambda: "first", key="load", on_result=results.append)
+            executor.submit(lambda: "second", key="load", on_result=results.append)
+            gate.set()
+
+        assert results == ["second"]
+
+    def test_error_callback(self, qtbot, executor):
+        """Test exception is delivered to on_error as plain data."""
+        errors = []
+
+        def fail():
+            raise ValueError("boom")
+
+        with qtbot.waitSignal(executor.busy_changed, check_params_cb=lambda busy: not busy):
+            executor.submit(fail, on_error=errors.append)
+
+        assert isinstance(errors[0], DbTaskError)
+        assert errors[0].error_type == "ValueError"
+        assert errors[0].message == "boom"
+        assert "fail" in errors[0].details
+
+    def test_synchronous_mode(self):
+        """Test synchronous executor delivers result immediately."""
+        executor = DbExecutor()
+        executor.synchronous = True
+        results = []
+
+        executor.submit(lambda value: value * 2, 21, on_result=results.append)
+
+        assert results == [42]
+
+
+class TestAsyncTableLoad:
+    """Tests for table models loading through the worker thread."""
+
+    def test_superseded_filter_load(self, qtbot, executor, threaded_db):
+        """Test quick filter changes only apply the latest load."""
+        for type_name in ("A", "B"):
+            plane_type = TypeBase.create(name=type_name)
+            for i in range(3):
+                GroupBase.create(name=f"{type_name}{i}", plane_type=plane_type)
+
+        model = GroupModel()
+        applied = []
+        model.modelReset.connect(lambda: applied.append(model.rowCount()))
+
+        model.load_data("A")
+        model.load_data("B")
+        wait_idle(qtbot, executor)
+
+        assert not model.loading
+        assert applied == [3]
+        assert {model.index(row, 0).data() for row in range(model.rowCount())} == {"B0", "B1", "B2"}
+
+    def test_ispravnost_headers_after_load(self, qtbot, executor, threaded_db):
+        """Test group headers are painted across the row once the background load resets the model."""
+        plane_type = TypeBase.create(name="Type")
+        podrazd = PodrazdBase.create(name="Division")
+        plane = PlaneBase.create(plane_type=plane_type, podrazd=podrazd, zav_num="1", bort_number="01")
+        for name in ("Group 1", "Group 2"):
+            group = GroupBase.create(name=name, plane_type=plane_type)
+            system = SystemBase.create(name=f"{name} system", plane_type=plane_type, group=group)
+            agregate = AgregateBase.create(name=f"{name} block", system=system)
+            OtkazAgregateBase.create(agregate=agregate, plane=plane, number="1")
+
+        table = IspravnostTable(plane)
+        qtbot.addWidget(table)
+        table.resize(800, 300)
+        wait_idle(qtbot, executor)
+
+        model = table.model()
+        group_rows = [row for row in range(model.rowCount()) if model.index(row, 0).data(table.table_model.GROUP_ROLE)]
+        assert group_rows == [0, 2]
+        image = table.viewport().grab().toImage()
+        for row in group_rows:
+            assert table.columnSpan(row, 0) == 1
+            cell = table.visualRect(model.index(row, model.columnCount() - 1))
+            assert image.pixelColor(cell.topLeft() + QPoint(2, 2)) == table.table_model.GROUP_BG_COLOR
@@ -0,0 +1,163 @@
+"""Tests for the failure event log and point-in-time queries."""
+import datetime
+import time
+
+import pytest
+
+from app.services.failure_history import (
+    FailureState,
+    failure_events,
+    failures_as_of,
+    plane_statuses_as_of,
+    snapshot_if_due,
+    take_snapshot,
+)
+from app.services.fleet_status import query_plane_statuses
+from data.models import (
+    AgregateBase,
+    FailureEvent,
+    FailureSnapshot,
+    GroupBase,
+    OtkazAgregateBase,
+    PlaneBase,
+    PodrazdBase,
+    SystemBase,
+    TypeBase,
+)
+from data.models.history import backfill_history
+
+
+@pytest.fixture
+def fleet():
+    """Two aircraft of one type and two agregates."""
+    plane_type = TypeBase.create(name="Ан-26")
+    podrazd = PodrazdBase.create(name="Отряд")
+    group = GroupBase.create(name="Планер", plane_type=plane_type)
+    system = SystemBase.create(name="Топливная система", group=group, plane_type=plane_type)
+    pump = AgregateBase.create(name="Насос", system=system)
+    valve = AgregateBase.create(name="Кран", system=system)
+    first = PlaneBase.create(plane_type=plane_type, podrazd=podrazd, bort_number="01", zav_num="Z1")
+    second = PlaneBase.create(plane_type=plane_type, podrazd=podrazd, bort_number="02", zav_num="Z2")
+    return first, second, pump, valve
+
+
+def moment() -> datetime.datetime:
+    """Get a moment strictly between the events logged before and after it."""
+    # Events are stamped with millisecond resolution
+    time.sleep(0.003)
+    now = datetime.datetime.now()
+    time.sleep(0.003)
+    return now
+
+
+def kinds(**filters) -> list[tuple[str, int]]:
+    """Get (kind, plane id) of logged events, oldest first."""
+    return [(event.kind, event.plane_id) for event in failure_events(**filters)]
+
+
+class TestEventLog:
+    """Tests for the history triggers."""
+
+    def test_lifecycle(self, fleet) -> None:
+        """Test opening, changing, removing and deleting a failure are logged."""
+        first, _second, pump, valve = fleet
+        failure = OtkazAgregateBase.create(plane=first, agregate=pump, number="1")
+        failure.save()
+        failure.number = "2"
+        failure.save()
+        failure.removed = True
+        failure.save()
+        failure.agregate = valve
+        failure.save()
+        failure.delete_instance()
+
+        assert kinds(plane_id=first.id) == [
+            ("opened", first.id), ("changed", first.id), ("removed", first.id), ("changed", first.id),
+            ("closed", first.id),
+        ]
+        assert kinds(agregate_id=pump.id) == [("opened", first.id), ("changed", first.id), ("removed", first.id)]
+        closed = failure_events(plane_id=first.id)[-1]
+        assert (closed.otkaz_id, closed.agregate_id, closed.number, closed.removed) == (failure.id, valve.id, "2", True)
+
+    def test_moved_and_cascaded(self, fleet) -> None:
+        """Test a moved failure closes on one aircraft and opens on the other; deleting that aircraft closes it."""
+        first, second, pump, _valve = fleet
+        failure = OtkazAgregateBase.create(plane=first, agregate=pump, number="1")
+        failure.plane = second
+        failure.save()
+        assert kinds(plane_id=first.id) == [("opened", first.id), ("closed", first.id)]
+
+        second.delete_instance(recursive=True)
+        assert kinds(plane_id=second.id) == [("opened", second.id), ("closed", second.id)]
+
+    def test_backfill(self, fleet) -> None:
+        """Test backfill opens unlogged failures at their creation time, once."""
+        first, _second, pump, _valve = fleet
+        failure = OtkazAgregateBase.create(plane=first, agregate=pump, number="1")
+        FailureEvent.delete().execute()
+        backfill_history()
+        backfill_history()
+        assert [(event.kind, event.otkaz_id, event.created_at) for event in failure_events()] == [
+            ("opened", failure.id, failure.created_at)
+        ]
+
+
+class TestAsOf:
+    """Tests for failures_as_of and plane_statuses_as_of."""
+
+    def test_timeline(self, fleet) -> None:
+        """Test states between events, with and without a snapshot in between."""
+        first, second, pump, valve = fleet
+        before = moment()
+        kept = OtkazAgregateBase.create(plane=first, agregate=pump, number="1")
+        gone = OtkazAgregateBase.create(plane=second, agregate=valve, number="2")
+        opened = moment()
+        kept.removed = True
+        kept.save()
+        changed = moment()
+        take_snapshot()
+        gone.delete_instance()
+        after = moment()
+
+        expected = {
+            before: [],
+            opened: [
+                FailureState(kept.id, first.id, pump.id, "1", "", False),
+                FailureState(gone.id, second.id, valve.id, "2", "", False),
+            ],
+            changed: [
+                FailureState(kept.id, first.id, pump.id, "1", "", True),
+                FailureState(gone.id, second.id, valve.id, "2", "", False),
+            ],
+            after: [FailureState(kept.id, first.id, pump.id, "1", "", True)],
+        }
+        for snapshots in (True, False):
+            if not snapshots:
+                FailureSnapshot.delete().execute()
+            for at, states in expected.items():
+                assert failures_as_of(at) == states
+                assert failures_as_of(at, second.id) == [state for state in states if state.plane_id == second.id]
+
+    def test_plane_statuses(self, fleet) -> None:
+        """Test counts as of now match the live fleet status."""
+        first, second, pump, valve = fleet
+        OtkazAgregateBase.create(plane=first, agregate=pump, number="1", removed=True)
+        OtkazAgregateBase.create(plane=first, agregate=valve, number="2")
+        OtkazAgregateBase.create(plane=second, agregate=pump, number="3")
+        take_snapshot()
+        OtkazAgregateBase.create(plane=second, agregate=valve, number="4", removed=True)
+        assert plane_statuses_as_of(moment()) == query_plane_statuses()
+
+
+class TestSnapshots:
+    """Tests for snapshot_if_due."""
+
+    def test_interval(self, fleet) -> None:
+        """Test a snapshot is taken once enough events were logged since the last one."""
+        first, _second, pump, _valve = fleet
+        for number in range(3):
+            OtkazAgregateBase.create(plane=first, agregate=pump, number=str(number))
+        assert snapshot_if_due(4) is None
+        snapshot = snapshot_if_due(3)
+        assert snapshot is not None and snapshot.items.count() == 3
+        assert snapshot_if_due(1) is None
@@ -0,0 +1,60 @@
+"""Tests for fleet status service."""
+from app.services.fleet_status import FleetStatusService, PlaneStatus, query_plane_statuses
+from data.models.aircraft import AgregateBase, GroupBase, PlaneBase, PodrazdBase, SystemBase, TypeBase
+from data.models.failures import OtkazAgregateBase
+
+
+def create_fleet() -> tuple[PlaneBase, PlaneBase, AgregateBase]:
+    """Create two aircraft in one division with one agregate."""
+    plane_type = TypeBase.create(name="Fleet Type")
+    podrazd = PodrazdBase.create(name="Fleet Podrazd")
+    group = GroupBase.create(name="Fleet Group", plane_type=plane_type)
+    system = SystemBase.create(name="Fleet System", group=group, plane_type=plane_type)
+    agregate = AgregateBase.create(name="Fleet Agregate", system=system)
+    plane1 = PlaneBase.create(plane_type=plane_type, podrazd=podrazd, zav_num="F001", bort_number="01")
+    plane2 = PlaneBase.create(plane_type=plane_type, podrazd=podrazd, zav_num="F002", bort_number="02")
+    return plane1, plane2, agregate
+
+
+class TestQueryPlaneStatuses:
+    """Tests for grouped status query."""
+
+    def test_counts(self) -> None:
+        """Test failure and removed counts per aircraft."""
+        plane1, plane2, agregate = create_fleet()
+        OtkazAgregateBase.create(agregate=agregate, plane=plane1, number="1", removed=True)
+        OtkazAgregateBase.create(agregate=agregate, plane=plane1, number="2", removed=False)
+
+        statuses = query_plane_statuses()
+
+        assert statuses[plane1.id] == PlaneStatus(failures=2, removed=1)
+        assert plane2.id not in statuses
+
+    def test_filter_by_plane(self) -> None:
+        """Test restricting query to given aircraft."""
+        plane1, plane2, agregate = create_fleet()
+        OtkazAgregateBase.create(agregate=agregate, plane=plane1, number="1")
+        OtkazAgregateBase.create(agregate=agregate, plane=plane2, number="2")
+
+        statuses = query_plane_statuses([plane2.id])
+
+        assert list(statuses) == [plane2.id]
+
+
+class TestFleetStatusService:
+    """Tests for FleetStatusService."""
+
+    def test_load_and_refresh(self) -> None:
+        """Test loading fleet and refreshing a single aircraft."""
+        plane1, plane2, agregate = create_fleet()
+        fleet = FleetStatusService()
+        fleet.load()
+
+        assert [p.id for p in fleet.planes_for(plane1.podrazd_id)] == [plane1.id, plane2.id]
+        assert not fleet.status(plane1.id).has_failures
+
+        OtkazAgregateBase.create(agregate=agregate, plane=plane1, number="1")
+
+        assert fleet.refresh_plane(plane1.id).has_failures
+        assert fleet.status(plane1.id).failures == 1
+        assert not fleet.status(plane2.id).has_failures
@@ -4,10 +4,13 @@ from PyQt6.QtCore import QModelIndex, Qt
 
 from data.models.aircraft import TypeBase, PodrazdBase, GroupBase, PlaneBase
 from app.ui.widgets.tables import (
+    AgregateModel,
+    OsobModel,
     PlanesTypesModel,
     PodrazdModel,
     GroupModel,
     PlanesModel,
+    SystemModel,
 )
 
 
@@ -75,6 +78,32 @@ class TestGroupModel:
         qtbot.waitUntil(lambda: model.rowCount() >= 1, timeout=1000)
         assert model.rowCount() >= 1
 
+    def test_upsert_and_remove_row(self, qtbot) -> None:
+        """Test single row updates respect the filter and touch only that row."""
+        type1 = TypeBase.create(name="Type A")
+        type2 = TypeBase.create(name="Type B")
+        first = GroupBase.create(name="Group A", plane_type=type1)
+        model = GroupModel()
+        model.load_data("Type A")
+        events = []
+        model.modelReset.connect(lambda: events.append("reset"))
+        model.rowsInserted.connect(lambda parent, top, bottom: events.append(("inserted", top, bottom)))
+        model.dataChanged.connect(lambda top, bottom: events.append(("changed", top.row(), bottom.row())))
+        model.rowsRemoved.connect(lambda parent, top, bottom: events.append(("removed", top, bottom)))
+
+        second = GroupBase.create(name="Group A2", plane_type=type1)
+        model.upsert_row(second.id)
+        first.name = "Group A1"
+        first.save()
+        model.upsert_row(first.id)
+        second.plane_type = type2
+        second.save()
+        model.upsert_row(second.id)
+        model.remove_row(first.id)
+
+        assert events == [("inserted", 1, 1), ("changed", 0, 0), ("removed", 1, 1), ("removed", 0, 0)]
+        assert model.rowCount() == 0
+
 
 class TestPlanesModel:
     """Tests for PlanesModel."""
@@ -104,3 +133,210 @@ class TestPlanesModel:
 
         qtbot.waitUntil(lambda: model.rowCount() == 1, timeout=1000)
         assert model.rowCount() == 1
+
+
+class TestColumnSpec:
+    """Tests for tables built from COLUMNS field paths."""
+
+    def test_single_query_per_load(self, assert_max_queries, qtbot) -> None:
+        """Test every settings table loads all its rows with one joined select."""
+        from data.models import AgregateBase, OsobBase, SystemBase
+
+        plane_type = TypeBase.create(name="Spec Type")
+        podrazd = PodrazdBase.create(name="Spec Podrazd")
+        group = GroupBase.create(name="Spec Group", plane_type=plane_type)
+        system = SystemBase.create(name="Spec System", group=group, plane_type=plane_type)
+        for i in range(3):
+            AgregateBase.create(name=f"Spec {i}", system=system)
+            PlaneBase.create(plane_type=plane_type, podrazd=podrazd, zav_num=f"S{i}", bort_number=f"S{i}")
+            OsobBase.create(name=f"Spec Osob {i}", plane_type=plane_type)
+
+        for model_class in (
+            AgregateModel, GroupModel, OsobModel, PlanesModel, PlanesTypesModel, PodrazdModel, SystemModel
+        ):
+            with assert_max_queries(1):
+                model = model_class()
+            assert model.rowCount() >= 1, model_class.__name__
+
+        model = AgregateModel()
+        assert [model.index(0, column).data() for column in range(4)] == [
+            "Spec 0", "Spec System", "Spec Group", "Spec Type"
+        ]
+
+
+class TestFleetGridModel:
+    """Tests for FleetGridModel."""
+
+    def test_grouped_by_division(self, qtbot) -> None:
+        """Test aircraft are children of their division."""
+        from app.ui.widgets.fleet_grid import FleetGridModel
+
+        plane_type = TypeBase.create(name="Grid Type")
+        podrazd1 = PodrazdBase.create(name="Grid Podrazd 1")
+        podrazd2 = PodrazdBase.create(name="Grid Podrazd 2")
+        PlaneBase.create(plane_type=plane_type, podrazd=podrazd1, zav_num="G01", bort_number="01")
+        PlaneBase.create(plane_type=plane_type, podrazd=podrazd2, zav_num="G02", bort_number="02")
+        plane = PlaneBase.create(plane_type=plane_type, podrazd=podrazd2, zav_num="G03", bort_number="03")
+
+        model = FleetGridModel()
+
+        assert model.rowCount() == 2
+        assert model.rowCount(model.podrazd_index(podrazd2.id)) == 2
+        index = model.plane_index(plane.id)
+        assert index.data() == "03"
+        assert index.parent().data() == "Grid Podrazd 2"
+        assert not index.data(FleetGridModel.STATUS_ROLE).has_failures
+
+    def test_sync_applies_diff(self, qtbot) -> None:
+        """Test sync relabels, moves and removes rows without a reset."""
+        from app.ui.widgets.fleet_grid import FleetGridModel
+
+        plane_type = TypeBase.create(name="Sync Type")
+        podrazd1 = PodrazdBase.create(name="Sync Podrazd 1")
+        podrazd2 = PodrazdBase.create(name="Sync Podrazd 2")
+        plane1 = PlaneBase.create(plane_type=plane_type, podrazd=podrazd1, zav_num="S01", bort_number="01")
+        plane2 = PlaneBase.create(plane_type=plane_type, podrazd=podrazd1, zav_num="S02", bort_number="02")
+
+        model = FleetGridModel()
+        resets: list[bool] = []
+        model.modelReset.connect(lambda: resets.append(True))
+
+        plane1.bort_number = "10"
+        plane1.save()
+        plane2.podrazd = podrazd2
+        plane2.save()
+        model.sync()
+
+        assert not resets
+        assert model.plane_index(plane1.id).data() == "10"
+        assert model.plane_index(plane2.id).parent().data() == "Sync Podrazd 2"
+        assert model.rowCount(model.podrazd_index(podrazd1.id)) == 1
+
+        plane2.delete_instance()
+        model.sync()
+
+        assert not model.plane_index(plane2.id).isValid()
+        assert model.rowCount(model.podrazd_index(podrazd2.id)) == 0
+
+
+class TestIspravnostTableModel:
+    """Tests for IspravnostTableModel paging."""
+
+    def test_paged_loading(self, qtbot, monkeypatch) -> None:
+        """Test pages are appended on demand without repeating group headers."""
+        from app.ui.widgets.tables import IspravnostTableModel
+        from data.models import AgregateBase, OtkazAgregateBase, SystemBase
+
+        monkeypatch.setattr(IspravnostTableModel, "PAGE_SIZE", 2)
+        plane_type = TypeBase.create(name="Page Type")
+        podrazd = PodrazdBase.create(name="Page Podrazd")
+        plane = PlaneBase.create(plane_type=plane_type, podrazd=podrazd, zav_num="P01", bort_number="01")
+        for group_name, count in (("Page Group 1", 3), ("Page Group 2", 2)):
+            group = GroupBase.create(name=group_name, plane_type=plane_type)
+            system = SystemBase.create(name=f"{group_name} system", group=group, plane_type=plane_type)
+            agregate = AgregateBase.create(name=f"{group_name} block", system=system)
+            for number in range(count):
+                OtkazAgregateBase.create(agregate=agregate, plane=plane, number=str(number))
+
+        model = IspravnostTableModel(plane)
+        inserted = []
+        model.rowsInserted.connect(lambda parent, first, last: inserted.append((first, last)))
+
+        assert model.rowCount() == 3
+        assert model.canFetchMore()
+        while model.canFetchMore():
+            model.fetchMore()
+
+        row_types = [model.get_row_type(row) for row in range(model.rowCount())]
+        assert row_types == ["group", "agregate", "agregate", "agregate", "group", "agregate", "agregate"]
+        assert inserted == [(3, 5), (6, 6)]
+        assert [model.index(row, 2).data() for row in (1, 2, 3)] == ["0", "1", "2"]
+
+    def test_upsert_and_remove_row(self, qtbot) -> None:
+        """Test a failure is placed in its group, opening and closing the group header."""
+        from app.ui.widgets.tables import IspravnostTableModel
+        from data.models import AgregateBase, OtkazAgregateBase, SystemBase
+
+        plane_type = TypeBase.create(name="Upsert Type")
+        podrazd = PodrazdBase.create(name="Upsert Podrazd")
+        plane = PlaneBase.create(plane_type=plane_type, podrazd=podrazd, zav_num="U01", bort_number="01")
+        agregates = []
+        for group_name in ("Upsert Group 1", "Upsert Group 2"):
+            group = GroupBase.create(name=group_name, plane_type=plane_type)
+            system = SystemBase.create(name=f"{group_name} system", group=group, plane_type=plane_type)
+            agregates.append(AgregateBase.create(name=f"{group_name} block", system=system))
+        OtkazAgregateBase.create(agregate=agregates[0], plane=plane, number="1")
+
+        model = IspravnostTableModel(plane)
+        events = []
+        model.modelReset.connect(lambda: events.append("reset"))
+        model.rowsInserted.connect(lambda parent, top, bottom: events.append(("inserted", top, bottom)))
+        model.dataChanged.connect(lambda top, bottom: events.append(("changed", top.row(), bottom.row())))
+        model.rowsRemoved.connect(lambda parent, top, bottom: events.append(("removed", top, bottom)))
+
+        otkaz = OtkazAgregateBase.create(agregate=agregates[1], plane=plane, number="2")
+        model.upsert_row(otkaz.id)
+        assert [model.get_row_type(row) for row in range(model.rowCount())] == ["group", "agregate"] * 2
+        otkaz.removed = True
+        otkaz.save()
+        model.upsert_row(otkaz.id)
+        assert model.index(3, 3).data() == "Снят"
+        otkaz.agregate = agregates[0]
+        otkaz.save()
+        model.upsert_row(otkaz.id)
+        assert model.index(2, 0).data(Qt.ItemDataRole.UserRole) == otkaz.id
+        model.remove_row(otkaz.id)
+
+        assert events == [
+            ("inserted", 2, 3),
+            ("changed", 3, 3),
+            ("removed", 2, 3),
+            ("inserted", 2, 2),
+            ("removed", 2, 2),
+        ]
+        assert model.rowCount() == 2
+
+    def test_group_filter(self, qtbot, monkeypatch) -> None:
+        """Test the group filter lists the plane type's groups and loads no more than needed."""
+        from app.ui.dialogs.plane_ispravnost import PlaneIspravnost
+        from app.ui.widgets.tables import IspravnostTableModel
+        from data.models import AgregateBase, OtkazAgregateBase, SystemBase
+
+        monkeypatch.setattr(IspravnostTableModel, "PAGE_SIZE", 2)
+        plane_type = TypeBase.create(name="Filter Type")
+        GroupBase.create(name="Other Type Group", plane_type=TypeBase.create(name="Other Type"))
+        podrazd = PodrazdBase.create(name="Filter Podrazd")
+        plane = PlaneBase.create(plane_type=plane_type, podrazd=podrazd, zav_num="F01", bort_number="01")
+        groups = []
+        for group_name, count in (("Filter Group 1", 3), ("Filter Group 2", 2), ("Filter Group 3", 2)):
+            group = GroupBase.create(name=group_name, plane_type=plane_type)
+            system = SystemBase.create(name=f"{group_name} system", group=group, plane_type=plane_type)
+            agregate = AgregateBase.create(name=f"{group_name} block", system=system)
+            for number in range(count):
+                OtkazAgregateBase.create(agregate=agregate, plane=plane, number=str(number))
+            groups.append(group)
+
+        dialog = PlaneIspravnost(plane)
+        qtbot.addWidget(dialog)
+        combo = dialog.filter_combo
+        assert [combo.itemText(i) for i in range(combo.count())] == [
+            "Все группы", "Filter Group 1", "Filter Group 2", "Filter Group 3"
+        ]
+
+        fetched = []
+        fetch_rows = IspravnostTableModel.fetch_rows
+
+        def recording_fetch_rows(*args, **kwargs):
+            fetched.append(kwargs)
+            return fetch_rows(*args, **kwargs)
+
+        monkeypatch.setattr(IspravnostTableModel, "fetch_rows", staticmethod(recording_fetch_rows))
+        combo.setCurrentIndex(2)
+        proxy = dialog.table_view.model()
+        assert [proxy.index(row, 2).data() for row in range(proxy.rowCount())] == ["Filter Group 2", "0", "1"]
+        assert dialog.table_view.table_model.canFetchMore()
+
+        fetched.clear()
+        combo.setCurrentIndex(1)
+        assert proxy.rowCount() == 4
+        assert fetched == []
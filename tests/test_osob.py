@@ -0,0 +1,158 @@
+"""Tests for aircraft features (osob) resolvers."""
+from data.data import get_agregates_for_plane, get_systems_for_plane
+from data.models.aircraft import AgregateBase, GroupBase, PlaneBase, PodrazdBase, SystemBase, TypeBase
+from data.models.osob import (
+    OsobAgregateAddBase,
+    OsobAgregateRemoveBase,
+    OsobBase,
+    OsobPlaneBase,
+    OsobSystemAddBase,
+    OsobSystemRemoveBase,
+    get_available_agregates_for_plane,
+    get_available_systems_for_plane,
+    get_effective_agregates,
+    get_effective_systems,
+    get_osob_link_ids,
+    get_planes_with_agregate,
+    save_osob_links,
+)
+from data.models.effective import PlaneEffectiveAgregate, rebuild_effective_agregates
+
+
+class TestEffectiveConfiguration:
+    """Tests for effective systems/agregates resolution."""
+
+    def setup_method(self) -> None:
+        """Create a type catalog, a second type and a feature."""
+        self.plane_type = TypeBase.create(name="Osob Type")
+        other_type = TypeBase.create(name="Other Type")
+        podrazd = PodrazdBase.create(name="Osob Podrazd")
+        self.group = GroupBase.create(name="Osob Group", plane_type=self.plane_type)
+        other_group = GroupBase.create(name="Other Group", plane_type=other_type)
+        self.sys_a = SystemBase.create(name="System A", group=self.group, plane_type=self.plane_type)
+        self.sys_b = SystemBase.create(name="System B", group=self.group, plane_type=self.plane_type)
+        self.sys_x = SystemBase.create(name="System X", group=other_group, plane_type=other_type)
+        self.agr_a1 = AgregateBase.create(name="A1", system=self.sys_a)
+        self.agr_a2 = AgregateBase.create(name="A2", system=self.sys_a)
+        self.agr_x1 = AgregateBase.create(name="X1", system=self.sys_x)
+        self.plane = PlaneBase.create(plane_type=self.plane_type, podrazd=podrazd, zav_num="O1", bort_number="01")
+        self.plain = PlaneBase.create(plane_type=self.plane_type, podrazd=podrazd, zav_num="O2", bort_number="02")
+
+        self.osob = osob = OsobBase.create(name="Modernization", plane_type=self.plane_type)
+        OsobPlaneBase.create(osob=osob, plane=self.plane)
+        OsobSystemRemoveBase.create(osob=osob, system=self.sys_b)
+        OsobSystemAddBase.create(osob=osob, system=self.sys_x)
+        OsobAgregateRemoveBase.create(osob=osob, agregate=self.agr_a2)
+        OsobAgregateAddBase.create(osob=osob, agregate=self.agr_x1)
+
+    def test_systems(self) -> None:
+        """Test removals and additions are applied only to the feature's aircraft."""
+        assert get_available_systems_for_plane(self.plane) == [self.sys_a, self.sys_x]
+        assert get_available_systems_for_plane(self.plain) == [self.sys_a, self.sys_b]
+
+    def test_systems_group_filter(self) -> None:
+        """Test group filter applies to additions too."""
+        assert get_available_systems_for_plane(self.plane, self.group) == [self.sys_a]
+
+    def test_agregates(self) -> None:
+        """Test agregate resolution with and without system filter."""
+        assert get_available_agregates_for_plane(self.plane) == [self.agr_a1, self.agr_x1]
+        assert get_available_agregates_for_plane(self.plane, self.sys_x) == [self.agr_x1]
+        assert get_effective_agregates([self.plane], group=self.group)[self.plane.id] == [self.agr_a1]
+
+    def test_bulk(self) -> None:
+        """Test bulk variant resolves every requested aircraft."""
+        result = get_effective_systems([self.plane, self.plain.id])
+        assert set(result) == {self.plane.id, self.plain.id}
+        assert result[self.plain.id] == [self.sys_a, self.sys_b]
+
+    def test_legacy_entry_points(self) -> None:
+        """Test data.data helpers delegate to the resolver."""
+        assert get_systems_for_plane(self.plane, self.group) == [self.sys_a]
+        assert get_agregates_for_plane(self.plane) == [self.agr_a1, self.agr_x1]
+
+
+class TestPlaneEffectiveAgregate:
+    """Tests for trigger-maintained effective agregate table."""
+
+    setup_method = TestEffectiveConfiguration.setup_method
+
+    @staticmethod
+    def pairs() -> set[tuple[int, int]]:
+        """Get current table contents."""
+        return set(PlaneEffectiveAgregate.select(PlaneEffectiveAgregate.plane, PlaneEffectiveAgregate.agregate).tuples())
+
+    def test_matches_rebuild(self) -> None:
+        """Test incremental maintenance equals a full rebuild."""
+        incremental = self.pairs()
+        rebuild_effective_agregates()
+        assert self.pairs() == incremental
+        assert (self.plane.id, self.agr_x1.id) in incremental
+        assert (self.plane.id, self.agr_a2.id) not in incremental
+
+    def test_feature_unassigned(self) -> None:
+        """Test removing the feature from aircraft restores the type catalog."""
+        OsobPlaneBase.delete().where(OsobPlaneBase.plane == self.plane).execute()
+        assert get_available_agregates_for_plane(self.plane) == [self.agr_a1, self.agr_a2]
+
+    def test_new_agregate(self) -> None:
+        """Test a new catalog agregate appears on every aircraft of the type."""
+        agregate = AgregateBase.create(name="A3", system=self.sys_a)
+        assert get_planes_with_agregate(agregate) == [self.plane, self.plain]
+
+    def test_link_removed(self) -> None:
+        """Test dropping a feature agregate link updates only that agregate."""
+        OsobAgregateRemoveBase.delete().where(OsobAgregateRemoveBase.osob == self.osob).execute()
+        assert get_planes_with_agregate(self.agr_a2) == [self.plane, self.plain]
+        assert get_planes_with_agregate(self.agr_a1) == [self.plane, self.plain]
+
+    def test_plane_deleted(self) -> None:
+        """Test deleting aircraft drops its rows."""
+        self.plane.delete_instance(recursive=True)
+        assert get_planes_with_agregate(self.agr_a1) == [self.plain]
+
+    def test_system_links_without_agregate_links(self) -> None:
+        """Test system removal/addition applies to all its agregates without per-agregate links."""
+        agr_b1 = AgregateBase.create(name="B1", system=self.sys_b)
+        agr_x2 = AgregateBase.create(name="X2", system=self.sys_x)
+
+        assert get_planes_with_agregate(agr_b1) == [self.plain]
+        assert get_planes_with_agregate(agr_x2) == [self.plane]
+
+        OsobSystemRemoveBase.delete().where(OsobSystemRemoveBase.osob == self.osob).execute()
+        OsobSystemAddBase.delete().where(OsobSystemAddBase.osob == self.osob).execute()
+        assert get_planes_with_agregate(agr_b1) == [self.plane, self.plain]
+        assert get_planes_with_agregate(agr_x2) == []
+
+        incremental = self.pairs()
+        rebuild_effective_agregates()
+        assert self.pairs() == incremental
+
+
+class TestSaveOsobLinks:
+    """Tests for diff-based feature link persistence."""
+
+    def test_diff_applied(self, test_db) -> None:
+        """Test only added and removed links are written."""
+        plane_type = TypeBase.create(name="Links Type")
+        group = GroupBase.create(name="Links Group", plane_type=plane_type)
+        systems = [SystemBase.create(name=f"Links {i}", group=group, plane_type=plane_type) for i in range(4)]
+        osob = OsobBase.create(name="Links Osob", plane_type=plane_type)
+        ids = [system.id for system in systems]
+        save_osob_links(osob, OsobSystemRemoveBase, ids[:3])
+
+        statements = []
+        execute_sql = test_db.execute_sql
+        test_db.execute_sql = lambda sql, params=None, *args, **kwargs: (
+            statements.append(sql) or execute_sql(sql, params, *args, **kwargs)
+        )
+        try:
+            with test_db.atomic():
+                added, removed = save_osob_links(osob, OsobSystemRemoveBase, ids[1:])
+        finally:
+            del test_db.execute_sql
+
+        assert (added, removed) == ({ids[3]}, {ids[0]})
+        assert get_osob_link_ids(osob, OsobSystemRemoveBase) == set(ids[1:])
+        writes = [sql for sql in statements if sql.startswith(("INSERT", "DELETE"))]
+        assert len(writes) == 2
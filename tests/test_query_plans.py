@@ -0,0 +1,249 @@
+"""Query plan checks: hot queries must use indexes on the migrated schema."""
+import datetime
+import runpy
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+from peewee import SqliteDatabase
+
+from app.config import MIGRATIONS_DIR
+from app.database import IASDatabase, explain_query_plan, find_full_scans, get_router
+from data.models import (
+    AgregateBase,
+    FailureEvent,
+    FailureSnapshot,
+    FailureSnapshotItem,
+    GroupBase,
+    OsobAgregateAddBase,
+    OsobAgregateRemoveBase,
+    OsobBase,
+    OsobPlaneBase,
+    OsobSystemAddBase,
+    OsobSystemRemoveBase,
+    OtkazAgregateBase,
+    PlaneBase,
+    PlaneEffectiveAgregate,
+    PodrazdBase,
+    SystemBase,
+    TypeBase,
+)
+from data.models.osob import (
+    get_available_agregates_for_plane,
+    get_available_systems_for_plane,
+    get_effective_agregates,
+    get_effective_systems,
+    get_planes_with_agregate,
+)
+from app.services.fleet_status import query_plane_statuses
+
+MODELS = [
+    TypeBase,
+    PodrazdBase,
+    GroupBase,
+    SystemBase,
+    AgregateBase,
+    PlaneBase,
+    OsobBase,
+    OsobPlaneBase,
+    OsobSystemAddBase,
+    OsobSystemRemoveBase,
+    OsobAgregateAddBase,
+    OsobAgregateRemoveBase,
+    OtkazAgregateBase,
+    PlaneEffectiveAgregate,
+    FailureEvent,
+    FailureSnapshot,
+    FailureSnapshotItem,
+]
+
+
+@pytest.fixture
+def migrated_db(tmp_path):
+    """Database built by running all migrations, with models bound to it."""
+    database = IASDatabase(str(tmp_path / "plans.db"), pragmas={"foreign_keys": 1})
+    get_router(database).run()
+    with database.bind_ctx(MODELS):
+        yield database
+    database.close()
+
+
+@pytest.fixture
+def sample(migrated_db):
+    """Minimal fleet with a feature and a failure."""
+    plane_type = TypeBase.create(name="Plan Type")
+    podrazd = PodrazdBase.create(name="Plan Podrazd")
+    group = GroupBase.create(name="Plan Group", plane_type=plane_type)
+    system = SystemBase.create(name="Plan System", group=group, plane_type=plane_type)
+    agregate = AgregateBase.create(name="Plan Agregate", system=system)
+    plane = PlaneBase.create(plane_type=plane_type, podrazd=podrazd, zav_num="P1", bort_number="01")
+    osob = OsobBase.create(name="Plan Osob", plane_type=plane_type)
+    OsobPlaneBase.create(osob=osob, plane=plane)
+    OsobAgregateRemoveBase.create(osob=osob, agregate=agregate)
+    OtkazAgregateBase.create(agregate=agregate, plane=plane, number="1")
+    return {"plane": plane, "group": group, "system": system, "agregate": agregate}
+
+
+def capture_selects(database: SqliteDatabase, action: Callable[[], Any]) -> list[tuple[str, Any]]:
+    """Run action and return the SELECT statements it executed."""
+    statements: list[tuple[str, Any]] = []
+    execute_sql = database.execute_sql
+
+    def recording_execute_sql(sql: str, params: Any = None, *args: Any, **kwargs: Any) -> Any:
+        if sql.lstrip().upper().startswith("SELECT"):
+            statements.append((sql, params))
+        return execute_sql(sql, params, *args, **kwargs)
+
+    database.execute_sql = recording_execute_sql  # type: ignore[method-assign]
+    try:
+        action()
+    finally:
+        del database.execute_sql
+    return statements
+
+
+def assert_indexed(database: SqliteDatabase, action: Callable[[], Any]) -> None:
+    """Fail if any SELECT executed by action falls back to a full table scan."""
+    statements = capture_selects(database, action)
+    assert statements
+    for sql, params in statements:
+        plan = explain_query_plan(database, sql, params)
+        assert not find_full_scans(plan), f"Full table scan in {sql!r}: {plan}"
+
+
+def assert_joins_indexed(database: SqliteDatabase, action: Callable[[], Any]) -> None:
+    """Fail if a SELECT executed by action scans anything but its driving table."""
+    statements = capture_selects(database, action)
+    assert statements
+    for sql, params in statements:
+        plan = explain_query_plan(database, sql, params)
+        assert find_full_scans(plan) in ([], ["SCAN t1"]), f"Full table scan in {sql!r}: {plan}"
+
+
+class TestQueryPlans:
+    """EXPLAIN QUERY PLAN checks for hot queries."""
+
+    def test_ispravnost_table(self, migrated_db, sample, qtbot) -> None:
+        """Test failure list of an aircraft."""
+        from app.ui.widgets.tables import IspravnostTableModel
+
+        assert_indexed(migrated_db, lambda: IspravnostTableModel(sample["plane"]))
+        assert_indexed(migrated_db, lambda: IspravnostTableModel.fetch_rows(sample["plane"].id, after=(0, 0), limit=10))
+
+    def test_plane_status(self, migrated_db, sample) -> None:
+        """Test single aircraft status refresh."""
+        assert_indexed(migrated_db, lambda: query_plane_statuses([sample["plane"].id]))
+
+    def test_fleet_status(self, migrated_db, sample) -> None:
+        """Test grouped fleet status uses the covering index."""
+        assert_indexed(migrated_db, query_plane_statuses)
+
+    def test_failure_history(self, migrated_db, sample) -> None:
+        """Test point-in-time failures and event lists use the history indexes."""
+        from app.services.failure_history import failure_events, failures_as_of, take_snapshot
+
+        plane, moment = sample["plane"], datetime.datetime.now()
+        take_snapshot()
+        for plane_id in (plane.id, None):
+            statements = capture_selects(migrated_db, lambda: failures_as_of(moment, plane_id))
+            for sql, params in statements:
+                # Only the materialized CTEs are scanned, every table is searched
+                scans = find_full_scans(explain_query_plan(migrated_db, sql, params))
+                assert set(scans) <= {"SCAN snap", "SCAN later", "SCAN latest"}, f"Full table scan in {sql!r}"
+        assert_indexed(migrated_db, lambda: failure_events(plane_id=plane.id, start=moment))
+        assert_indexed(migrated_db, lambda: failure_events(agregate_id=sample["agregate"].id))
+
+    def test_osob_resolvers(self, migrated_db, sample) -> None:
+        """Test feature-aware catalog resolvers."""
+        plane = sample["plane"]
+        assert_indexed(migrated_db, lambda: get_available_systems_for_plane(plane, sample["group"]))
+        assert_indexed(migrated_db, lambda: get_available_agregates_for_plane(plane, sample["system"]))
+        assert_indexed(migrated_db, lambda: get_effective_agregates([plane], group=sample["group"]))
+        assert_indexed(migrated_db, lambda: get_planes_with_agregate(sample["agregate"]))
+        assert_indexed(migrated_db, lambda: get_effective_systems([plane]))
+
+    def test_settings_tables(self, migrated_db, sample, qtbot) -> None:
+        """Test settings table loads: joins by key, filters by index."""
+        from app.ui.widgets.tables import (
+            AgregateModel,
+            GroupModel,
+            OsobModel,
+            PlanesModel,
+            PlanesTypesModel,
+            PodrazdModel,
+            SystemModel,
+        )
+
+        for model_class in (
+            AgregateModel, GroupModel, OsobModel, PlanesModel, PlanesTypesModel, PodrazdModel, SystemModel
+        ):
+            assert_joins_indexed(migrated_db, model_class().fetch_rows)
+
+        plane_type = sample["plane"].plane_type
+        groups, systems, osobs = GroupModel(), SystemModel(), OsobModel()
+        assert_indexed(migrated_db, lambda: groups.fetch_rows(plane_type.name))
+        assert_indexed(migrated_db, lambda: systems.fetch_rows({"group": sample["group"]}))
+        assert_indexed(migrated_db, lambda: osobs.fetch_rows(plane_type))
+
+
+def trigger_sql(database: SqliteDatabase) -> dict[str, str]:
+    """Return name -> SQL of every trigger in database."""
+    cursor = database.execute_sql("SELECT name, sql FROM sqlite_master WHERE type = 'trigger'")
+    return dict(cursor.fetchall())
+
+
+def index_columns(database: SqliteDatabase) -> dict[str, tuple]:
+    """Return name -> (table, unique, columns) of every explicit index in database; columns carry their collation."""
+    cursor = database.execute_sql("SELECT name, tbl_name FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL")
+    indexes = {}
+    for name, table in cursor.fetchall():
+        unique = next(row[2] for row in database.execute_sql(f"PRAGMA index_list({table})") if row[1] == name)
+        columns = tuple(
+            (row[2], row[4]) for row in database.execute_sql(f"PRAGMA index_xinfo({name})") if row[5]
+        )
+        indexes[name] = (table, unique, columns)
+    return indexes
+
+
+class TestModelIndexes:
+    """Model index declarations must match the migrated schema."""
+
+    def test_models_match_migrations(self, migrated_db, tmp_path) -> None:
+        """Test create_tables builds the migrated indexes and adds none to a migrated database."""
+        migrated = index_columns(migrated_db)
+        fresh = IASDatabase(str(tmp_path / "fresh.db"))
+        with fresh.bind_ctx(MODELS):
+            fresh.create_tables(MODELS)
+        assert index_columns(fresh) == migrated
+        fresh.close()
+
+        migrated_db.create_tables(MODELS)
+        assert index_columns(migrated_db) == migrated
+
+
+class TestEffectiveMigrations:
+    """Frozen migration SQL must stay in sync with the live trigger definitions."""
+
+    def test_migrated_triggers_match_models(self, migrated_db, tmp_path) -> None:
+        """Test migrated schema has exactly the triggers the models create."""
+        from data.models import history, search
+        from data.models.effective import TRIGGERS, create_effective_triggers
+
+        fresh = IASDatabase(str(tmp_path / "fresh.db"))
+        with fresh.bind_ctx(MODELS):
+            fresh.create_tables(MODELS)
+            create_effective_triggers(fresh)
+            search.create_search_index(fresh)
+            history.create_history_triggers(fresh)
+        assert set(trigger_sql(migrated_db)) == set(TRIGGERS) | set(search.TRIGGERS) | set(history.TRIGGERS)
+        assert trigger_sql(migrated_db) == trigger_sql(fresh)
+        fresh.close()
+
+    def test_system_links_rollback(self, migrated_db) -> None:
+        """Test rolling back the system link migration restores the previous triggers."""
+        router = get_router(migrated_db)
+        while router.done[-1] != "004_effective_system_links":
+            router.rollback()
+        router.rollback()
+        previous = runpy.run_path(str(MIGRATIONS_DIR / "002_plane_effective_agregate.py"))
+        assert set(trigger_sql(migrated_db)) == set(previous["TRIGGERS"])
@@ -0,0 +1,122 @@
+"""Tests for the full-text search index and the search panel."""
+import pytest
+
+from app.services.search import match_expression, search
+from app.ui.widgets.search_panel import SearchPanel
+from data.models import AgregateBase, GroupBase, OtkazAgregateBase, PlaneBase, PodrazdBase, SystemBase, TypeBase
+from data.models.search import REBUILD_SQL, TABLE_NAME
+
+
+@pytest.fixture
+def fleet():
+    """Aircraft with a failed pump and a failed radio."""
+    plane_type = TypeBase.create(name="Ан-26")
+    podrazd = PodrazdBase.create(name="Отряд")
+    group = GroupBase.create(name="Планер", plane_type=plane_type)
+    fuel = SystemBase.create(name="Топливная система", group=group, plane_type=plane_type)
+    radio = SystemBase.create(name="Радиосвязь", group=group, plane_type=plane_type)
+    pump = AgregateBase.create(name="Насос подкачки", system=fuel)
+    station = AgregateBase.create(name="Радиостанция", system=radio)
+    plane = PlaneBase.create(plane_type=plane_type, podrazd=podrazd, bort_number="07", zav_num="Z1")
+    pump_failure = OtkazAgregateBase.create(plane=plane, agregate=pump, number="12345", description="течь")
+    radio_failure = OtkazAgregateBase.create(
+        plane=plane, agregate=station, number="777", description="замена после 12345 часов"
+    )
+    return plane, pump, fuel, pump_failure, radio_failure
+
+
+def found(text: str) -> list[tuple[int, int | None]]:
+    """Search and keep (plane id, failure id) of hits."""
+    return [(result.plane_id, result.otkaz_id) for result in search(text)]
+
+
+def index_rows(database) -> list[tuple]:
+    """Get index contents ordered by rowid."""
+    return database.execute_sql(
+        f"SELECT rowid, agregate, system, number, bort, description, plane_id FROM {TABLE_NAME} ORDER BY rowid"
+    ).fetchall()
+
+
+class TestMatchExpression:
+    """Tests for match_expression."""
+
+    def test_tokens_are_prefixes(self) -> None:
+        """Test every word becomes a quoted prefix query."""
+        assert match_expression('насос "12') == '"насос"* "12"*'
+
+    def test_too_short(self) -> None:
+        """Test a single character or punctuation gives no query."""
+        assert match_expression("н") is None
+        assert match_expression(' "* ') is None
+
+
+class TestSearch:
+    """Tests for search and the index triggers."""
+
+    def test_ranked_by_number_first(self, fleet) -> None:
+        """Test a unit number match ranks above a note mentioning it."""
+        plane, _pump, _fuel, pump_failure, radio_failure = fleet
+        assert found("12345") == [(plane.id, pump_failure.id), (plane.id, radio_failure.id)]
+
+    def test_cyrillic_case(self, fleet) -> None:
+        """Test Cyrillic matches case-insensitively, every word as a prefix."""
+        plane, _pump, _fuel, pump_failure, _radio = fleet
+        assert found("НАСОС") == [(plane.id, pump_failure.id)]
+        assert found("насос подк") == [(plane.id, pump_failure.id)]
+        assert found("ТЕЧЬ") == [(plane.id, pump_failure.id)]
+
+    def test_aircraft_hit(self, fleet) -> None:
+        """Test a bort number finds the aircraft and its failures."""
+        plane, *_ = fleet
+        results = search("07")
+        assert (plane.id, None) in [(result.plane_id, result.otkaz_id) for result in results]
+        assert results[0].plane == "Ан-26 №07"
+
+    def test_triggers_follow_changes(self, fleet, test_db) -> None:
+        """Test renames, bort changes and deletions reach the index."""
+        plane, pump, fuel, pump_failure, radio_failure = fleet
+        pump.name = "Подкачивающий агрегат"
+        pump.save()
+        assert found("насос") == []
+        assert found("подкачивающий") == [(plane.id, pump_failure.id)]
+
+        fuel.name = "Гидросистема"
+        fuel.save()
+        assert found("гидро") == [(plane.id, pump_failure.id)]
+
+        plane.bort_number = "42"
+        plane.save()
+        assert found("07") == []
+        assert (plane.id, None) in found("42")
+
+        radio_failure.delete_instance()
+        assert found("777") == []
+
+        rows = index_rows(test_db)
+        for statement in REBUILD_SQL:
+            test_db.execute_sql(statement)
+        assert index_rows(test_db) == rows
+
+        plane.delete_instance(recursive=True)
+        assert index_rows(test_db) == []
+
+
+class TestSearchPanel:
+    """Tests for SearchPanel."""
+
+    def test_type_and_activate(self, fleet, qtbot) -> None:
+        """Test typing lists results and Enter emits the best match."""
+        plane, _pump, _fuel, pump_failure, _radio = fleet
+        panel = SearchPanel()
+        qtbot.addWidget(panel)
+        panel.edit.setText("насос")
+        qtbot.waitUntil(lambda: panel.results.count() == 1)
+        assert panel.summary.text() == "Найдено: 1"
+
+        with qtbot.waitSignal(panel.plane_selected) as blocker:
+            panel.activate_first()
+        assert blocker.args == [plane.id, pump_failure.id]
+
+        panel.edit.clear()
+        qtbot.waitUntil(lambda: panel.results.count() == 0)
+        assert panel.summary.isHidden()
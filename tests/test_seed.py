@@ -0,0 +1,49 @@
+"""Tests for the generated profiling data set."""
+from dataclasses import replace
+
+import pytest
+
+from data.models import OtkazAgregateBase, PlaneBase, PlaneEffectiveAgregate, TypeBase
+from data.models import history, search
+from data.models.effective import REBUILD_SQL, TRIGGERS
+from data.seed import SeedConfig, generate, seed_database
+
+SMALL = SeedConfig(types=2, divisions=2, groups_per_type=2, systems_per_group=3, agregates_per_system=4, planes=10)
+
+
+def effective_rows() -> list[tuple]:
+    """Get the effective configuration table ordered."""
+    return list(PlaneEffectiveAgregate.select().order_by(
+        PlaneEffectiveAgregate.plane, PlaneEffectiveAgregate.agregate
+    ).tuples())
+
+
+class TestSeed:
+    """Tests for generate and seed_database."""
+
+    def test_deterministic(self) -> None:
+        """Test the same seed gives the same rows and another seed does not."""
+        assert generate(SMALL) == generate(SMALL)
+        other = generate(replace(SMALL, seed=2))
+        assert other[OtkazAgregateBase] != generate(SMALL)[OtkazAgregateBase]
+
+    def test_seed_database(self, test_db) -> None:
+        """Test counts, rebuilt effective configuration and restored triggers."""
+        counts = seed_database(SMALL, test_db)
+
+        assert counts["plane_base"] == PlaneBase.select().count() == 10
+        assert counts["otkaz_agregate_base"] == 10 * SMALL.failures_per_plane
+        assert counts["failure_event"] == counts["otkaz_agregate_base"]
+        seeded = effective_rows()
+        assert seeded and counts["plane_effective_agregate"] == len(seeded)
+        for statement in REBUILD_SQL:
+            test_db.execute_sql(statement)
+        assert effective_rows() == seeded
+        triggers = test_db.execute_sql("SELECT name FROM sqlite_master WHERE type = 'trigger'").fetchall()
+        assert {name for name, in triggers} == set(TRIGGERS) | set(search.TRIGGERS) | set(history.TRIGGERS)
+
+    def test_refuses_filled_database(self, test_db) -> None:
+        """Test seeding a database with data is refused."""
+        TypeBase.create(name="Existing")
+        with pytest.raises(ValueError):
+            seed_database(SMALL, test_db)
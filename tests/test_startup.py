@@ -0,0 +1,38 @@
+"""Tests for the application startup path."""
+import subprocess
+import sys
+
+from app import database
+from app.database import IASDatabase, latest_migration, run_migrations, schema_version, set_schema_version
+
+
+class TestSchemaVersion:
+    """Tests for skipping the migration router on a current schema."""
+
+    def test_router_skipped_when_current(self, tmp_path, monkeypatch):
+        """Test migrations record the version and a second start does not build the router."""
+        db = IASDatabase(str(tmp_path / "startup.db"))
+        assert run_migrations(db)
+        assert schema_version(db) == latest_migration() > 0
+
+        def no_router(*args, **kwargs):
+            raise AssertionError("router built for a current schema")
+
+        monkeypatch.setattr(database, "get_router", no_router)
+        assert not run_migrations(db)
+        monkeypatch.undo()
+
+        set_schema_version(0, db)
+        assert run_migrations(db)
+        db.close()
+
+
+def test_main_window_imports_no_dialogs():
+    """Test importing the main window leaves settings dialogs and migrations unloaded."""
+    code = (
+        "import sys, app.ui.windows.main_window; "
+        "print(sorted(name for name in sys.modules if name.startswith("
+        "('app.ui.dialogs.settings.', 'app.ui.dialogs.query_stats', 'peewee_migrate'))))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "[]"